@@ -2,6 +2,7 @@
 
 Usage:
     python -m app.adapters.inbound.cli DIRECTORY [--language LANG] [--engine ENGINE]
+        [--quality fast|balanced|accurate]
 """
 
 import argparse
@@ -11,6 +12,7 @@ import sys
 from app.application.dto import SubmitTranscriptionRequest
 from app.bootstrap import bootstrap
 from app.domain.value_objects.audio_format import AudioFormat
+from app.domain.value_objects.quality_tier import QualityTier
 
 
 def _find_audio_files(directory: str) -> list[str]:
@@ -37,6 +39,13 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Transcription engine (default: from TRANSCRIPTION_ENGINE env var)",
     )
+    parser.add_argument(
+        "--quality",
+        type=QualityTier,
+        choices=list(QualityTier),
+        default=None,
+        help="Model quality tier (default: the deployment's default model)",
+    )
     args = parser.parse_args(argv)
 
     if not os.path.isdir(args.directory):
@@ -71,6 +80,7 @@ def main(argv: list[str] | None = None) -> int:
                 filename=filename,
                 file_data=file_data,
                 language=args.language,
+                quality_tier=args.quality,
             )
             response = container.submit_transcription.execute(request)
 
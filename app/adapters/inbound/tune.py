@@ -0,0 +1,225 @@
+"""Measure faster-whisper compute settings on this host and save the fastest.
+
+Transcribes a reference clip with every combination of compute type, CPU
+threads, model workers and beam size, and writes the combination with the
+lowest real-time factor (processing time / audio time) to the profile
+that ``Settings`` loads. Thread counts are capped so that ``--processes``
+workers running side by side do not oversubscribe the cores.
+
+Usage:
+    python -m app.adapters.inbound.tune CLIP [--processes N]
+        [--compute-types int8,int8_float32] [--threads 4,8,16]
+        [--num-workers 1,2] [--beam-sizes 1,5] [--output PATH]
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.adapters.outbound.engines.faster_whisper_engine import (
+    WHISPER_SAMPLE_RATE,
+    FasterWhisperEngine,
+)
+from app.config import faster_whisper_profile_path, get_settings
+from app.ports.audio_chunk import AudioChunk
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Candidate:
+    compute_type: str
+    cpu_threads: int
+    num_workers: int
+    beam_size: int
+
+
+def default_thread_counts(cpu_count: int, processes: int = 1) -> list[int]:
+    """Powers of two up to each process's share of the cores, plus the share."""
+    budget = max(1, cpu_count // max(1, processes))
+    counts = [2**i for i in range(budget.bit_length()) if 2**i < budget]
+    return counts + [budget]
+
+
+def candidate_grid(
+    compute_types: list[str],
+    thread_counts: list[int],
+    num_workers: list[int],
+    beam_sizes: list[int],
+    thread_budget: int,
+) -> list[Candidate]:
+    """Every combination whose threads (across model workers) fit the budget."""
+    return [
+        Candidate(compute_type, threads, workers, beam)
+        for compute_type, threads, workers, beam in itertools.product(
+            compute_types, thread_counts, num_workers, beam_sizes
+        )
+        if threads * workers <= thread_budget
+    ]
+
+
+def tune(
+    candidates: list[Candidate], measure: Callable[[Candidate], float]
+) -> tuple[Candidate, float]:
+    """Return the candidate with the lowest real-time factor, and that factor.
+
+    Candidates the host cannot run (e.g. an unsupported compute type) are
+    skipped.
+    """
+    best: tuple[Candidate, float] | None = None
+    for candidate in candidates:
+        try:
+            rtf = measure(candidate)
+        except Exception as e:
+            logger.warning(f"Skipping {candidate}: {e}")
+            continue
+        logger.info(f"{candidate}: real-time factor {rtf:.3f}")
+        if best is None or rtf < best[1]:
+            best = (candidate, rtf)
+    if best is None:
+        raise RuntimeError("No candidate could be measured")
+    return best
+
+
+def write_profile(path: str, candidate: Candidate, rtf: float, **details) -> None:
+    profile = {
+        **asdict(candidate),
+        "real_time_factor": round(rtf, 4),
+        "tuned_at": datetime.now(timezone.utc).isoformat(),
+        **details,
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(profile, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _load_clip(path: str) -> AudioChunk:
+    from faster_whisper import decode_audio
+
+    audio = decode_audio(path, sampling_rate=WHISPER_SAMPLE_RATE)
+    samples = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    return AudioChunk(samples, WHISPER_SAMPLE_RATE)
+
+
+def _measurer(
+    model_size: str, device: str, clip: AudioChunk, language: str
+) -> Callable[[Candidate], float]:
+    audio_seconds = clip.frame_count / clip.sample_rate
+
+    def measure(candidate: Candidate) -> float:
+        engine = FasterWhisperEngine(
+            model_size=model_size,
+            device=device,
+            compute_type=candidate.compute_type,
+            cpu_threads=candidate.cpu_threads,
+            num_workers=candidate.num_workers,
+            beam_size=candidate.beam_size,
+        )
+        engine.warm_up()
+        engine.transcribe(clip, language)  # first decode allocates buffers
+
+        # Model workers only help concurrent requests, so keep each one busy
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=candidate.num_workers) as pool:
+            list(
+                pool.map(
+                    lambda _: engine.transcribe(clip, language),
+                    range(candidate.num_workers),
+                )
+            )
+        elapsed = time.perf_counter() - started
+        return elapsed / (audio_seconds * candidate.num_workers)
+
+    return measure
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",")]
+
+
+def _str_list(value: str) -> list[str]:
+    return value.split(",")
+
+
+def main(argv: list[str] | None = None) -> int:
+    settings = get_settings()
+    cpu_count = os.cpu_count() or 1
+
+    parser = argparse.ArgumentParser(
+        description="Tune faster-whisper compute settings for this host"
+    )
+    parser.add_argument("clip", help="Reference audio clip (30-120 s of speech)")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Transcription workers that will share this host (default: 1)",
+    )
+    parser.add_argument(
+        "--compute-types", type=_str_list, default=["int8", "int8_float32"]
+    )
+    parser.add_argument("--threads", type=_int_list, default=None)
+    parser.add_argument("--num-workers", type=_int_list, default=[1, 2])
+    parser.add_argument("--beam-sizes", type=_int_list, default=[5])
+    parser.add_argument("--model", default=settings.faster_whisper_model)
+    # The device is a host setting, not a tuning result: it only goes into
+    # the profile when asked for, so Settings keeps its "auto" default
+    parser.add_argument("--device", default=None)
+    parser.add_argument("--language", default=settings.default_language)
+    parser.add_argument("--output", default=faster_whisper_profile_path())
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    if not os.path.isfile(args.clip):
+        print(f"Error: {args.clip} is not a file", file=sys.stderr)
+        return 1
+
+    thread_budget = max(1, cpu_count // max(1, args.processes))
+    candidates = candidate_grid(
+        args.compute_types,
+        args.threads or default_thread_counts(cpu_count, args.processes),
+        args.num_workers,
+        args.beam_sizes,
+        thread_budget,
+    )
+    print(f"Measuring {len(candidates)} combinations on {cpu_count} cores")
+
+    clip = _load_clip(args.clip)
+    best, rtf = tune(
+        candidates,
+        _measurer(args.model, args.device or "cpu", clip, args.language),
+    )
+    details = {}
+    if args.device is not None:
+        details["device"] = args.device
+    write_profile(
+        args.output,
+        best,
+        rtf,
+        model=args.model,
+        cpu_count=cpu_count,
+        processes=args.processes,
+        **details,
+    )
+    print(f"Best: {best} at real-time factor {rtf:.3f}")
+    print(f"Profile written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""RQ worker that keeps the transcription model loaded between jobs.
+
+A plain ``rq worker`` forks a fresh work-horse for every job, so a local
+engine loads its model again for each one. This entry point bootstraps the
+container and warms the engine once, then runs jobs in the same process
+(``SimpleWorker``): every job reuses the container, and with it the model.
+
+Usage:
+    python -m app.adapters.inbound.warm_worker [--queue NAME ...] [--burst]
+"""
+
+import argparse
+import logging
+import time
+
+from redis import Redis
+from rq import Queue, SimpleWorker
+
+from app.bootstrap import bootstrap
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run an RQ worker with the transcription model preloaded"
+    )
+    parser.add_argument(
+        "--queue",
+        action="append",
+        dest="queues",
+        help="Queue to listen on; repeat for several (default: default)",
+    )
+    parser.add_argument(
+        "--burst",
+        action="store_true",
+        help="Exit once the queues are empty",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    container = bootstrap()
+    started = time.perf_counter()
+    container.engine.warm_up()
+    logger.info(
+        f"Engine {container.engine.engine_name} warmed up in "
+        f"{time.perf_counter() - started:.1f}s"
+    )
+
+    connection = Redis.from_url(container.settings.redis_url)
+    queues = [
+        Queue(name, connection=connection) for name in args.queues or ["default"]
+    ]
+    # SimpleWorker runs jobs in this process, where the model is loaded;
+    # process_job's bootstrap() returns the container warmed above.
+    worker = SimpleWorker(queues, connection=connection)
+    try:
+        worker.work(burst=args.burst)
+    finally:
+        # Close pooled API connections and their event loop thread
+        container.engine.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
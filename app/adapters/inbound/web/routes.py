@@ -17,6 +17,7 @@ from app.adapters.inbound.web.schemas import (
     TranscriptionResultResponse,
     UploadResponse,
 )
+from app.adapters.outbound.converter.envelope import envelope_path
 from app.application.dto import SubmitTranscriptionRequest
 from app.bootstrap import get_container
 from app.domain.exceptions import (
@@ -25,6 +26,7 @@ from app.domain.exceptions import (
     InvalidStateTransitionError,
     MaxRetriesExceededError,
 )
+from app.domain.value_objects.quality_tier import QualityTier
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +63,9 @@ async def job_page(request: Request, job_id: UUID):
 
 
 @router.post("/api/upload", status_code=201, response_model=UploadResponse)
-async def upload_file(file: UploadFile, language: str = "pt-BR"):
+async def upload_file(
+    file: UploadFile, language: str = "pt-BR", quality: QualityTier | None = None
+):
     container = get_container()
 
     file_data = await file.read()
@@ -71,6 +75,7 @@ async def upload_file(file: UploadFile, language: str = "pt-BR"):
             filename=file.filename or "unknown",
             file_data=file_data,
             language=language,
+            quality_tier=quality,
         )
         response = container.submit_transcription.execute(request)
     except InvalidAudioFormatError as e:
@@ -127,10 +132,11 @@ async def delete_all_jobs():
             except Exception:
                 pass
             if audio.converted_path:
-                try:
-                    container.storage.delete(audio.converted_path)
-                except Exception:
-                    pass
+                for path in (audio.converted_path, envelope_path(audio.converted_path)):
+                    try:
+                        container.storage.delete(path)
+                    except Exception:
+                        pass
 
     count = container.repository.delete_all_jobs()
     logger.info(f"Deleted {count} transcription jobs and associated files")
@@ -207,6 +213,7 @@ async def get_result(job_id: UUID):
         language=result.language,
         engine_name=result.engine_name,
         processing_duration_seconds=result.processing_duration_seconds,
+        engine_latency_seconds=result.engine_latency_seconds,
     )
 
 
@@ -238,6 +245,7 @@ async def job_progress_sse(job_id: UUID):
     async def event_stream():
         last_status = None
         last_progress = -1
+        last_sequence = 0
 
         while True:
             job = container.get_job_status.execute(job_id)
@@ -245,6 +253,21 @@ async def job_progress_sse(job_id: UUID):
                 yield f'event: error\ndata: {{"error": "Job not found"}}\n\n'
                 return
 
+            # Segments transcribed since the last poll, for the live preview
+            for segment in container.get_job_status.get_partial_segments(
+                job_id, last_sequence
+            ):
+                last_sequence = segment.sequence
+                data = json.dumps(
+                    {
+                        "attempt": segment.attempt,
+                        "start_ms": segment.start_ms,
+                        "end_ms": segment.end_ms,
+                        "text": segment.text,
+                    }
+                )
+                yield f"event: partial\ndata: {data}\n\n"
+
             if job.status != last_status or job.progress_percent != last_progress:
                 last_status = job.status
                 last_progress = job.progress_percent
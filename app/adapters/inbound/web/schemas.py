@@ -35,6 +35,7 @@ class TranscriptionResultResponse(BaseModel):
     language: str
     engine_name: str
     processing_duration_seconds: float
+    engine_latency_seconds: float | None = None
 
 
 class ProgressEvent(BaseModel):
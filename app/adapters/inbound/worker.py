@@ -17,9 +17,35 @@ def process_job(job_id_str: str) -> None:
 
     container = bootstrap()
     container.process_transcription.execute(job_id)
+    _requeue_if_retrying(container, job_id)
 
+
+def process_chunk(job_id_str: str, chunk_index: int) -> None:
+    """Transcribe one chunk of a distributed job. Called by the RQ worker."""
+    from app.bootstrap import bootstrap
+
+    job_id = UUID(job_id_str)
+    logger.info(f"Worker picking up chunk {chunk_index} of job {job_id}")
+
+    container = bootstrap()
+    container.process_transcription.transcribe_chunk(job_id, chunk_index)
+
+
+def reduce_job(job_id_str: str) -> None:
+    """Stitch the chunks of a distributed job. Called by the RQ worker."""
+    from app.bootstrap import bootstrap
+
+    job_id = UUID(job_id_str)
+    logger.info(f"Worker reducing job {job_id}")
+
+    container = bootstrap()
+    container.process_transcription.reduce(job_id)
+    _requeue_if_retrying(container, job_id)
+
+
+def _requeue_if_retrying(container, job_id: UUID) -> None:
     # Check if the job needs a retry (was reset to PENDING after failure)
-    job = container.process_transcription._repository.get_job(job_id)
+    job = container.repository.get_job(job_id)
     if job and job.status == JobStatus.PENDING and job.retry_count > 0:
         logger.info(f"Job {job_id}: Re-enqueuing for retry {job.retry_count}/3")
         container.queue.enqueue(job_id)
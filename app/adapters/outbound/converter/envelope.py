@@ -0,0 +1,145 @@
+"""Frame-level loudness envelope stored beside converted audio.
+
+The envelope holds one float16 RMS value (normalized to full scale) per
+10 ms frame. It is ~0.06% the size of the 16 kHz PCM it describes, so
+silence detection and chunk planning can scan it in O(frames) instead of
+re-reading every sample.
+"""
+
+import math
+import os
+
+import numpy as np
+
+from app.adapters.outbound.converter.silence import (
+    DEFAULT_MIN_SILENCE_MS,
+    DEFAULT_SILENCE_THRESH_DB,
+    invert_ranges,
+    merge_silent_windows,
+)
+
+FRAME_MS = 10
+PCM16_FULL_SCALE = 32768.0
+_ROWS_PER_PASS = 8192  # frames reduced per vectorized pass
+
+
+def envelope_path(wav_path: str) -> str:
+    """Path of the envelope file stored beside a WAV file."""
+    return os.path.splitext(wav_path)[0] + ".envelope.npy"
+
+
+def samples_per_frame(frame_rate: int, frame_ms: int = FRAME_MS) -> int:
+    return max(1, round(frame_rate * frame_ms / 1000))
+
+
+def _frame_rms(samples: np.ndarray, frame_len: int) -> np.ndarray:
+    """RMS of consecutive frames of frame_len interleaved int16 samples."""
+    frames = samples.reshape(-1, frame_len)
+    rms = np.empty(len(frames), dtype=np.float16)
+    for start in range(0, len(frames), _ROWS_PER_PASS):
+        block = frames[start:start + _ROWS_PER_PASS].astype(np.float64)
+        rms[start:start + _ROWS_PER_PASS] = (
+            np.sqrt(np.einsum("ij,ij->i", block, block) / frame_len) / PCM16_FULL_SCALE
+        )
+    return rms
+
+
+class EnvelopeBuilder:
+    """Builds an envelope incrementally from 16-bit PCM byte blocks.
+
+    Blocks may split frames (or even samples) anywhere; the remainder is
+    carried over to the next call.
+    """
+
+    def __init__(
+        self, frame_rate: int, channels: int = 1, frame_ms: int = FRAME_MS
+    ) -> None:
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self._frame_len = samples_per_frame(frame_rate, frame_ms) * channels
+        self._frame_bytes = self._frame_len * 2
+        self._pending = b""
+        self._parts: list[np.ndarray] = []
+
+    def add(self, block: bytes) -> None:
+        data = self._pending + block if self._pending else block
+        usable = len(data) - len(data) % self._frame_bytes
+        if usable:
+            samples = np.frombuffer(data, dtype="<i2", count=usable // 2)
+            self._parts.append(_frame_rms(samples, self._frame_len))
+        self._pending = bytes(data[usable:])
+
+    def finish(self) -> np.ndarray:
+        """Return the envelope, including a trailing partial frame."""
+        pending = self._pending[: len(self._pending) - len(self._pending) % 2]
+        if pending:
+            samples = np.frombuffer(pending, dtype="<i2")
+            self._parts.append(_frame_rms(samples, len(samples)))
+            self._pending = b""
+        if not self._parts:
+            return np.zeros(0, dtype=np.float16)
+        return np.concatenate(self._parts)
+
+
+def compute_envelope(
+    samples: np.ndarray, frame_rate: int, channels: int = 1, frame_ms: int = FRAME_MS
+) -> np.ndarray:
+    """Compute the envelope of interleaved int16 samples in one pass."""
+    frame_len = samples_per_frame(frame_rate, frame_ms) * channels
+    full = len(samples) - len(samples) % frame_len
+    parts = [_frame_rms(samples[:full], frame_len)]
+    if full < len(samples):
+        tail = samples[full:]
+        parts.append(_frame_rms(tail, len(tail)))
+    return np.concatenate(parts)
+
+
+def expected_frames(
+    sample_count: int, frame_rate: int, channels: int = 1, frame_ms: int = FRAME_MS
+) -> int:
+    frame_len = samples_per_frame(frame_rate, frame_ms) * channels
+    return math.ceil(sample_count / frame_len)
+
+
+def save_envelope(path: str, envelope: np.ndarray) -> None:
+    # np.save appends ".npy" to names without it, so write via a file object
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, envelope.astype(np.float16, copy=False))
+    os.replace(tmp_path, path)
+
+
+def load_envelope(path: str) -> np.ndarray:
+    return np.load(path, mmap_mode="r")
+
+
+def detect_nonsilent_from_envelope(
+    envelope: np.ndarray,
+    duration_ms: int,
+    min_silence_ms: int = DEFAULT_MIN_SILENCE_MS,
+    silence_thresh_db: float = DEFAULT_SILENCE_THRESH_DB,
+    frame_ms: int = FRAME_MS,
+) -> list[tuple[int, int]]:
+    """Return non-silent (start_ms, end_ms) ranges from an envelope.
+
+    Mirrors ``silence.detect_nonsilent`` at frame resolution: a window of
+    ``min_silence_ms`` is silent when its RMS, recombined from the frame
+    RMS values, is at or below the threshold.
+    """
+    window = max(1, math.ceil(min_silence_ms / frame_ms))
+    if len(envelope) < window:
+        return invert_ranges([], duration_ms)
+
+    threshold = 10 ** (silence_thresh_db / 20)
+    energy = np.square(envelope, dtype=np.float64)
+    cumulative = np.concatenate(([0.0], np.cumsum(energy)))
+    window_rms = np.sqrt((cumulative[window:] - cumulative[:-window]) / window)
+
+    silence_starts = np.flatnonzero(window_rms <= threshold) * frame_ms
+    silent_ranges = [
+        (start, min(end, duration_ms))
+        for start, end in merge_silent_windows(
+            silence_starts, frame_ms, window * frame_ms
+        )
+    ]
+    return invert_ranges(silent_ranges, duration_ms)
@@ -0,0 +1,132 @@
+"""Streaming ffmpeg converter that keeps peak memory flat for any input length."""
+
+import logging
+import os
+import subprocess
+import tempfile
+import wave
+
+from app.adapters.outbound.converter.envelope import EnvelopeBuilder, envelope_path
+from app.adapters.outbound.converter.pydub_converter import PydubAudioConverter
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_WIDTH_BYTES = 2  # 16-bit PCM
+DEFAULT_BLOCK_FRAMES = 32_768  # ~2 s of 16 kHz audio per read
+
+
+class FFmpegStreamingConverter(PydubAudioConverter):
+    """Pipes ffmpeg's resample/downmix output straight into the target WAV.
+
+    Unlike PydubAudioConverter.convert_to_wav, the input is never held in
+    memory: PCM is read from ffmpeg's stdout in fixed-size blocks and
+    appended to the output file, so peak RSS does not grow with duration.
+    The loudness envelope is accumulated from the same blocks.
+    """
+
+    def __init__(
+        self,
+        ffmpeg_path: str = "ffmpeg",
+        block_frames: int = DEFAULT_BLOCK_FRAMES,
+    ) -> None:
+        self._ffmpeg_path = ffmpeg_path
+        self._block_frames = block_frames
+
+    def _build_command(
+        self, input_path: str, sample_rate: int, channels: int
+    ) -> list[str]:
+        return [
+            self._ffmpeg_path,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", input_path,
+            "-vn",
+            "-ac", str(channels),
+            "-ar", str(sample_rate),
+            "-acodec", "pcm_s16le",
+            "-f", "s16le",
+            "pipe:1",
+        ]
+
+    def convert_to_wav(
+        self,
+        input_path: str,
+        output_path: str,
+        sample_rate: int = 16000,
+        channels: int = 1,
+    ) -> bool:
+        """Convert audio file to WAV format. Returns success status."""
+        block_size = self._block_frames * channels * SAMPLE_WIDTH_BYTES
+        # stderr goes to a spool file so a chatty decoder cannot fill the
+        # pipe buffer and stall while we are draining stdout.
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                process = subprocess.Popen(
+                    self._build_command(input_path, sample_rate, channels),
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                )
+            except OSError as e:
+                logger.error("Failed to start ffmpeg for %s: %s", input_path, e)
+                return False
+
+            envelope = EnvelopeBuilder(sample_rate, channels)
+            return_code = self._stream_to_wav(
+                process, input_path, output_path, envelope, block_size
+            )
+            if return_code is None:
+                return False
+            if return_code != 0:
+                stderr_file.seek(0)
+                logger.error(
+                    "Failed to convert %s to WAV: ffmpeg exited with %d: %s",
+                    input_path,
+                    return_code,
+                    stderr_file.read().decode(errors="replace").strip(),
+                )
+                self._discard(output_path)
+                return False
+        self._save_envelope(output_path, envelope.finish())
+        return True
+
+    def _stream_to_wav(
+        self,
+        process: subprocess.Popen,
+        input_path: str,
+        output_path: str,
+        envelope: EnvelopeBuilder,
+        block_size: int,
+    ) -> int | None:
+        """Copy ffmpeg's PCM output to a WAV file block by block.
+
+        Returns ffmpeg's exit code, or None if writing the output failed.
+        """
+        try:
+            with wave.open(output_path, "wb") as wav:
+                wav.setnchannels(envelope.channels)
+                wav.setsampwidth(SAMPLE_WIDTH_BYTES)
+                wav.setframerate(envelope.frame_rate)
+                while True:
+                    block = process.stdout.read(block_size)
+                    if not block:
+                        break
+                    wav.writeframesraw(block)
+                    envelope.add(block)
+            return process.wait()
+        except Exception as e:
+            process.kill()
+            process.wait()
+            logger.error("Failed to convert %s to WAV: %s", input_path, e)
+            self._discard(output_path)
+            return None
+        finally:
+            process.stdout.close()
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        for stale in (path, envelope_path(path)):
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,125 @@
+"""Audio session backed by a memory map of a 16-bit PCM WAV file."""
+
+import logging
+
+import numpy as np
+
+from app.adapters.outbound.converter.envelope import (
+    compute_envelope,
+    detect_nonsilent_from_envelope,
+    envelope_path,
+    expected_frames,
+    load_envelope,
+    save_envelope,
+)
+from app.adapters.outbound.converter.wav_header import read_wav_header
+from app.ports.audio_chunk import AudioChunk
+from app.ports.audio_converter import AudioSession
+
+logger = logging.getLogger(__name__)
+
+
+class WavMemmapSession(AudioSession):
+    """Maps the sample data of a PCM16 WAV read-only into memory.
+
+    Nothing is decoded: the OS pages samples in on access, and chunk views
+    are slices of the same map, so cutting a job into chunks costs no copies
+    and no temporary files. Silence detection reads the loudness envelope
+    stored beside the WAV, building and saving it first if it is missing.
+    """
+
+    def __init__(self, audio_path: str) -> None:
+        header = read_wav_header(audio_path)
+        if not header.is_pcm or header.bits_per_sample != 16:
+            raise ValueError(f"{audio_path} is not 16-bit PCM WAV")
+        self._audio_path = audio_path
+        self._header = header
+        self._envelope: np.ndarray | None = None
+        self._samples: np.ndarray | None
+        if header.frame_count:
+            self._samples = np.memmap(
+                audio_path,
+                dtype="<i2",
+                mode="r",
+                offset=header.data_offset,
+                shape=(header.frame_count * header.channels,),
+            )
+        else:
+            # mmap cannot map an empty range
+            self._samples = np.zeros(0, dtype=np.int16)
+
+    @property
+    def samples(self) -> np.ndarray:
+        if self._samples is None:
+            raise RuntimeError("Audio session is closed")
+        return self._samples
+
+    @property
+    def envelope(self) -> np.ndarray:
+        """Per-10 ms RMS envelope of the audio, loaded or built on first use."""
+        if self._envelope is None:
+            self._envelope = self._load_or_build_envelope()
+        return self._envelope
+
+    @property
+    def duration_seconds(self) -> float:
+        return self._header.duration_seconds
+
+    def detect_silence_boundaries(
+        self, min_silence_ms: int = 500, silence_thresh_db: float = -40.0
+    ) -> list[tuple[int, int]]:
+        """Detect non-silent segments. Returns list of (start_ms, end_ms) tuples."""
+        return detect_nonsilent_from_envelope(
+            self.envelope,
+            round(1000 * self._header.frame_count / self._header.sample_rate),
+            min_silence_ms=min_silence_ms,
+            silence_thresh_db=silence_thresh_db,
+        )
+
+    def _load_or_build_envelope(self) -> np.ndarray:
+        header = self._header
+        path = envelope_path(self._audio_path)
+        frames = expected_frames(len(self.samples), header.sample_rate, header.channels)
+        try:
+            envelope = load_envelope(path)
+            if len(envelope) == frames:
+                return envelope
+        except (OSError, ValueError):
+            pass
+
+        envelope = compute_envelope(self.samples, header.sample_rate, header.channels)
+        try:
+            save_envelope(path, envelope)
+        except OSError as e:
+            logger.warning("Could not save envelope for %s: %s", self._audio_path, e)
+        return envelope
+
+    def chunk_views(self, boundaries: list[tuple[int, int]]) -> list[AudioChunk]:
+        """Return zero-copy chunk views for the given (start_ms, end_ms) ranges."""
+        samples = self.samples
+        channels = self._header.channels
+        frames_per_ms = self._header.sample_rate / 1000.0
+        chunks = []
+        for index, (start_ms, end_ms) in enumerate(boundaries):
+            start = int(start_ms * frames_per_ms) * channels
+            end = int(end_ms * frames_per_ms) * channels
+            chunks.append(
+                AudioChunk(
+                    samples[start:end],
+                    self._header.sample_rate,
+                    channels=channels,
+                    start_ms=start_ms,
+                    index=index,
+                )
+            )
+        return chunks
+
+    def full_view(self) -> AudioChunk:
+        """Return the whole mapped audio as one chunk view."""
+        return AudioChunk(
+            self.samples, self._header.sample_rate, channels=self._header.channels
+        )
+
+    def close(self) -> None:
+        self._samples = None
+        self._envelope = None
@@ -0,0 +1,102 @@
+"""Read audio stream properties from headers without decoding samples.
+
+WAV files are parsed directly from the RIFF header; every other container
+is handed to ffprobe, which reads duration, sample rate and channel count
+from container metadata in milliseconds.
+"""
+
+import json
+import subprocess
+
+from app.adapters.outbound.converter.wav_header import (
+    WAVE_FORMAT_IEEE_FLOAT,
+    WAVE_FORMAT_PCM,
+    WavHeader,
+    read_wav_header,
+)
+from app.domain.exceptions import AudioProbeError
+from app.domain.value_objects.audio_metadata import AudioMetadata
+
+FFPROBE_TIMEOUT_SECONDS = 30
+
+
+def _is_riff_wave(path: str) -> bool:
+    with open(path, "rb") as f:
+        magic = f.read(12)
+    return magic[:4] == b"RIFF" and magic[8:12] == b"WAVE"
+
+
+def _wav_codec(header: WavHeader) -> str:
+    if header.format_tag == WAVE_FORMAT_PCM:
+        return f"pcm_s{header.bits_per_sample}le"
+    if header.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        return f"pcm_f{header.bits_per_sample}le"
+    return f"wav_0x{header.format_tag:04x}"
+
+
+def _probe_wav(path: str) -> AudioMetadata:
+    try:
+        header = read_wav_header(path)
+    except ValueError as exc:
+        raise AudioProbeError(str(exc)) from exc
+    return AudioMetadata(
+        duration_seconds=header.duration_seconds,
+        sample_rate=header.sample_rate,
+        channels=header.channels,
+        codec=_wav_codec(header),
+        bits_per_sample=header.bits_per_sample,
+    )
+
+
+def _probe_ffprobe(path: str, ffprobe_path: str) -> AudioMetadata:
+    command = [
+        ffprobe_path,
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries",
+        "stream=codec_name,sample_rate,channels,duration,bits_per_sample"
+        ":format=duration",
+        "-of", "json",
+        path,
+    ]
+    try:
+        completed = subprocess.run(
+            command,
+            capture_output=True,
+            check=True,
+            timeout=FFPROBE_TIMEOUT_SECONDS,
+        )
+        info = json.loads(completed.stdout)
+    except subprocess.CalledProcessError as exc:
+        message = exc.stderr.decode(errors="replace").strip()
+        raise AudioProbeError(f"ffprobe could not read {path}: {message}") from exc
+    except (subprocess.TimeoutExpired, json.JSONDecodeError) as exc:
+        raise AudioProbeError(f"ffprobe could not read {path}: {exc}") from exc
+
+    streams = info.get("streams") or []
+    if not streams:
+        raise AudioProbeError(f"No audio stream found in {path}")
+    stream = streams[0]
+
+    duration = stream.get("duration") or info.get("format", {}).get("duration")
+    try:
+        return AudioMetadata(
+            duration_seconds=float(duration),
+            sample_rate=int(stream["sample_rate"]),
+            channels=int(stream["channels"]),
+            codec=stream.get("codec_name", ""),
+            bits_per_sample=int(stream.get("bits_per_sample") or 0) or None,
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        raise AudioProbeError(f"Incomplete stream metadata for {path}") from exc
+
+
+def probe_audio(path: str, ffprobe_path: str = "ffprobe") -> AudioMetadata:
+    """Return duration, sample rate and channel count of an audio file.
+
+    Raises AudioProbeError if the file is not readable audio. A missing
+    ffprobe binary surfaces as FileNotFoundError.
+    """
+    if _is_riff_wave(path):
+        return _probe_wav(path)
+    return _probe_ffprobe(path, ffprobe_path)
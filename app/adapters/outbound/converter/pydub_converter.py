@@ -1,15 +1,89 @@
 import logging
-import os
 import tempfile
+import wave
 
 from pydub import AudioSegment
-from pydub.silence import detect_nonsilent
 
-from app.ports.audio_converter import AudioConverterPort
+from app.adapters.outbound.converter.envelope import (
+    compute_envelope,
+    envelope_path,
+    save_envelope,
+)
+from app.adapters.outbound.converter.memmap_session import WavMemmapSession
+from app.adapters.outbound.converter.probe import probe_audio
+from app.adapters.outbound.converter.silence import detect_nonsilent, pcm_to_array
+from app.adapters.outbound.converter.wav_header import read_wav_header
+from app.domain.value_objects.audio_metadata import AudioMetadata
+from app.ports.audio_chunk import AudioChunk
+from app.ports.audio_converter import AudioConverterPort, AudioSession
 
 logger = logging.getLogger(__name__)
 
 
+class PydubAudioSession(AudioSession):
+    """Holds a single decoded AudioSegment shared by all job operations."""
+
+    def __init__(self, audio: AudioSegment) -> None:
+        if audio.sample_width != 2:
+            audio = audio.set_sample_width(2)
+        self._audio: AudioSegment | None = audio
+
+    @property
+    def audio(self) -> AudioSegment:
+        if self._audio is None:
+            raise RuntimeError("Audio session is closed")
+        return self._audio
+
+    @property
+    def duration_seconds(self) -> float:
+        return len(self.audio) / 1000.0
+
+    def detect_silence_boundaries(
+        self, min_silence_ms: int = 500, silence_thresh_db: float = -40.0
+    ) -> list[tuple[int, int]]:
+        """Detect non-silent segments. Returns list of (start_ms, end_ms) tuples."""
+        audio = self.audio
+        return detect_nonsilent(
+            pcm_to_array(audio.raw_data, audio.sample_width),
+            audio.frame_rate,
+            channels=audio.channels,
+            min_silence_ms=min_silence_ms,
+            silence_thresh_db=silence_thresh_db,
+        )
+
+    def chunk_views(self, boundaries: list[tuple[int, int]]) -> list[AudioChunk]:
+        """Return zero-copy views of the decoded buffer for each range."""
+        audio = self.audio
+        samples = pcm_to_array(audio.raw_data, audio.sample_width)
+        frames_per_ms = audio.frame_rate / 1000.0
+        chunks = []
+        for index, (start_ms, end_ms) in enumerate(boundaries):
+            start = int(start_ms * frames_per_ms) * audio.channels
+            end = int(end_ms * frames_per_ms) * audio.channels
+            chunks.append(
+                AudioChunk(
+                    samples[start:end],
+                    audio.frame_rate,
+                    channels=audio.channels,
+                    start_ms=start_ms,
+                    index=index,
+                )
+            )
+        return chunks
+
+    def full_view(self) -> AudioChunk:
+        """Return the whole decoded buffer as one chunk view."""
+        audio = self.audio
+        return AudioChunk(
+            pcm_to_array(audio.raw_data, audio.sample_width),
+            audio.frame_rate,
+            channels=audio.channels,
+        )
+
+    def close(self) -> None:
+        self._audio = None
+
+
 class PydubAudioConverter(AudioConverterPort):
     def convert_to_wav(
         self,
@@ -18,44 +92,97 @@ class PydubAudioConverter(AudioConverterPort):
         sample_rate: int = 16000,
         channels: int = 1,
     ) -> bool:
-        """Convert audio file to WAV format. Returns success status."""
+        """Convert audio file to WAV format. Returns success status.
+
+        Also writes the loudness envelope of the result beside it.
+        """
         try:
             audio = AudioSegment.from_file(input_path)
             audio = audio.set_frame_rate(sample_rate)
             audio = audio.set_channels(channels)
+            audio = audio.set_sample_width(2)
             audio.export(output_path, format="wav")
-            return True
         except Exception as e:
             logger.error("Failed to convert %s to WAV: %s", input_path, e)
             return False
 
+        envelope = compute_envelope(
+            pcm_to_array(audio.raw_data, 2), sample_rate, channels
+        )
+        self._save_envelope(output_path, envelope)
+        return True
+
+    @staticmethod
+    def _save_envelope(wav_path: str, envelope) -> None:
+        try:
+            save_envelope(envelope_path(wav_path), envelope)
+        except OSError as e:
+            # Sessions rebuild a missing envelope on demand
+            logger.warning("Could not save envelope for %s: %s", wav_path, e)
+
+    def is_normalized(
+        self, audio_path: str, sample_rate: int = 16000, channels: int = 1
+    ) -> bool:
+        """True if the file is already 16-bit PCM WAV at the target rate and channels."""
+        try:
+            header = read_wav_header(audio_path)
+        except (OSError, ValueError):
+            return False
+        return (
+            header.is_pcm
+            and header.bits_per_sample == 16
+            and header.sample_rate == sample_rate
+            and header.channels == channels
+        )
+
+    def open_session(self, audio_path: str) -> AudioSession:
+        """Open audio once and return a session reusing the same buffer.
+
+        16-bit PCM WAV (every converted file) is memory-mapped rather than
+        decoded; anything else is decoded with pydub.
+        """
+        metadata = None
+        try:
+            metadata = probe_audio(audio_path)
+        except Exception as e:
+            logger.debug("Probe failed for %s, decoding instead: %s", audio_path, e)
+        if metadata is not None and metadata.codec == "pcm_s16le":
+            return WavMemmapSession(audio_path)
+        return PydubAudioSession(AudioSegment.from_file(audio_path))
+
+    def probe(self, audio_path: str) -> AudioMetadata:
+        """Read duration, sample rate and channels from headers, without decoding."""
+        return probe_audio(audio_path)
+
     def get_duration_seconds(self, audio_path: str) -> float:
         """Get audio file duration in seconds."""
-        return len(AudioSegment.from_file(audio_path)) / 1000.0
+        return self.probe(audio_path).duration_seconds
 
     def detect_silence_boundaries(
-        self, audio_path: str, min_silence_ms: int = 500
+        self,
+        audio_path: str,
+        min_silence_ms: int = 500,
+        silence_thresh_db: float = -40.0,
     ) -> list[tuple[int, int]]:
         """Detect non-silent segments. Returns list of (start_ms, end_ms) tuples."""
-        audio = AudioSegment.from_file(audio_path)
-        return detect_nonsilent(
-            audio,
-            min_silence_len=min_silence_ms,
-            silence_thresh=-40,
-        )
+        with self.open_session(audio_path) as session:
+            return session.detect_silence_boundaries(min_silence_ms, silence_thresh_db)
 
     def split_at_boundaries(
         self, audio_path: str, boundaries: list[tuple[int, int]]
     ) -> list[str]:
         """Split audio at given boundaries. Returns list of chunk file paths."""
-        audio = AudioSegment.from_file(audio_path)
         chunk_paths = []
-        for start_ms, end_ms in boundaries:
-            chunk = audio[start_ms:end_ms]
-            tmp = tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False
-            )
-            tmp.close()
-            chunk.export(tmp.name, format="wav")
-            chunk_paths.append(tmp.name)
+        with self.open_session(audio_path) as session:
+            for chunk in session.chunk_views(boundaries):
+                tmp = tempfile.NamedTemporaryFile(
+                    suffix=".wav", delete=False
+                )
+                tmp.close()
+                with wave.open(tmp.name, "wb") as wav:
+                    wav.setnchannels(chunk.channels)
+                    wav.setsampwidth(2)
+                    wav.setframerate(chunk.sample_rate)
+                    wav.writeframes(chunk.samples.tobytes())
+                chunk_paths.append(tmp.name)
         return chunk_paths
@@ -0,0 +1,138 @@
+"""Vectorized silence detection over raw PCM samples.
+
+Drop-in replacement for ``pydub.silence.detect_nonsilent``: the per-window
+RMS for every seek position is computed in one NumPy pass from a cumulative
+sum of squared samples instead of slicing the AudioSegment once per
+millisecond. Results match pydub's (same windows, same integer RMS, same
+range merging) while running orders of magnitude faster on long audio.
+"""
+
+import numpy as np
+
+DEFAULT_SILENCE_THRESH_DB = -40.0
+DEFAULT_MIN_SILENCE_MS = 500
+
+_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+def pcm_to_array(raw_data: bytes, sample_width: int) -> np.ndarray:
+    """View interleaved little-endian PCM bytes as a signed integer array."""
+    try:
+        dtype = _DTYPES[sample_width]
+    except KeyError:
+        raise ValueError(f"Unsupported sample width: {sample_width} bytes")
+    return np.frombuffer(raw_data, dtype=dtype)
+
+
+def detect_silence(
+    samples: np.ndarray,
+    frame_rate: int,
+    channels: int = 1,
+    min_silence_ms: int = DEFAULT_MIN_SILENCE_MS,
+    silence_thresh_db: float = DEFAULT_SILENCE_THRESH_DB,
+    seek_step_ms: int = 1,
+) -> list[tuple[int, int]]:
+    """Return silent (start_ms, end_ms) ranges of interleaved PCM samples."""
+    frame_count = len(samples) // channels
+    seg_len = round(1000 * (frame_count / frame_rate))
+    if seg_len < min_silence_ms:
+        return []
+
+    max_amplitude = float(2 ** (samples.itemsize * 8) / 2)
+    threshold = (10 ** (silence_thresh_db / 20)) * max_amplitude
+
+    last_slice_start = seg_len - min_silence_ms
+    slice_starts = np.arange(0, last_slice_start + 1, seek_step_ms, dtype=np.int64)
+    if last_slice_start % seek_step_ms:
+        slice_starts = np.append(slice_starts, last_slice_start)
+
+    # Same ms -> frame arithmetic as AudioSegment.__getitem__
+    frames_per_ms = frame_rate / 1000.0
+    slice_ends = np.minimum(slice_starts + min_silence_ms, seg_len)
+    start_frames = (slice_starts * frames_per_ms).astype(np.int64)
+    end_frames = (slice_ends * frames_per_ms).astype(np.int64)
+
+    # One int64 buffer: widen, square and accumulate in place
+    cumulative = np.zeros(len(samples) + 1, dtype=np.int64)
+    np.square(samples, out=cumulative[1:], dtype=np.int64)
+    np.cumsum(cumulative, out=cumulative)
+    available_ends = np.minimum(end_frames, frame_count)
+    sums = cumulative[available_ends * channels] - cumulative[start_frames * channels]
+
+    # pydub pads short trailing slices with silence, so the divisor is the
+    # requested length rather than the number of samples actually present.
+    counts = (end_frames - start_frames) * channels
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rms = np.floor(np.sqrt(sums / counts))
+    rms[counts == 0] = 0
+
+    return merge_silent_windows(
+        slice_starts[rms <= threshold], seek_step_ms, min_silence_ms
+    )
+
+
+def merge_silent_windows(
+    silence_starts: np.ndarray, seek_step_ms: int, window_ms: int
+) -> list[tuple[int, int]]:
+    """Merge the start times (ms) of silent windows into silent ranges."""
+    if silence_starts.size == 0:
+        return []
+
+    previous = silence_starts[:-1]
+    current = silence_starts[1:]
+    continuous = current == previous + seek_step_ms
+    has_gap = current > previous + window_ms
+    breaks = np.flatnonzero(~continuous & has_gap) + 1
+
+    range_starts = silence_starts[np.concatenate(([0], breaks))]
+    range_ends = silence_starts[np.concatenate((breaks - 1, [silence_starts.size - 1]))]
+    return [
+        (int(start), int(end) + window_ms)
+        for start, end in zip(range_starts, range_ends)
+    ]
+
+
+def invert_ranges(
+    silent_ranges: list[tuple[int, int]], seg_len: int
+) -> list[tuple[int, int]]:
+    """Turn silent ranges into the non-silent ranges between them."""
+    if not silent_ranges:
+        return [(0, seg_len)]
+
+    if silent_ranges[0] == (0, seg_len):
+        return []
+
+    nonsilent_ranges = []
+    prev_end = 0
+    for start, end in silent_ranges:
+        nonsilent_ranges.append((prev_end, start))
+        prev_end = end
+
+    if prev_end != seg_len:
+        nonsilent_ranges.append((prev_end, seg_len))
+
+    if nonsilent_ranges[0] == (0, 0):
+        nonsilent_ranges.pop(0)
+
+    return nonsilent_ranges
+
+
+def detect_nonsilent(
+    samples: np.ndarray,
+    frame_rate: int,
+    channels: int = 1,
+    min_silence_ms: int = DEFAULT_MIN_SILENCE_MS,
+    silence_thresh_db: float = DEFAULT_SILENCE_THRESH_DB,
+    seek_step_ms: int = 1,
+) -> list[tuple[int, int]]:
+    """Return non-silent (start_ms, end_ms) ranges of interleaved PCM samples."""
+    silent_ranges = detect_silence(
+        samples,
+        frame_rate,
+        channels=channels,
+        min_silence_ms=min_silence_ms,
+        silence_thresh_db=silence_thresh_db,
+        seek_step_ms=seek_step_ms,
+    )
+    seg_len = round(1000 * ((len(samples) // channels) / frame_rate))
+    return invert_ranges(silent_ranges, seg_len)
@@ -0,0 +1,87 @@
+"""Minimal RIFF/WAVE header reader.
+
+Walks the chunk list to find ``fmt `` and ``data`` so callers can get the
+stream layout and the byte offset of the samples without reading them.
+"""
+
+import os
+import struct
+from dataclasses import dataclass
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+@dataclass(frozen=True)
+class WavHeader:
+    format_tag: int
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+    block_align: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def is_pcm(self) -> bool:
+        return self.format_tag == WAVE_FORMAT_PCM
+
+    @property
+    def frame_count(self) -> int:
+        return self.data_size // self.block_align if self.block_align else 0
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.frame_count / self.sample_rate if self.sample_rate else 0.0
+
+
+def read_wav_header(path: str) -> WavHeader:
+    """Parse the header of a RIFF/WAVE file.
+
+    Raises ValueError if the file is not a readable WAV.
+    """
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            raise ValueError(f"Not a RIFF/WAVE file: {path}")
+
+        fmt: tuple[int, int, int, int, int] | None = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                raise ValueError(f"No data chunk found in {path}")
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+
+            if chunk_id == b"fmt ":
+                body = f.read(chunk_size)
+                if len(body) < 16:
+                    raise ValueError(f"Truncated fmt chunk in {path}")
+                format_tag, channels, sample_rate, _, block_align, bits = struct.unpack(
+                    "<HHIIHH", body[:16]
+                )
+                if format_tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                    # First two bytes of the SubFormat GUID hold the real tag
+                    format_tag = struct.unpack("<H", body[24:26])[0]
+                fmt = (format_tag, channels, sample_rate, block_align, bits)
+                if chunk_size % 2:
+                    f.seek(1, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError(f"data chunk precedes fmt chunk in {path}")
+                data_offset = f.tell()
+                # Streamed writers leave the size as a placeholder
+                data_size = min(chunk_size, file_size - data_offset)
+                format_tag, channels, sample_rate, block_align, bits = fmt
+                return WavHeader(
+                    format_tag=format_tag,
+                    channels=channels,
+                    sample_rate=sample_rate,
+                    bits_per_sample=bits,
+                    block_align=block_align,
+                    data_offset=data_offset,
+                    data_size=data_size,
+                )
+            else:
+                f.seek(chunk_size + (chunk_size % 2), os.SEEK_CUR)
@@ -0,0 +1,229 @@
+"""Async HTTP engine for OpenAI-compatible transcription APIs (OpenAI, Groq).
+
+The SDK engines send one blocking request per call and open connections
+as they go. This engine runs every request on one background event loop
+with a shared keep-alive connection pool. The chunk executor's threads
+all submit to that loop, so concurrent chunks reuse warm TLS connections
+and pass through one rate limiter. Requests over the provider's limits
+wait in the limiter. A 429 response is retried after the provider's
+Retry-After delay instead of failing the chunk.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+
+import httpx
+
+from app.adapters.outbound.engines.audio_input import encode_for_upload, open_audio
+from app.adapters.outbound.engines.rate_limiter import RateLimiter
+from app.adapters.outbound.engines.timed_response import (
+    segments_from_verbose,
+    whole_audio_segment,
+)
+from app.domain.exceptions import TranscriptionError
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.transcript_segment import TranscriptSegment
+from app.ports.audio_chunk import AudioChunk, EncodedAudio
+from app.ports.transcription_engine import AudioInput, TranscriptionEnginePort
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 8
+DEFAULT_TIMEOUT_SECONDS = 300.0
+DEFAULT_MAX_RATE_LIMIT_RETRIES = 5
+API_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
+class AsyncAPIEngine(TranscriptionEnginePort):
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        api_key: str,
+        model: str,
+        timestamps: bool = False,
+        encoding: str = "wav",
+        rate_limiter: RateLimiter | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        max_rate_limit_retries: int = DEFAULT_MAX_RATE_LIMIT_RETRIES,
+    ) -> None:
+        self._name = name
+        self._base_url = base_url.rstrip("/")
+        self._api_key = api_key
+        self._model = model
+        # Ask for verbose_json with word and segment times (Groq, whisper-1)
+        self._timestamps = timestamps
+        self._encoding = encoding
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._max_connections = max_connections
+        self._timeout_seconds = timeout_seconds
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._loop_lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name=f"{self._name}-http", daemon=True
+                ).start()
+                self._loop = loop
+        return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Only called on the loop thread, so no lock is needed
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                headers=(
+                    {"Authorization": f"Bearer {self._api_key}"} if self._api_key else {}
+                ),
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                timeout=self._timeout_seconds,
+            )
+        return self._client
+
+    def __getstate__(self) -> dict:
+        # Chunk worker processes start their own loop and connection pool
+        state = self.__dict__.copy()
+        state["_loop"] = None
+        state["_client"] = None
+        state["_loop_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._loop_lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """Start the event loop so the first job does not pay for it."""
+        self._get_loop()
+
+    def close(self) -> None:
+        """Close pooled connections and stop the event loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), loop).result()
+            self._client = None
+        loop.call_soon_threadsafe(loop.stop)
+
+    @staticmethod
+    def _audio_seconds(audio: AudioInput) -> float:
+        # File paths are not probed; they only count against the request limit
+        if isinstance(audio, (AudioChunk, EncodedAudio)):
+            return audio.duration_ms / 1000
+        return 0.0
+
+    def _form(self, language: str) -> dict:
+        form = {
+            "model": self._model,
+            "language": language.split("-")[0].lower(),
+            "temperature": "0",
+        }
+        if self._timestamps:
+            form["response_format"] = "verbose_json"
+            form["timestamp_granularities[]"] = ["word", "segment"]
+        else:
+            form["response_format"] = "json"
+        return form
+
+    async def _post(self, audio: AudioInput, language: str) -> dict:
+        with open_audio(audio) as audio_file:
+            filename = os.path.basename(getattr(audio_file, "name", "") or "audio.wav")
+            content = audio_file.read()
+
+        client = self._get_client()
+        # The audio budget is charged once; a 429 retry only costs a request
+        await self._rate_limiter.acquire_audio(self._audio_seconds(audio))
+        for attempt in range(self._max_rate_limit_retries + 1):
+            await self._rate_limiter.acquire_request()
+            response = await client.post(
+                "/audio/transcriptions",
+                data=self._form(language),
+                files={"file": (filename, content)},
+            )
+            if response.status_code != 429:
+                response.raise_for_status()
+                return response.json()
+
+            delay = _retry_after_seconds(response, attempt)
+            logger.warning(
+                f"{self._name} rate limited {audio}; retrying in {delay:.1f}s"
+            )
+            self._rate_limiter.throttle()
+            await asyncio.sleep(delay)
+
+        raise TranscriptionError(
+            f"{self._name} kept rate limiting {audio} after "
+            f"{self._max_rate_limit_retries} retries"
+        )
+
+    def _create_transcription(self, audio: AudioInput, language: str) -> dict:
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                self._post(audio, language), self._get_loop()
+            )
+            return future.result()
+        except TranscriptionError:
+            raise
+        except Exception as exc:
+            raise TranscriptionError(
+                f"{self._name} transcription failed for {audio}: {exc}"
+            ) from exc
+
+    def transcribe(self, audio: AudioInput, language: str) -> str:
+        text = (self._create_transcription(audio, language).get("text") or "").strip()
+        logger.info(
+            f"{self._name} transcription completed: {len(text)} chars from {audio}"
+        )
+        return text
+
+    def transcribe_segments(
+        self, audio: AudioInput, language: str
+    ) -> list[TranscriptSegment]:
+        response = self._create_transcription(audio, language)
+        segments = segments_from_verbose(response) if self._timestamps else []
+        if not segments:
+            return whole_audio_segment(audio, (response.get("text") or "").strip())
+        logger.info(
+            f"{self._name} transcription completed: {len(segments)} segments "
+            f"from {audio}"
+        )
+        return segments
+
+    def prepare(self, audio: AudioInput) -> AudioInput:
+        """Encode chunks into upload-ready files before a request slot frees up."""
+        return encode_for_upload(audio, self._encoding)
+
+    @property
+    def decoding_parameters(self) -> dict[str, object]:
+        return {"model": self._model, "encoding": self._encoding}
+
+    @property
+    def engine_name(self) -> str:
+        return self._name
+
+    @property
+    def capabilities(self) -> EngineCapabilities:
+        return EngineCapabilities(
+            max_upload_bytes=API_MAX_UPLOAD_BYTES, preferred_encoding=self._encoding
+        )
+
+
+def _retry_after_seconds(response: httpx.Response, attempt: int) -> float:
+    """The provider's Retry-After delay, else exponential backoff from 1 s."""
+    try:
+        return max(0.0, float(response.headers["retry-after"]))
+    except (KeyError, ValueError):
+        return float(2**attempt)
@@ -0,0 +1,77 @@
+"""Helpers for turning engine audio input into what each client expects."""
+
+import logging
+import subprocess
+from typing import BinaryIO
+
+import numpy as np
+
+from app.ports.audio_chunk import AudioChunk, EncodedAudio
+from app.ports.transcription_engine import AudioInput
+
+logger = logging.getLogger(__name__)
+
+FFMPEG_PATH = "ffmpeg"
+
+# Upload encodings: file extension and ffmpeg output options. Speech at
+# 16 kHz mono stays intelligible to Whisper at these bitrates.
+UPLOAD_ENCODINGS = {
+    "flac": ("flac", ["-c:a", "flac", "-compression_level", "8", "-f", "flac"]),
+    "opus": (
+        "ogg",
+        ["-c:a", "libopus", "-b:a", "24k", "-application", "voip", "-f", "ogg"],
+    ),
+    "mp3": ("mp3", ["-c:a", "libmp3lame", "-b:a", "32k", "-f", "mp3"]),
+}
+
+
+def open_audio(audio: AudioInput) -> BinaryIO:
+    """Open a path, chunk view or encoded chunk as a readable binary file object.
+
+    Chunk views are served as a lazily materialized WAV stream, so API
+    engines can upload them without a temp file on disk.
+    """
+    if isinstance(audio, (AudioChunk, EncodedAudio)):
+        return audio.open()
+    return open(audio, "rb")
+
+
+def encode_for_upload(audio: AudioInput, encoding: str = "wav") -> AudioInput:
+    """Encode chunk views to in-memory files; leave other input as is.
+
+    Compressed encodings fall back to WAV when ffmpeg cannot produce them,
+    so a host without the codec still transcribes, only slower.
+    """
+    if not isinstance(audio, AudioChunk):
+        return audio
+    if encoding in UPLOAD_ENCODINGS:
+        try:
+            return _encode_compressed(audio, encoding)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"Could not encode {audio} as {encoding}, sending WAV: {e}")
+    return audio.encode_wav()
+
+
+def _encode_compressed(chunk: AudioChunk, encoding: str) -> EncodedAudio:
+    extension, output_options = UPLOAD_ENCODINGS[encoding]
+    command = [
+        FFMPEG_PATH,
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-f", "s16le",
+        "-ar", str(chunk.sample_rate),
+        "-ac", str(chunk.channels),
+        "-i", "pipe:0",
+        *output_options,
+        "pipe:1",
+    ]
+    pcm = np.ascontiguousarray(chunk.samples, dtype="<i2").tobytes()
+    result = subprocess.run(command, input=pcm, capture_output=True, check=True)
+    return EncodedAudio(
+        result.stdout,
+        chunk.name.rsplit(".", 1)[0] + "." + extension,
+        chunk.duration_ms,
+        start_ms=chunk.start_ms,
+        index=chunk.index,
+    )
@@ -0,0 +1,185 @@
+"""faster-whisper engine that decodes concurrent requests in batches.
+
+faster-whisper's ``BatchedInferencePipeline`` splits one input into VAD
+segments and decodes up to ``batch_size`` of them in a single CTranslate2
+call. Requests arriving within ``max_wait_ms`` of each other (chunks of
+one job transcribed concurrently, or several short jobs sharing the
+engine) are joined into one input, separated by enough silence that no
+batch window spans two requests, and decoded together. Segments are then
+handed back to the request whose audio they fall in.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Future
+from dataclasses import replace
+
+import numpy as np
+
+from app.adapters.outbound.engines.faster_whisper_engine import (
+    WHISPER_SAMPLE_RATE,
+    FasterWhisperEngine,
+)
+from app.domain.exceptions import TranscriptionError
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.transcript_segment import TranscriptSegment
+from app.ports.transcription_engine import AudioInput
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_MAX_WAIT_MS = 50
+# Whisper decodes 30 s windows; a longer gap keeps requests in separate ones
+REQUEST_GAP_SECONDS = 31
+
+
+class _Request:
+    def __init__(self, audio: np.ndarray, language: str) -> None:
+        self.audio = audio
+        self.language = language
+        self.future: Future = Future()
+
+
+class BatchedFasterWhisperEngine(FasterWhisperEngine):
+    def __init__(
+        self,
+        model_size: str = "large-v3-turbo",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+        **model_options,
+    ) -> None:
+        super().__init__(model_size=model_size, **model_options)
+        self._batch_size = max(1, batch_size)
+        self._max_wait_seconds = max_wait_ms / 1000
+        self._pipeline = None
+        self._requests: queue.Queue[_Request] = queue.Queue()
+        self._batcher: threading.Thread | None = None
+        self._batcher_lock = threading.Lock()
+
+    def _get_pipeline(self):
+        """Wrap the registry's model, rebuilding the wrapper if it was reloaded."""
+        model = self._get_model()
+        if self._pipeline is None or self._pipeline.model is not model:
+            from faster_whisper import BatchedInferencePipeline
+
+            self._pipeline = BatchedInferencePipeline(model=model)
+        return self._pipeline
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pipeline"] = None
+        state["_requests"] = None
+        state["_batcher"] = None
+        state["_batcher_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._requests = queue.Queue()
+        self._batcher_lock = threading.Lock()
+
+    def _to_array(self, audio: AudioInput) -> np.ndarray:
+        """Return 16 kHz mono float32 samples for any engine input."""
+        model_input = self._to_model_input(audio)
+        if isinstance(model_input, np.ndarray):
+            return model_input
+        from faster_whisper import decode_audio
+
+        return decode_audio(model_input, sampling_rate=WHISPER_SAMPLE_RATE)
+
+    def transcribe_segments(
+        self, audio: AudioInput, language: str
+    ) -> list[TranscriptSegment]:
+        try:
+            self.warm_up()
+            self._ensure_batcher()
+            request = _Request(self._to_array(audio), language)
+            self._requests.put(request)
+            return request.future.result()
+        except TranscriptionError:
+            raise
+        except Exception as exc:
+            raise TranscriptionError(
+                f"Transcription failed for {audio}: {exc}"
+            ) from exc
+
+    def transcribe_stream(
+        self, audio: AudioInput, language: str
+    ) -> Iterator[TranscriptSegment]:
+        # Batched inference decodes a whole request at once
+        yield from self.transcribe_segments(audio, language)
+
+    def _ensure_batcher(self) -> None:
+        with self._batcher_lock:
+            if self._batcher is None:
+                self._batcher = threading.Thread(
+                    target=self._run_batcher, name="whisper-batcher", daemon=True
+                )
+                self._batcher.start()
+
+    def _run_batcher(self) -> None:
+        while True:
+            batch = [self._requests.get()]
+            deadline = time.monotonic() + self._max_wait_seconds
+            while len(batch) < self._batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._requests.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            by_language: dict[str, list[_Request]] = defaultdict(list)
+            for request in batch:
+                by_language[request.language].append(request)
+            for language, requests in by_language.items():
+                self._decode(requests, language)
+
+    def _decode(self, requests: list[_Request], language: str) -> None:
+        """Decode requests as one input and resolve each request's future."""
+        try:
+            gap = np.zeros(REQUEST_GAP_SECONDS * WHISPER_SAMPLE_RATE, dtype=np.float32)
+            parts = []
+            offsets = []
+            position = 0
+            for request in requests:
+                offsets.append(position / WHISPER_SAMPLE_RATE)
+                parts.extend((request.audio, gap))
+                position += len(request.audio) + len(gap)
+
+            lang = self._normalize_language(language)
+            segments, _ = self._get_pipeline().transcribe(
+                np.concatenate(parts),
+                batch_size=self._batch_size,
+                **self._decoding_options(lang),
+            )
+
+            results: list[list[TranscriptSegment]] = [[] for _ in requests]
+            for segment in segments:
+                midpoint = (segment.start + segment.end) / 2
+                owner = max(
+                    0, int(np.searchsorted(offsets, midpoint, side="right")) - 1
+                )
+                results[owner].append(self._to_segment(segment, offsets[owner]))
+            logger.info(f"Decoded {len(requests)} requests in one batch")
+        except Exception as exc:
+            for request in requests:
+                request.future.set_exception(exc)
+            return
+
+        for request, result in zip(requests, results):
+            request.future.set_result(result)
+
+    @property
+    def decoding_parameters(self) -> dict[str, object]:
+        # Batched decoding segments audio differently from sequential decoding
+        return {**super().decoding_parameters, "batch_size": self._batch_size}
+
+    @property
+    def capabilities(self) -> EngineCapabilities:
+        return replace(super().capabilities, batch_size=self._batch_size)
@@ -1,65 +1,188 @@
+import copy
 import logging
+from collections.abc import Iterator
 
+from app.adapters.outbound.engines.audio_input import open_audio
+from app.adapters.outbound.engines.model_registry import (
+    ModelSpec,
+    WhisperModelRegistry,
+)
 from app.domain.exceptions import TranscriptionError
-from app.ports.transcription_engine import TranscriptionEnginePort
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.quality_tier import QualityTier
+from app.domain.value_objects.transcript_segment import TimedWord, TranscriptSegment
+from app.ports.audio_chunk import AudioChunk, EncodedAudio
+from app.ports.transcription_engine import AudioInput, TranscriptionEnginePort
 
 logger = logging.getLogger(__name__)
 
+WHISPER_SAMPLE_RATE = 16000
+LOCAL_CHUNK_SECONDS = 20 * 60
+
 
 class FasterWhisperEngine(TranscriptionEnginePort):
-    def __init__(self, model_size: str = "large-v3-turbo") -> None:
+    def __init__(
+        self,
+        model_size: str = "large-v3-turbo",
+        device: str = "auto",
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        beam_size: int = 5,
+        registry: WhisperModelRegistry | None = None,
+        tier_models: dict[QualityTier, str] | None = None,
+    ) -> None:
         self._model_size = model_size
-        self._model = None
-
-    def _load_model(self) -> None:
-        from faster_whisper import WhisperModel
+        self._device = device
+        self._compute_type = compute_type
+        self._cpu_threads = cpu_threads  # 0 lets CTranslate2 choose
+        self._num_workers = num_workers
+        self._beam_size = beam_size
+        # Loaded models live in the registry, shared with the tier engines
+        self._registry = registry or WhisperModelRegistry()
+        self._tier_models = dict(tier_models or {})
+        self._tier_engines: dict[str, FasterWhisperEngine] = {}
 
-        logger.info(f"Loading faster-whisper model: {self._model_size}")
-        self._model = WhisperModel(
-            self._model_size,
-            device="auto",
-            compute_type="int8",
+    @property
+    def _model_spec(self) -> ModelSpec:
+        return ModelSpec(
+            model_size=self._model_size,
+            device=self._device,
+            compute_type=self._compute_type,
+            cpu_threads=self._cpu_threads,
+            num_workers=self._num_workers,
         )
-        logger.info("Model loaded successfully")
+
+    def _get_model(self):
+        return self._registry.get(self._model_spec)
+
+    def warm_up(self) -> None:
+        """Load the model now instead of on the first transcription."""
+        self._get_model()
+
+    def for_quality_tier(self, tier: QualityTier | None) -> "FasterWhisperEngine":
+        """Return an engine running the model configured for tier.
+
+        Tiers without a model of their own run this engine's model. Engines
+        are created once per model, so repeated jobs reuse the same one.
+        """
+        model_size = self._tier_models.get(tier, self._model_size)
+        if model_size == self._model_size:
+            return self
+        engine = self._tier_engines.get(model_size)
+        if engine is None:
+            engine = copy.copy(self)
+            engine._model_size = model_size
+            engine = self._tier_engines.setdefault(model_size, engine)
+        return engine
 
     @staticmethod
     def _normalize_language(language: str) -> str:
         """Strip region subtag (e.g. pt-BR → pt) for faster-whisper."""
         return language.split("-")[0].lower()
 
-    def transcribe(self, audio_path: str, language: str) -> str:
+    @staticmethod
+    def _to_model_input(audio: AudioInput):
+        """Hand 16 kHz chunk views to the model as arrays, skipping its decoder."""
+        if isinstance(audio, AudioChunk):
+            if audio.sample_rate == WHISPER_SAMPLE_RATE:
+                return audio.to_float32()
+            return open_audio(audio)
+        if isinstance(audio, EncodedAudio):
+            return audio.open()
+        return audio
+
+    def prepare(self, audio: AudioInput) -> AudioInput:
+        """Page chunk samples into memory so inference never waits on disk."""
+        if isinstance(audio, AudioChunk):
+            return audio.load()
+        return audio
+
+    def transcribe(self, audio: AudioInput, language: str) -> str:
+        segments = self.transcribe_segments(audio, language)
+        return " ".join(segment.text for segment in segments)
+
+    def transcribe_segments(
+        self, audio: AudioInput, language: str
+    ) -> list[TranscriptSegment]:
+        return list(self.transcribe_stream(audio, language))
+
+    def transcribe_stream(
+        self, audio: AudioInput, language: str
+    ) -> Iterator[TranscriptSegment]:
         try:
-            if self._model is None:
-                self._load_model()
+            model = self._get_model()
 
             lang = self._normalize_language(language)
-            initial_prompt = None
-            if lang == "pt":
-                initial_prompt = "Transcrição em português brasileiro."
-
-            segments, _ = self._model.transcribe(
-                audio_path,
-                language=lang,
-                beam_size=5,
-                vad_filter=True,
-                vad_parameters=dict(
-                    min_silence_duration_ms=500,
-                    speech_pad_ms=400,
-                ),
-                word_timestamps=True,
-                condition_on_previous_text=True,
-                hallucination_silence_threshold=2.0,
-                initial_prompt=initial_prompt,
+            segments, _ = model.transcribe(
+                self._to_model_input(audio), **self._decoding_options(lang)
             )
-            text = " ".join(segment.text.strip() for segment in segments)
-            return text
+            # faster-whisper decodes lazily; each segment is yielded as soon
+            # as its window is decoded
+            for segment in segments:
+                yield self._to_segment(segment)
         except TranscriptionError:
             raise
         except Exception as exc:
             raise TranscriptionError(
-                f"Transcription failed for {audio_path}: {exc}"
+                f"Transcription failed for {audio}: {exc}"
             ) from exc
 
+    def _decoding_options(self, lang: str) -> dict[str, object]:
+        """Options for model.transcribe, shared with batched decoding."""
+        return dict(
+            language=lang,
+            beam_size=self._beam_size,
+            vad_filter=True,
+            vad_parameters=dict(
+                min_silence_duration_ms=500,
+                speech_pad_ms=400,
+            ),
+            word_timestamps=True,
+            condition_on_previous_text=True,
+            hallucination_silence_threshold=2.0,
+            initial_prompt=self._initial_prompt(lang),
+        )
+
+    @staticmethod
+    def _initial_prompt(lang: str) -> str | None:
+        if lang == "pt":
+            return "Transcrição em português brasileiro."
+        return None
+
+    @staticmethod
+    def _to_segment(segment, offset_seconds: float = 0.0) -> TranscriptSegment:
+        """Convert a faster-whisper segment, shifting its times back by offset."""
+        return TranscriptSegment(
+            start_ms=round((segment.start - offset_seconds) * 1000),
+            end_ms=round((segment.end - offset_seconds) * 1000),
+            text=segment.text.strip(),
+            words=tuple(
+                TimedWord(
+                    start_ms=round((word.start - offset_seconds) * 1000),
+                    end_ms=round((word.end - offset_seconds) * 1000),
+                    text=word.word,
+                )
+                for word in segment.words or ()
+            ),
+        )
+
+    @property
+    def decoding_parameters(self) -> dict[str, object]:
+        return {
+            "model": self._model_size,
+            "compute_type": self._compute_type,
+            "beam_size": self._beam_size,
+        }
+
     @property
     def engine_name(self) -> str:
         return "faster-whisper"
+
+    @property
+    def capabilities(self) -> EngineCapabilities:
+        # Local inference has no request limits; longer chunks mean fewer
+        # overlaps to re-transcribe and fewer stitch points.
+        return EngineCapabilities(
+            preferred_chunk_seconds=LOCAL_CHUNK_SECONDS, runs_locally=True
+        )
@@ -3,12 +3,20 @@
 import logging
 import os
 
+from app.adapters.outbound.engines.audio_input import encode_for_upload, open_audio
+from app.adapters.outbound.engines.timed_response import (
+    segments_from_verbose,
+    whole_audio_segment,
+)
 from app.domain.exceptions import TranscriptionError
-from app.ports.transcription_engine import TranscriptionEnginePort
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.transcript_segment import TranscriptSegment
+from app.ports.transcription_engine import AudioInput, TranscriptionEnginePort
 
 logger = logging.getLogger(__name__)
 
 GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+GROQ_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
 
 
 class GroqEngine(TranscriptionEnginePort):
@@ -34,34 +42,76 @@ class GroqEngine(TranscriptionEnginePort):
                 ) from exc
         return self._client
 
-    def transcribe(self, audio_path: str, language: str) -> str:
-        """Transcribe audio using Groq's Whisper API."""
+    def __getstate__(self) -> dict:
+        # Chunk worker processes open their own client on first use
+        state = self.__dict__.copy()
+        state["_client"] = None
+        return state
+
+    def _create_transcription(self, audio: AudioInput, language: str, **options):
         try:
             client = self._get_client()
             lang = language.split("-")[0].lower()
 
-            with open(audio_path, "rb") as audio_file:
-                response = client.audio.transcriptions.create(
+            with open_audio(audio) as audio_file:
+                return client.audio.transcriptions.create(
                     model=self._model,
                     file=audio_file,
                     language=lang,
                     response_format="verbose_json",
                     temperature=0.0,
+                    **options,
                 )
 
-            text = response.text.strip()
-            logger.info(
-                f"Groq transcription completed: {len(text)} chars from {audio_path}"
-            )
-            return text
-
         except TranscriptionError:
             raise
         except Exception as exc:
             raise TranscriptionError(
-                f"Groq transcription failed for {audio_path}: {exc}"
+                f"Groq transcription failed for {audio}: {exc}"
             ) from exc
 
+    def transcribe(self, audio: AudioInput, language: str) -> str:
+        """Transcribe audio using Groq's Whisper API."""
+        response = self._create_transcription(audio, language)
+        text = response.text.strip()
+        logger.info(
+            f"Groq transcription completed: {len(text)} chars from {audio}"
+        )
+        return text
+
+    def transcribe_segments(
+        self, audio: AudioInput, language: str
+    ) -> list[TranscriptSegment]:
+        """Transcribe audio into segments with word timestamps."""
+        response = self._create_transcription(
+            audio, language, timestamp_granularities=["word", "segment"]
+        )
+        segments = segments_from_verbose(response)
+        if not segments:
+            return whole_audio_segment(audio, response.text.strip())
+        logger.info(
+            f"Groq transcription completed: {len(segments)} segments from {audio}"
+        )
+        return segments
+
+    def prepare(self, audio: AudioInput) -> AudioInput:
+        """Encode chunks into upload-ready files before a request slot frees up."""
+        return encode_for_upload(audio, self.capabilities.preferred_encoding)
+
+    @property
+    def decoding_parameters(self) -> dict[str, object]:
+        return {
+            "model": self._model,
+            "encoding": self.capabilities.preferred_encoding,
+        }
+
     @property
     def engine_name(self) -> str:
         return "groq"
+
+    @property
+    def capabilities(self) -> EngineCapabilities:
+        # Lossless FLAC roughly halves the upload without touching word timings
+        return EngineCapabilities(
+            max_upload_bytes=GROQ_MAX_UPLOAD_BYTES, preferred_encoding="flac"
+        )
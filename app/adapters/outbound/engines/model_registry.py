@@ -0,0 +1,141 @@
+"""Process-wide cache of loaded faster-whisper models under a memory budget.
+
+Engines for different quality tiers share one registry, so a worker can
+hold a small model for voice notes and a large one for meetings at the
+same time. When loading a model would exceed the budget, the least
+recently used models are dropped first. A model in use by a running
+transcription stays alive until that call returns; eviction only stops
+the registry from handing it out again.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET_BYTES = 4 * 1024**3
+
+# Parameter counts of the published checkpoints, in millions
+_MODEL_PARAMS_MILLIONS = {
+    "tiny": 39,
+    "base": 74,
+    "small": 244,
+    "medium": 769,
+    "large": 1550,
+    "distil-small": 166,
+    "distil-medium": 394,
+    "distil-large": 756,
+    "turbo": 809,
+}
+# Weights of int8 compute types are quantized to one byte each
+_BYTES_PER_PARAM = {"int8": 1, "float16": 2, "bfloat16": 2, "float32": 4}
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    model_size: str
+    device: str = "auto"
+    compute_type: str = "int8"
+    cpu_threads: int = 0
+    num_workers: int = 1
+
+
+def estimate_model_bytes(spec: ModelSpec) -> int:
+    """Approximate resident size of a model's weights.
+
+    Unknown names (e.g. a local path) are sized like a large model, so they
+    are never underestimated.
+    """
+    name = spec.model_size.rsplit("/", 1)[-1].lower().removesuffix(".en")
+    params = _MODEL_PARAMS_MILLIONS["large"]
+    if "turbo" in name:
+        params = _MODEL_PARAMS_MILLIONS["turbo"]
+    else:
+        for prefix, count in _MODEL_PARAMS_MILLIONS.items():
+            if name == prefix or name.startswith(prefix + "-"):
+                params = count
+                break
+
+    bytes_per_param = _BYTES_PER_PARAM.get(spec.compute_type.split("_")[0], 2)
+    return params * 1_000_000 * bytes_per_param
+
+
+def _load_whisper_model(spec: ModelSpec):
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        spec.model_size,
+        device=spec.device,
+        compute_type=spec.compute_type,
+        cpu_threads=spec.cpu_threads,
+        num_workers=spec.num_workers,
+    )
+
+
+class WhisperModelRegistry:
+    def __init__(
+        self,
+        memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+        loader: Callable[[ModelSpec], object] = _load_whisper_model,
+    ) -> None:
+        self._memory_budget_bytes = memory_budget_bytes
+        self._loader = loader
+        self._models: OrderedDict[ModelSpec, tuple[object, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, spec: ModelSpec):
+        """Return the loaded model for spec, loading (and evicting) if needed."""
+        # One lock for lookups and loads: two threads asking for the same
+        # model must not both load it
+        with self._lock:
+            if spec in self._models:
+                self._models.move_to_end(spec)
+                return self._models[spec][0]
+
+            size = estimate_model_bytes(spec)
+            self._evict_for(size)
+            logger.info(
+                f"Loading faster-whisper model: {spec.model_size} "
+                f"({spec.device}, {spec.compute_type}, "
+                f"{spec.cpu_threads or 'default'} threads, "
+                f"{spec.num_workers} workers, ~{size // 1024**2} MiB)"
+            )
+            model = self._loader(spec)
+            self._models[spec] = (model, size)
+            logger.info("Model loaded successfully")
+            return model
+
+    def _evict_for(self, size: int) -> None:
+        """Drop least recently used models until size fits in the budget."""
+        while self._models and self.loaded_bytes + size > self._memory_budget_bytes:
+            spec, _ = self._models.popitem(last=False)
+            logger.info(f"Evicted faster-whisper model {spec.model_size}")
+        if size > self._memory_budget_bytes:
+            logger.warning(
+                f"Model needs ~{size // 1024**2} MiB, more than the "
+                f"{self._memory_budget_bytes // 1024**2} MiB budget"
+            )
+
+    @property
+    def loaded_bytes(self) -> int:
+        return sum(size for _, size in self._models.values())
+
+    def loaded(self) -> list[ModelSpec]:
+        """Loaded models, least recently used first."""
+        with self._lock:
+            return list(self._models)
+
+    def __getstate__(self) -> dict:
+        # Worker processes start with an empty registry of the same budget
+        return {
+            "_memory_budget_bytes": self._memory_budget_bytes,
+            "_loader": self._loader,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
@@ -3,11 +3,19 @@
 import logging
 import os
 
+from app.adapters.outbound.engines.audio_input import encode_for_upload, open_audio
+from app.adapters.outbound.engines.timed_response import whole_audio_segment
 from app.domain.exceptions import TranscriptionError
-from app.ports.transcription_engine import TranscriptionEnginePort
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.transcript_segment import TranscriptSegment
+from app.ports.transcription_engine import AudioInput, TranscriptionEnginePort
 
 logger = logging.getLogger(__name__)
 
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+OPENAI_MODEL = "gpt-4o-mini-transcribe"
+OPENAI_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
 
 class OpenAIEngine(TranscriptionEnginePort):
     def __init__(self, api_key: str = "") -> None:
@@ -26,21 +34,27 @@ class OpenAIEngine(TranscriptionEnginePort):
                 ) from exc
         return self._client
 
-    def transcribe(self, audio_path: str, language: str) -> str:
+    def __getstate__(self) -> dict:
+        # Chunk worker processes open their own client on first use
+        state = self.__dict__.copy()
+        state["_client"] = None
+        return state
+
+    def transcribe(self, audio: AudioInput, language: str) -> str:
         """Transcribe audio using OpenAI gpt-4o-mini-transcribe."""
         try:
             client = self._get_client()
 
-            with open(audio_path, "rb") as audio_file:
+            with open_audio(audio) as audio_file:
                 response = client.audio.transcriptions.create(
-                    model="gpt-4o-mini-transcribe",
+                    model=OPENAI_MODEL,
                     file=audio_file,
                     language=language.split("-")[0],  # OpenAI uses ISO 639-1 (e.g., "pt")
                 )
 
             text = response.text.strip()
             logger.info(
-                f"OpenAI transcription completed: {len(text)} chars from {audio_path}"
+                f"OpenAI transcription completed: {len(text)} chars from {audio}"
             )
             return text
 
@@ -48,9 +62,33 @@ class OpenAIEngine(TranscriptionEnginePort):
             raise
         except Exception as exc:
             raise TranscriptionError(
-                f"OpenAI transcription failed for {audio_path}: {exc}"
+                f"OpenAI transcription failed for {audio}: {exc}"
             ) from exc
 
+    def transcribe_segments(
+        self, audio: AudioInput, language: str
+    ) -> list[TranscriptSegment]:
+        """gpt-4o-mini-transcribe returns no timestamps: one untimed segment."""
+        return whole_audio_segment(audio, self.transcribe(audio, language))
+
+    def prepare(self, audio: AudioInput) -> AudioInput:
+        """Encode chunks into upload-ready files before a request slot frees up."""
+        return encode_for_upload(audio, self.capabilities.preferred_encoding)
+
+    @property
+    def decoding_parameters(self) -> dict[str, object]:
+        return {
+            "model": OPENAI_MODEL,
+            "encoding": self.capabilities.preferred_encoding,
+        }
+
     @property
     def engine_name(self) -> str:
         return "openai"
+
+    @property
+    def capabilities(self) -> EngineCapabilities:
+        # Opus keeps speech intelligible at a fraction of the PCM upload size
+        return EngineCapabilities(
+            max_upload_bytes=OPENAI_MAX_UPLOAD_BYTES, preferred_encoding="opus"
+        )
@@ -0,0 +1,101 @@
+"""Token-bucket rate limiting for hosted transcription APIs.
+
+Providers cap both requests per minute and seconds of audio per hour.
+Each limit is a bucket that holds a full window's allowance and refills
+continuously; a request waits until every bucket can pay for it, so
+bursts past a limit queue up instead of being rejected with a 429.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._capacity = capacity
+        self._refill_per_second = refill_per_second
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock: asyncio.Lock | None = None
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._capacity,
+            self._tokens + (now - self._updated) * self._refill_per_second,
+        )
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until amount tokens are available, then take them.
+
+        Waiters are served in arrival order. A request costing more than the
+        whole bucket waits for a full bucket and leaves it in debt.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            needed = min(amount, self._capacity)
+            if self._tokens < needed:
+                await asyncio.sleep((needed - self._tokens) / self._refill_per_second)
+                self._refill()
+            self._tokens -= amount
+
+    def __getstate__(self) -> dict:
+        # The asyncio lock belongs to this process's event loop
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        return state
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the provider reported a rate limit."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter:
+    """Requests-per-minute and audio-seconds-per-hour limits; 0 disables one."""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        audio_seconds_per_hour: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60, clock)
+            if requests_per_minute > 0
+            else None
+        )
+        self._audio_seconds = (
+            TokenBucket(audio_seconds_per_hour, audio_seconds_per_hour / 3600, clock)
+            if audio_seconds_per_hour > 0
+            else None
+        )
+
+    async def acquire(self, audio_seconds: float) -> None:
+        await self.acquire_request()
+        await self.acquire_audio(audio_seconds)
+
+    async def acquire_request(self) -> None:
+        """Pay for one request; retries of the same audio pay only this."""
+        if self._requests is not None:
+            await self._requests.acquire(1)
+
+    async def acquire_audio(self, audio_seconds: float) -> None:
+        """Pay for audio seconds, once per chunk however often it is sent."""
+        if self._audio_seconds is not None and audio_seconds > 0:
+            await self._audio_seconds.acquire(audio_seconds)
+
+    def throttle(self) -> None:
+        """Make queued requests wait for a refill after a 429 response."""
+        if self._requests is not None:
+            self._requests.drain()
@@ -0,0 +1,408 @@
+"""Composite engine that hedges slow API requests and falls back to a local model.
+
+Each request goes to the primary engine first. If it has not answered
+after the primary's recent p95 latency, the same request is sent to the
+hedge engine (which may be the primary again) and the first answer wins.
+When the primary's circuit breaker is open, or every API attempt fails or
+times out, the request runs on the fallback engine, usually local
+faster-whisper. The winning engine and its latency are logged, counted
+per engine and recorded as a RouteOutcome; ``for_quality_tier`` gives each
+job its own record while breakers and latency windows stay shared.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from app.domain.exceptions import TranscriptionError
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.quality_tier import QualityTier
+from app.domain.value_objects.route_outcome import RouteOutcome
+from app.domain.value_objects.transcript_segment import TranscriptSegment
+from app.ports.audio_chunk import AudioChunk
+from app.ports.transcription_engine import AudioInput, TranscriptionEnginePort
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_HEDGE_DELAY_SECONDS = 10.0
+DEFAULT_TIMEOUT_SECONDS = 300.0
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_SECONDS = 60.0
+LATENCY_WINDOW = 100
+MIN_LATENCY_SAMPLES = 5
+# Outcomes kept by a router used directly rather than through a job's view
+MAX_OUTCOMES = 10_000
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures; lets one trial request through later.
+
+    Once the reset period has passed the breaker is half-open: the first
+    caller gets through as a probe and everyone else is refused until the
+    probe reports back. A successful probe closes the breaker, a failed one
+    re-opens it for another full period.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_seconds: float = DEFAULT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing:
+                return False
+            if self._clock() - self._opened_at >= self._reset_seconds:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._probing:
+                self._probing = False
+                self._opened_at = self._clock()
+                return
+            self._failures += 1
+            if self._failures >= self._failure_threshold and self._opened_at is None:
+                self._opened_at = self._clock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class LatencyTracker:
+    """Sliding window of request latencies for one engine."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Latency below which a fraction q of recent requests finished."""
+        with self._lock:
+            if len(self._samples) < MIN_LATENCY_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def merge_capabilities(engines: list[TranscriptionEnginePort]) -> EngineCapabilities:
+    """Capabilities of the primary, with every engine's hard limits applied.
+
+    Chunks are planned once, so each must fit whichever engine ends up
+    transcribing it.
+    """
+    capabilities = [engine.capabilities for engine in engines]
+    upload_limits = [c.max_upload_bytes for c in capabilities if c.max_upload_bytes]
+    duration_limits = [
+        c.max_duration_seconds for c in capabilities if c.max_duration_seconds
+    ]
+    return EngineCapabilities(
+        max_upload_bytes=min(upload_limits) if upload_limits else None,
+        max_duration_seconds=min(duration_limits) if duration_limits else None,
+        preferred_chunk_seconds=capabilities[0].preferred_chunk_seconds,
+        preferred_encoding=capabilities[0].preferred_encoding,
+        runs_locally=capabilities[0].runs_locally,
+        batch_size=capabilities[0].batch_size,
+    )
+
+
+class RoutedEngine(TranscriptionEnginePort):
+    def __init__(
+        self,
+        primary: TranscriptionEnginePort,
+        hedge: TranscriptionEnginePort | None = None,
+        fallback: TranscriptionEnginePort | None = None,
+        hedge_quantile: float = 0.95,
+        default_hedge_delay_seconds: float = DEFAULT_HEDGE_DELAY_SECONDS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_seconds: float = DEFAULT_RESET_SECONDS,
+        max_workers: int = 16,
+    ) -> None:
+        self._primary = primary
+        self._hedge = hedge
+        self._fallback = fallback
+        self._hedge_quantile = hedge_quantile
+        self._default_hedge_delay_seconds = default_hedge_delay_seconds
+        self._timeout_seconds = timeout_seconds
+        # One breaker and latency window per distinct API engine, keyed by
+        # name so they survive pickling and cover the engine's tier models
+        api_engines = [engine for engine in (primary, hedge) if engine is not None]
+        self._breakers = {
+            engine.engine_name: CircuitBreaker(failure_threshold, reset_seconds)
+            for engine in api_engines
+        }
+        self._latencies = {
+            engine.engine_name: LatencyTracker() for engine in api_engines
+        }
+        # Losing requests finish in the background, so the pool is shared
+        self._max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="route"
+        )
+        self.wins: Counter[str] = Counter()
+        self._wins_lock = threading.Lock()
+        self._outcomes: deque[RouteOutcome] = deque(maxlen=MAX_OUTCOMES)
+        self._outcome_lock = threading.Lock()
+
+    def hedge_delay_seconds(self) -> float:
+        """How long the primary gets before a hedged duplicate is sent."""
+        delay = self._latencies[self._primary.engine_name].quantile(self._hedge_quantile)
+        return self._default_hedge_delay_seconds if delay is None else delay
+
+    def _attempt(
+        self,
+        engine: TranscriptionEnginePort,
+        call: Callable[[TranscriptionEnginePort, AudioInput], T],
+        audio: AudioInput,
+    ) -> tuple[T, float]:
+        """Run one request on engine, feeding its breaker and latency window."""
+        started = time.monotonic()
+        try:
+            result = call(engine, engine.prepare(audio))
+        except Exception:
+            self._breakers[engine.engine_name].record_failure()
+            raise
+        latency = time.monotonic() - started
+        self._breakers[engine.engine_name].record_success()
+        self._latencies[engine.engine_name].record(latency)
+        return result, latency
+
+    def _route(
+        self,
+        call: Callable[[TranscriptionEnginePort, AudioInput], T],
+        audio: AudioInput,
+    ) -> T:
+        errors: list[Exception] = []
+        if self._breakers[self._primary.engine_name].allow():
+            try:
+                return self._race(call, audio)
+            except Exception as e:
+                errors.append(e)
+        else:
+            logger.info(
+                f"{self._primary.engine_name} circuit open; skipping to fallback"
+            )
+
+        if self._fallback is None:
+            raise TranscriptionError(
+                f"All engines failed for {audio}: "
+                + "; ".join(str(e) for e in errors or ["circuit open"])
+            )
+        logger.warning(f"Falling back to {self._fallback.engine_name} for {audio}")
+        started = time.monotonic()
+        result = call(self._fallback, self._fallback.prepare(audio))
+        self._record(self._fallback, time.monotonic() - started, False, fell_back=True)
+        return result
+
+    def _race(
+        self,
+        call: Callable[[TranscriptionEnginePort, AudioInput], T],
+        audio: AudioInput,
+    ) -> T:
+        """Primary, plus a hedged duplicate if it is slow; first answer wins."""
+        deadline = time.monotonic() + self._timeout_seconds
+        attempts: dict[Future, TranscriptionEnginePort] = {}
+
+        def submit(engine: TranscriptionEnginePort) -> None:
+            attempts[self._pool.submit(self._attempt, engine, call, audio)] = engine
+
+        submit(self._primary)
+        done, _ = wait(attempts, timeout=self.hedge_delay_seconds())
+        hedged = (
+            not done
+            and self._hedge is not None
+            and self._breakers[self._hedge.engine_name].allow()
+        )
+        if hedged:
+            logger.info(
+                f"{self._primary.engine_name} slow on {audio}; hedging with "
+                f"{self._hedge.engine_name}"
+            )
+            submit(self._hedge)
+
+        error: Exception | None = None
+        pending = set(attempts)
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=max(0.0, deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                # A stalled API counts against its circuit like a failed one
+                for future in pending:
+                    self._breakers[attempts[future].engine_name].record_failure()
+                raise TranscriptionError(
+                    f"No answer for {audio} within {self._timeout_seconds:g}s"
+                )
+            for future in done:
+                try:
+                    result, latency = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                self._record(attempts[future], latency, hedged, fell_back=False)
+                return result
+        raise error
+
+    def _record(
+        self,
+        engine: TranscriptionEnginePort,
+        latency: float,
+        hedged: bool,
+        fell_back: bool,
+    ) -> None:
+        outcome = RouteOutcome(
+            engine.engine_name,
+            latency,
+            hedged,
+            fell_back,
+            decoding_parameters=engine.decoding_parameters,
+        )
+        with self._wins_lock:
+            self.wins[engine.engine_name] += 1
+        with self._outcome_lock:
+            self._outcomes.append(outcome)
+        logger.info(
+            f"Route won by {outcome.engine_name} in {latency:.2f}s"
+            f"{' (hedged)' if hedged else ''}{' (fallback)' if fell_back else ''}"
+        )
+
+    def transcribe(self, audio: AudioInput, language: str) -> str:
+        return self._route(lambda engine, a: engine.transcribe(a, language), audio)
+
+    def transcribe_segments(
+        self, audio: AudioInput, language: str
+    ) -> list[TranscriptSegment]:
+        return self._route(
+            lambda engine, a: engine.transcribe_segments(a, language), audio
+        )
+
+    def prepare(self, audio: AudioInput) -> AudioInput:
+        """Page samples in; each engine encodes when it is actually called."""
+        if isinstance(audio, AudioChunk):
+            return audio.load()
+        return audio
+
+    def route_outcomes(self) -> list[RouteOutcome]:
+        with self._outcome_lock:
+            return list(self._outcomes)
+
+    def for_quality_tier(self, tier: QualityTier | None) -> "RoutedEngine":
+        """A router for one job, over each engine's model for the tier.
+
+        The view starts with an empty record of outcomes; breakers, latency
+        windows, win counts and the request pool stay shared with this one.
+        """
+        # Built from this router's attributes directly: copy.copy would go
+        # through __getstate__ and give the view a pool and locks of its own
+        view = RoutedEngine.__new__(RoutedEngine)
+        view.__dict__.update(self.__dict__)
+        view._primary = self._primary.for_quality_tier(tier)
+        if self._hedge is self._primary:
+            view._hedge = view._primary
+        elif self._hedge is not None:
+            view._hedge = self._hedge.for_quality_tier(tier)
+        if self._fallback is not None:
+            view._fallback = self._fallback.for_quality_tier(tier)
+        view._outcomes = deque(maxlen=MAX_OUTCOMES)
+        view._outcome_lock = threading.Lock()
+        return view
+
+    def warm_up(self) -> None:
+        for engine in self._engines:
+            engine.warm_up()
+
+    def close(self) -> None:
+        for engine in self._engines:
+            engine.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __getstate__(self) -> dict:
+        # A local primary runs the whole router in chunk worker processes
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_wins_lock"] = None
+        state["_outcome_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="route"
+        )
+        self._wins_lock = threading.Lock()
+        self._outcome_lock = threading.Lock()
+
+    @property
+    def _engines(self) -> list[TranscriptionEnginePort]:
+        engines = []
+        for engine in (self._primary, self._hedge, self._fallback):
+            # The hedge may be the primary itself
+            if engine is not None and engine not in engines:
+                engines.append(engine)
+        return engines
+
+    @property
+    def decoding_parameters(self) -> dict[str, object]:
+        # The primary's, for lookups; results are cached under the engine
+        # that answered, from its RouteOutcome
+        return self._primary.decoding_parameters
+
+    @property
+    def engine_name(self) -> str:
+        return self._primary.engine_name
+
+    @property
+    def capabilities(self) -> EngineCapabilities:
+        return merge_capabilities(self._engines)
@@ -0,0 +1,50 @@
+"""Conversion of engine responses into timed transcript segments."""
+
+from typing import Any
+
+from app.domain.value_objects.transcript_segment import TimedWord, TranscriptSegment
+from app.ports.audio_chunk import AudioChunk, EncodedAudio
+from app.ports.transcription_engine import AudioInput
+
+
+def _field(item: Any, name: str) -> Any:
+    # SDK responses are objects, raw JSON responses are dicts
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def _ms(seconds: float | None) -> int:
+    return round((seconds or 0.0) * 1000)
+
+
+def segments_from_verbose(response: Any) -> list[TranscriptSegment]:
+    """Build segments from a verbose_json response, attaching words by time."""
+    words = [
+        TimedWord(_ms(_field(w, "start")), _ms(_field(w, "end")), _field(w, "word") or "")
+        for w in _field(response, "words") or []
+    ]
+    segments = []
+    w = 0
+    raw_segments = _field(response, "segments") or []
+    for index, raw in enumerate(raw_segments):
+        start_ms, end_ms = _ms(_field(raw, "start")), _ms(_field(raw, "end"))
+        last = index == len(raw_segments) - 1
+        first_word = w
+        while w < len(words) and (last or words[w].start_ms < end_ms):
+            w += 1
+        segments.append(
+            TranscriptSegment(
+                start_ms=start_ms,
+                end_ms=end_ms,
+                text=(_field(raw, "text") or "").strip(),
+                words=tuple(words[first_word:w]),
+            )
+        )
+    return segments
+
+
+def whole_audio_segment(audio: AudioInput, text: str) -> list[TranscriptSegment]:
+    """A single untimed segment spanning the audio, for engines without timings."""
+    end_ms = audio.duration_ms if isinstance(audio, (AudioChunk, EncodedAudio)) else 0
+    return [TranscriptSegment(start_ms=0, end_ms=end_ms, text=text)]
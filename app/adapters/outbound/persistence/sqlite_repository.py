@@ -1,3 +1,4 @@
+import json
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
@@ -8,6 +9,8 @@ from app.domain.entities.transcription_job import TranscriptionJob
 from app.domain.entities.transcription_result import TranscriptionResult
 from app.domain.value_objects.audio_format import AudioFormat
 from app.domain.value_objects.job_status import JobStatus
+from app.domain.value_objects.quality_tier import QualityTier
+from app.domain.value_objects.transcript_segment import TimedWord, TranscriptSegment
 from app.ports.job_repository import JobRepositoryPort
 
 _CREATE_AUDIO_FILES = """
@@ -19,7 +22,8 @@ CREATE TABLE IF NOT EXISTS audio_files (
     duration_seconds REAL,
     storage_path TEXT NOT NULL,
     upload_timestamp TEXT NOT NULL,
-    converted_path TEXT
+    converted_path TEXT,
+    content_hash TEXT
 );
 """
 
@@ -34,7 +38,9 @@ CREATE TABLE IF NOT EXISTS transcription_jobs (
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
     error_message TEXT,
-    retry_count INTEGER NOT NULL DEFAULT 0
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    conversion_skipped INTEGER NOT NULL DEFAULT 0,
+    quality_tier TEXT
 );
 """
 
@@ -46,10 +52,60 @@ CREATE TABLE IF NOT EXISTS transcription_results (
     language TEXT NOT NULL,
     engine_name TEXT NOT NULL,
     processing_duration_seconds REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    engine_latency_seconds REAL
+);
+"""
+
+_CREATE_CHUNK_RESULTS = """
+CREATE TABLE IF NOT EXISTS chunk_results (
+    job_id TEXT NOT NULL REFERENCES transcription_jobs(id),
+    chunk_index INTEGER NOT NULL,
+    audio_hash TEXT NOT NULL,
+    segments TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (job_id, chunk_index, audio_hash)
+);
+"""
+
+_CREATE_CHUNK_PLANS = """
+CREATE TABLE IF NOT EXISTS chunk_plans (
+    job_id TEXT PRIMARY KEY REFERENCES transcription_jobs(id),
+    cores TEXT NOT NULL,
     created_at TEXT NOT NULL
 );
 """
 
+_CREATE_PARTIAL_SEGMENTS = """
+CREATE TABLE IF NOT EXISTS partial_segments (
+    sequence INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL REFERENCES transcription_jobs(id),
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    attempt INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_CREATE_PARTIAL_SEGMENTS_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_partial_segments_job
+    ON partial_segments (job_id, sequence);
+"""
+
+_CREATE_RESULT_CACHE = """
+CREATE TABLE IF NOT EXISTS result_cache (
+    cache_key TEXT PRIMARY KEY,
+    source_job_id TEXT NOT NULL,
+    full_text TEXT NOT NULL,
+    language TEXT NOT NULL,
+    engine_name TEXT NOT NULL,
+    processing_duration_seconds REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    last_used_at TEXT NOT NULL
+);
+"""
+
 
 class SQLiteJobRepository(JobRepositoryPort):
     """SQLite-backed implementation of JobRepositoryPort."""
@@ -68,6 +124,32 @@ class SQLiteJobRepository(JobRepositoryPort):
             self._conn.execute(_CREATE_AUDIO_FILES)
             self._conn.execute(_CREATE_TRANSCRIPTION_JOBS)
             self._conn.execute(_CREATE_TRANSCRIPTION_RESULTS)
+            self._conn.execute(_CREATE_CHUNK_RESULTS)
+            self._conn.execute(_CREATE_CHUNK_PLANS)
+            self._conn.execute(_CREATE_PARTIAL_SEGMENTS)
+            self._conn.execute(_CREATE_PARTIAL_SEGMENTS_INDEX)
+            self._conn.execute(_CREATE_RESULT_CACHE)
+            self._add_missing_column("audio_files", "content_hash", "TEXT")
+            self._add_missing_column(
+                "transcription_jobs",
+                "conversion_skipped",
+                "INTEGER NOT NULL DEFAULT 0",
+            )
+            self._add_missing_column("transcription_jobs", "quality_tier", "TEXT")
+            self._add_missing_column(
+                "transcription_results", "engine_latency_seconds", "REAL"
+            )
+            self._add_missing_column(
+                "partial_segments", "attempt", "INTEGER NOT NULL DEFAULT 0"
+            )
+
+    def _add_missing_column(self, table: str, column: str, definition: str) -> None:
+        """Add a column to a table created by an older schema version."""
+        columns = {
+            row["name"] for row in self._conn.execute(f"PRAGMA table_info({table})")
+        }
+        if column not in columns:
+            self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
 
     # ------------------------------------------------------------------
     # Write operations
@@ -78,8 +160,9 @@ class SQLiteJobRepository(JobRepositoryPort):
         sql = """
             INSERT OR REPLACE INTO transcription_jobs
                 (id, audio_file_id, status, progress_percent, language,
-                 engine_name, created_at, updated_at, error_message, retry_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 engine_name, created_at, updated_at, error_message, retry_count,
+                 conversion_skipped, quality_tier)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         with self._conn:
             self._conn.execute(
@@ -95,6 +178,27 @@ class SQLiteJobRepository(JobRepositoryPort):
                     job.updated_at.isoformat(),
                     job.error_message,
                     job.retry_count,
+                    int(job.conversion_skipped),
+                    job.quality_tier.value if job.quality_tier else None,
+                ),
+            )
+
+    def raise_progress(self, job_id: UUID, progress_percent: int) -> None:
+        """Raise a TRANSCRIBING job's progress in place; never lower it."""
+        sql = """
+            UPDATE transcription_jobs
+            SET progress_percent = ?, updated_at = ?
+            WHERE id = ? AND status = ? AND progress_percent < ?
+        """
+        with self._conn:
+            self._conn.execute(
+                sql,
+                (
+                    progress_percent,
+                    datetime.now(timezone.utc).isoformat(),
+                    str(job_id),
+                    JobStatus.TRANSCRIBING.value,
+                    progress_percent,
                 ),
             )
 
@@ -103,8 +207,8 @@ class SQLiteJobRepository(JobRepositoryPort):
         sql = """
             INSERT OR REPLACE INTO audio_files
                 (id, original_filename, format, size_bytes, duration_seconds,
-                 storage_path, upload_timestamp, converted_path)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                 storage_path, upload_timestamp, converted_path, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         with self._conn:
             self._conn.execute(
@@ -118,6 +222,7 @@ class SQLiteJobRepository(JobRepositoryPort):
                     audio_file.storage_path,
                     audio_file.upload_timestamp.isoformat(),
                     audio_file.converted_path,
+                    audio_file.content_hash,
                 ),
             )
 
@@ -127,6 +232,10 @@ class SQLiteJobRepository(JobRepositoryPort):
             count = self._conn.execute(
                 "SELECT COUNT(*) FROM transcription_jobs"
             ).fetchone()[0]
+            self._conn.execute("DELETE FROM chunk_results")
+            self._conn.execute("DELETE FROM chunk_plans")
+            self._conn.execute("DELETE FROM partial_segments")
+            self._conn.execute("DELETE FROM result_cache")
             self._conn.execute("DELETE FROM transcription_results")
             self._conn.execute("DELETE FROM transcription_jobs")
             self._conn.execute("DELETE FROM audio_files")
@@ -137,8 +246,8 @@ class SQLiteJobRepository(JobRepositoryPort):
         sql = """
             INSERT INTO transcription_results
                 (id, job_id, full_text, language, engine_name,
-                 processing_duration_seconds, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+                 processing_duration_seconds, created_at, engine_latency_seconds)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
         with self._conn:
             self._conn.execute(
@@ -151,9 +260,127 @@ class SQLiteJobRepository(JobRepositoryPort):
                     result.engine_name,
                     result.processing_duration_seconds,
                     result.created_at.isoformat(),
+                    result.engine_latency_seconds,
                 ),
             )
 
+    def save_cached_result(
+        self, cache_key: str, result: TranscriptionResult, max_entries: int
+    ) -> None:
+        """Cache a result and trim the cache to its max_entries most recent."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO result_cache
+                    (cache_key, source_job_id, full_text, language, engine_name,
+                     processing_duration_seconds, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    cache_key,
+                    str(result.job_id),
+                    result.full_text,
+                    result.language,
+                    result.engine_name,
+                    result.processing_duration_seconds,
+                    now,
+                    now,
+                ),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM result_cache WHERE cache_key NOT IN (
+                    SELECT cache_key FROM result_cache
+                    ORDER BY last_used_at DESC LIMIT ?
+                )
+                """,
+                (max_entries,),
+            )
+
+    def save_chunk_result(
+        self,
+        job_id: UUID,
+        chunk_index: int,
+        audio_hash: str,
+        segments: list[TranscriptSegment],
+    ) -> None:
+        """Checkpoint the transcription of one chunk of a job."""
+        sql = """
+            INSERT OR REPLACE INTO chunk_results
+                (job_id, chunk_index, audio_hash, segments, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        with self._conn:
+            self._conn.execute(
+                sql,
+                (
+                    str(job_id),
+                    chunk_index,
+                    audio_hash,
+                    self._segments_to_json(segments),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+
+    def delete_chunk_results(self, job_id: UUID) -> None:
+        """Drop the chunk checkpoints and the chunk plan of a job."""
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM chunk_results WHERE job_id = ?", (str(job_id),)
+            )
+            self._conn.execute(
+                "DELETE FROM chunk_plans WHERE job_id = ?", (str(job_id),)
+            )
+
+    def save_chunk_plan(self, job_id: UUID, cores: list[tuple[int, int]]) -> None:
+        """Store the chunk cores (start, end ms) a distributed job was split into."""
+        sql = """
+            INSERT OR REPLACE INTO chunk_plans (job_id, cores, created_at)
+            VALUES (?, ?, ?)
+        """
+        with self._conn:
+            self._conn.execute(
+                sql,
+                (
+                    str(job_id),
+                    json.dumps(cores),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+
+    def save_partial_segments(
+        self, job_id: UUID, segments: list[TranscriptSegment], attempt: int = 0
+    ) -> None:
+        """Append segments, published by one attempt of a job, to its live transcript."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO partial_segments
+                    (job_id, start_ms, end_ms, text, created_at, attempt)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        str(job_id),
+                        segment.start_ms,
+                        segment.end_ms,
+                        segment.text,
+                        now,
+                        attempt,
+                    )
+                    for segment in segments
+                ],
+            )
+
+    def delete_partial_segments(self, job_id: UUID) -> None:
+        """Drop the partial transcript of a job."""
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM partial_segments WHERE job_id = ?", (str(job_id),)
+            )
+
     # ------------------------------------------------------------------
     # Read operations
     # ------------------------------------------------------------------
@@ -180,6 +407,27 @@ class SQLiteJobRepository(JobRepositoryPort):
             return None
         return self._row_to_result(row)
 
+    def get_cached_result(self, cache_key: str) -> TranscriptionResult | None:
+        """Get a cached result by key, or None, marking it recently used."""
+        with self._conn:
+            row = self._conn.execute(
+                "SELECT * FROM result_cache WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE result_cache SET last_used_at = ? WHERE cache_key = ?",
+                (datetime.now(timezone.utc).isoformat(), cache_key),
+            )
+        return TranscriptionResult(
+            job_id=UUID(row["source_job_id"]),
+            full_text=row["full_text"],
+            language=row["language"],
+            engine_name=row["engine_name"],
+            processing_duration_seconds=row["processing_duration_seconds"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
+
     def get_audio_file(self, audio_file_id: UUID) -> AudioFile | None:
         """Get an audio file by ID, or None if not found."""
         sql = "SELECT * FROM audio_files WHERE id = ?"
@@ -196,6 +444,48 @@ class SQLiteJobRepository(JobRepositoryPort):
         rows = self._conn.execute(sql, (limit, offset)).fetchall()
         return [self._row_to_job(row) for row in rows]
 
+    def get_chunk_results(
+        self, job_id: UUID
+    ) -> dict[tuple[int, str], list[TranscriptSegment]]:
+        """Get checkpointed chunks of a job, keyed by (chunk_index, audio_hash)."""
+        sql = "SELECT * FROM chunk_results WHERE job_id = ?"
+        rows = self._conn.execute(sql, (str(job_id),)).fetchall()
+        return {
+            (row["chunk_index"], row["audio_hash"]): self._json_to_segments(
+                row["segments"]
+            )
+            for row in rows
+        }
+
+    def get_chunk_plan(self, job_id: UUID) -> list[tuple[int, int]] | None:
+        """Get the stored chunk cores of a job, or None if none were stored."""
+        sql = "SELECT cores FROM chunk_plans WHERE job_id = ?"
+        row = self._conn.execute(sql, (str(job_id),)).fetchone()
+        if row is None:
+            return None
+        return [(start, end) for start, end in json.loads(row["cores"])]
+
+    def get_partial_segments(
+        self, job_id: UUID, after_sequence: int = 0
+    ) -> list[tuple[int, int, TranscriptSegment]]:
+        """Get (sequence, attempt, segment) triples appended after a sequence number."""
+        sql = """
+            SELECT sequence, attempt, start_ms, end_ms, text FROM partial_segments
+            WHERE job_id = ? AND sequence > ?
+            ORDER BY sequence
+        """
+        rows = self._conn.execute(sql, (str(job_id), after_sequence)).fetchall()
+        return [
+            (
+                row["sequence"],
+                row["attempt"],
+                TranscriptSegment(
+                    start_ms=row["start_ms"], end_ms=row["end_ms"], text=row["text"]
+                ),
+            )
+            for row in rows
+        ]
+
     # ------------------------------------------------------------------
     # Row-to-domain mappers
     # ------------------------------------------------------------------
@@ -213,6 +503,10 @@ class SQLiteJobRepository(JobRepositoryPort):
             updated_at=datetime.fromisoformat(row["updated_at"]),
             error_message=row["error_message"],
             retry_count=row["retry_count"],
+            conversion_skipped=bool(row["conversion_skipped"]),
+            quality_tier=(
+                QualityTier(row["quality_tier"]) if row["quality_tier"] else None
+            ),
         )
 
     @staticmethod
@@ -226,6 +520,7 @@ class SQLiteJobRepository(JobRepositoryPort):
             storage_path=row["storage_path"],
             upload_timestamp=datetime.fromisoformat(row["upload_timestamp"]),
             converted_path=row["converted_path"],
+            content_hash=row["content_hash"],
         )
 
     @staticmethod
@@ -237,5 +532,35 @@ class SQLiteJobRepository(JobRepositoryPort):
             language=row["language"],
             engine_name=row["engine_name"],
             processing_duration_seconds=row["processing_duration_seconds"],
+            engine_latency_seconds=row["engine_latency_seconds"],
             created_at=datetime.fromisoformat(row["created_at"]),
         )
+
+    @staticmethod
+    def _segments_to_json(segments: list[TranscriptSegment]) -> str:
+        return json.dumps(
+            [
+                {
+                    "start_ms": segment.start_ms,
+                    "end_ms": segment.end_ms,
+                    "text": segment.text,
+                    "words": [
+                        [word.start_ms, word.end_ms, word.text]
+                        for word in segment.words
+                    ],
+                }
+                for segment in segments
+            ]
+        )
+
+    @staticmethod
+    def _json_to_segments(data: str) -> list[TranscriptSegment]:
+        return [
+            TranscriptSegment(
+                start_ms=item["start_ms"],
+                end_ms=item["end_ms"],
+                text=item["text"],
+                words=tuple(TimedWord(*word) for word in item["words"]),
+            )
+            for item in json.loads(data)
+        ]
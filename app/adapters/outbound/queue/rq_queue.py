@@ -3,6 +3,7 @@ from uuid import UUID
 
 from redis import Redis
 from rq import Queue
+from rq.job import Dependency
 
 from app.ports.job_queue import JobQueuePort
 
@@ -22,3 +23,23 @@ class RQJobQueue(JobQueuePort):
             job_timeout=1800,  # 30 minutes for model download + transcription
         )
         logger.info(f"Enqueued job {job_id} for processing")
+
+    def enqueue_chunks(self, job_id: UUID, chunk_count: int) -> None:
+        chunk_jobs = [
+            self._queue.enqueue(
+                "app.adapters.inbound.worker.process_chunk",
+                str(job_id),
+                chunk_index,
+                job_timeout=1800,
+            )
+            for chunk_index in range(chunk_count)
+        ]
+        # The reducer also runs if a chunk sub-job failed; it transcribes
+        # whatever chunks are missing itself
+        self._queue.enqueue(
+            "app.adapters.inbound.worker.reduce_job",
+            str(job_id),
+            depends_on=Dependency(jobs=chunk_jobs, allow_failure=True),
+            job_timeout=1800,
+        )
+        logger.info(f"Enqueued {chunk_count} chunk sub-jobs and a reducer for job {job_id}")
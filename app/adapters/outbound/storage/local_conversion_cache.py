@@ -0,0 +1,90 @@
+import logging
+import os
+import shutil
+import tempfile
+
+from app.ports.conversion_cache import ConversionCachePort
+
+logger = logging.getLogger(__name__)
+
+
+class LocalConversionCache(ConversionCachePort):
+    """Caches converted WAVs in a local directory with size-bounded LRU eviction.
+
+    Entries are hard-linked in and out of the cache when the cache and the
+    uploads live on the same filesystem, so a hit costs no copy and no
+    extra disk space. An entry's mtime is its last use.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, content_hash: str, sample_rate: int, channels: int) -> str:
+        return os.path.join(
+            self.cache_dir, f"{content_hash}_{sample_rate}hz_{channels}ch.wav"
+        )
+
+    def fetch(
+        self, content_hash: str, sample_rate: int, channels: int, dest_path: str
+    ) -> bool:
+        """Place a cached conversion at dest_path. Returns False on a miss."""
+        entry = self._entry_path(content_hash, sample_rate, channels)
+        try:
+            os.utime(entry)
+            self._link_or_copy(entry, dest_path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def store(
+        self, content_hash: str, sample_rate: int, channels: int, wav_path: str
+    ) -> None:
+        """Add a converted WAV to the cache, evicting old entries if needed."""
+        if os.path.getsize(wav_path) > self.max_bytes:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = self._entry_path(content_hash, sample_rate, channels)
+        self._link_or_copy(wav_path, entry)
+        os.utime(entry)
+        self._evict(keep=entry)
+
+    def _link_or_copy(self, src: str, dest: str) -> None:
+        # Build next to the destination, then rename, so readers never see
+        # a partially written file.
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(dest) or ".", suffix=".tmp"
+        )
+        os.close(fd)
+        os.remove(tmp_path)
+        try:
+            try:
+                os.link(src, tmp_path)
+            except OSError:
+                shutil.copyfile(src, tmp_path)
+            os.replace(tmp_path, dest)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _evict(self, keep: str) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(".wav"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            logger.info("Evicted %s from conversion cache", os.path.basename(path))
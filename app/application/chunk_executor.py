@@ -0,0 +1,443 @@
+"""Bounded-concurrency fan-out of chunk transcription."""
+
+import itertools
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TypeVar
+
+from app.domain.exceptions import TranscriptionError
+from app.domain.value_objects.transcript_segment import TranscriptSegment
+from app.ports.audio_chunk import AudioChunk
+from app.ports.transcription_engine import TranscriptionEnginePort
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_WORKERS = 4
+DEFAULT_LOCAL_WORKERS = 1
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF_SECONDS = 1.0
+DEFAULT_PREFETCH = 2
+
+T = TypeVar("T")
+ResultCallback = Callable[[int, list[TranscriptSegment]], None]
+SegmentCallback = Callable[[int, TranscriptSegment], None]
+
+
+def _transcribe_with_retries(
+    engine: TranscriptionEnginePort,
+    chunk: AudioChunk,
+    language: str,
+    max_retries: int,
+    backoff_seconds: float,
+    on_segment: Callable[[TranscriptSegment], None] | None = None,
+) -> list[TranscriptSegment]:
+    """Transcribe one chunk, retrying only this chunk on failure.
+
+    Segments are streamed from the engine and passed to on_segment as they
+    arrive. A retry does not repeat segments an earlier attempt already
+    passed on.
+    """
+    streamed_until_ms = -1
+    for attempt in range(max_retries + 1):
+        try:
+            segments = []
+            for segment in engine.transcribe_stream(chunk, language):
+                segments.append(segment)
+                if on_segment is not None and segment.end_ms > streamed_until_ms:
+                    on_segment(segment)
+                    streamed_until_ms = segment.end_ms
+            return segments
+        except TranscriptionError as e:
+            if attempt == max_retries:
+                raise
+            logger.warning(
+                f"Chunk {chunk.index}: attempt {attempt + 1} failed, retrying: {e}"
+            )
+            time.sleep(backoff_seconds * 2**attempt)
+    raise AssertionError("unreachable")
+
+
+# Each pool process holds its own engine (and therefore its own model), and
+# sends streamed segments back through the pool's segment queue
+_process_engine: TranscriptionEnginePort | None = None
+_process_segments = None
+
+
+def _init_process(engine: TranscriptionEnginePort, segments) -> None:
+    global _process_engine, _process_segments
+    _process_engine = engine
+    _process_segments = segments
+
+
+def _transcribe_in_process(
+    chunk: AudioChunk,
+    language: str,
+    max_retries: int,
+    backoff_seconds: float,
+    stream_key: int | None = None,
+) -> list[TranscriptSegment]:
+    if stream_key is None:
+        return _transcribe_with_retries(
+            _process_engine, chunk, language, max_retries, backoff_seconds
+        )
+    try:
+        return _transcribe_with_retries(
+            _process_engine,
+            chunk,
+            language,
+            max_retries,
+            backoff_seconds,
+            lambda segment: _process_segments.put((stream_key, segment)),
+        )
+    finally:
+        # Written before the result, so the parent has every segment by then
+        _process_segments.put((stream_key, None))
+
+
+class _SegmentRelay:
+    """Hands segments streamed by pool processes to their chunk's callback.
+
+    Each chunk registers a callback under a key; the worker process puts
+    (key, segment) pairs on the queue and (key, None) when the chunk ends.
+    A relay thread in this process calls the callbacks.
+    """
+
+    def __init__(self, context) -> None:
+        self.queue = context.SimpleQueue()
+        self._keys = itertools.count()
+        self._listeners: dict[
+            int, tuple[Callable[[TranscriptSegment], None], threading.Event]
+        ] = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._relay, name="chunk-segments", daemon=True
+        )
+        self._thread.start()
+
+    def listen(
+        self, callback: Callable[[TranscriptSegment], None]
+    ) -> tuple[int, threading.Event]:
+        """Register a chunk's callback; the event is set when the chunk ends."""
+        ended = threading.Event()
+        with self._lock:
+            key = next(self._keys)
+            self._listeners[key] = (callback, ended)
+        return key, ended
+
+    def forget(self, key: int) -> None:
+        """Drop the callback of a chunk that will never run."""
+        with self._lock:
+            self._listeners.pop(key, None)
+
+    def _relay(self) -> None:
+        while True:
+            key, segment = self.queue.get()
+            if key is None:
+                return
+            with self._lock:
+                listener = self._listeners.get(key)
+                if listener is not None and segment is None:
+                    del self._listeners[key]
+            if listener is None:
+                continue
+            callback, ended = listener
+            if segment is None:
+                ended.set()
+                continue
+            try:
+                callback(segment)
+            except Exception as e:
+                logger.warning(f"Segment callback failed: {e}")
+
+    def close(self) -> None:
+        self.queue.put((None, None))
+        self._thread.join()
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_DONE = object()
+
+
+class _StreamedFuture:
+    """A pool future whose result also waits for the chunk's last segment."""
+
+    def __init__(
+        self, future: Future, ended: threading.Event, forget: Callable[[], None]
+    ) -> None:
+        self._future = future
+        self._ended = ended
+        self._forget = forget
+
+    def result(self) -> list[TranscriptSegment]:
+        segments = self._future.result()
+        self._ended.wait()
+        return segments
+
+    def cancel(self) -> bool:
+        cancelled = self._future.cancel()
+        if cancelled:
+            self._forget()
+        return cancelled
+
+
+def prefetch(items: Iterable[T], depth: int) -> Iterator[T]:
+    """Iterate items produced by a background thread, at most depth ahead.
+
+    The producer blocks once depth items are waiting, so slow consumers
+    bound how much prepared data is alive. Producer errors are re-raised
+    in the consumer; closing the iterator early stops the producer.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_Failure(e))
+            return
+        put(_DONE)
+
+    producer = threading.Thread(target=produce, name="chunk-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+class ChunkExecutor:
+    """Streams chunks through prepare and transcription, in chunk order.
+
+    A producer thread runs ``engine.prepare`` (page-in, encoding) on the
+    next chunks while earlier ones are being transcribed. At most
+    ``prefetch`` prepared chunks wait in the queue and at most one chunk
+    per worker is in flight, so only a handful of chunks are alive at once
+    however long the file is.
+
+    API engines are I/O bound and share one engine across a thread pool.
+    Local engines (``capabilities.runs_locally``) are CPU/GPU bound, so they
+    get a process pool in which every worker loads its own model; the pool
+    is kept between jobs so models are loaded once per worker. Engines that
+    batch requests (``capabilities.batch_size > 1``) get ``batch_size``
+    threads sharing one engine, so chunks reach it together. With a
+    single worker, chunks are transcribed on the calling thread.
+
+    Chunks are transcribed with ``engine.transcribe_stream``, so segments
+    can be handed over while a long chunk is still being decoded.
+    """
+
+    def __init__(
+        self,
+        api_workers: int = DEFAULT_API_WORKERS,
+        local_workers: int = DEFAULT_LOCAL_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> None:
+        self._api_workers = api_workers
+        self._local_workers = local_workers
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._prefetch = prefetch
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_key: tuple | None = None
+        self._segment_relay: _SegmentRelay | None = None
+
+    def transcribe_all(
+        self,
+        engine: TranscriptionEnginePort,
+        chunks: Iterable[AudioChunk],
+        language: str,
+        on_result: ResultCallback | None = None,
+        on_segment: SegmentCallback | None = None,
+    ) -> list[list[TranscriptSegment]]:
+        """Transcribe every chunk. Raises the first chunk error that survives retries.
+
+        ``on_result(position, segments)`` is called on the calling thread as
+        each chunk's result is collected, in chunk order, so results are
+        handed over even if a later chunk fails.
+
+        ``on_segment(position, segment)`` is called as each segment arrives
+        from the engine, before the chunk's ``on_result``. Chunks run
+        concurrently, so it is called from worker threads, must be
+        thread-safe, and sees the chunks interleaved.
+        """
+        capabilities = engine.capabilities
+        # A batching engine groups concurrent requests itself, so it is
+        # shared across threads like an API engine
+        local = capabilities.runs_locally and capabilities.batch_size <= 1
+        if local:
+            workers = self._local_workers
+        elif capabilities.batch_size > 1:
+            workers = capabilities.batch_size
+        else:
+            workers = self._api_workers
+        retry_args = (self._max_retries, self._retry_backoff_seconds)
+        prepared = prefetch((engine.prepare(chunk) for chunk in chunks), self._prefetch)
+
+        try:
+            if workers <= 1:
+                results = []
+                for chunk in prepared:
+                    segments = _transcribe_with_retries(
+                        engine,
+                        chunk,
+                        language,
+                        *retry_args,
+                        self._bind(on_segment, len(results)),
+                    )
+                    if on_result is not None:
+                        on_result(len(results), segments)
+                    results.append(segments)
+                return results
+
+            if local:
+                pool = self._get_process_pool(engine)
+                relay = self._segment_relay
+
+                def submit_to_process(
+                    position: int, chunk: AudioChunk
+                ) -> Future | _StreamedFuture:
+                    if on_segment is None:
+                        return pool.submit(
+                            _transcribe_in_process, chunk, language, *retry_args
+                        )
+                    key, ended = relay.listen(self._bind(on_segment, position))
+                    future = pool.submit(
+                        _transcribe_in_process, chunk, language, *retry_args, key
+                    )
+                    # Collect only once the relay has passed every segment on
+                    return _StreamedFuture(future, ended, lambda: relay.forget(key))
+
+                try:
+                    return self._stream(
+                        workers, prepared, submit_to_process, on_result
+                    )
+                except BrokenProcessPool as e:
+                    # A worker was killed (e.g. out of memory), crashed or
+                    # failed to load its engine. Drop the pool so the next
+                    # call starts fresh processes instead of failing at once.
+                    logger.error(f"Chunk worker process died: {e}")
+                    self.shutdown()
+                    raise TranscriptionError(f"Chunk worker process died: {e}") from e
+
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="chunk"
+            ) as pool:
+                return self._stream(
+                    workers,
+                    prepared,
+                    lambda position, chunk: pool.submit(
+                        _transcribe_with_retries,
+                        engine,
+                        chunk,
+                        language,
+                        *retry_args,
+                        self._bind(on_segment, position),
+                    ),
+                    on_result,
+                )
+        finally:
+            prepared.close()
+
+    @staticmethod
+    def _bind(
+        on_segment: SegmentCallback | None, position: int
+    ) -> Callable[[TranscriptSegment], None] | None:
+        if on_segment is None:
+            return None
+        return lambda segment: on_segment(position, segment)
+
+    @staticmethod
+    def _stream(
+        workers: int,
+        prepared: Iterator,
+        submit: Callable[[int, object], Future | _StreamedFuture],
+        on_result: ResultCallback | None = None,
+    ) -> list[list[TranscriptSegment]]:
+        """Keep up to workers chunks in flight; collect results in order."""
+        results: list[list[TranscriptSegment]] = []
+        in_flight: deque[Future | _StreamedFuture] = deque()
+
+        def collect() -> None:
+            segments = in_flight.popleft().result()
+            if on_result is not None:
+                on_result(len(results), segments)
+            results.append(segments)
+            logger.info(f"Chunk {len(results)} transcribed")
+
+        try:
+            while True:
+                # Free a slot before taking the next prepared chunk, so the
+                # queue (not this loop) holds the chunks waiting their turn.
+                if len(in_flight) >= workers:
+                    collect()
+                chunk = next(prepared, _DONE)
+                if chunk is _DONE:
+                    break
+                in_flight.append(submit(len(results) + len(in_flight), chunk))
+            while in_flight:
+                collect()
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+        return results
+
+    def _get_process_pool(self, engine: TranscriptionEnginePort) -> Executor:
+        # Keyed by model rather than object, so per-job engine views (such as
+        # a router's tier views) reuse the workers' loaded models
+        key = (engine.engine_name, sorted(engine.decoding_parameters.items()))
+        if self._process_pool is not None and self._process_pool_key != key:
+            self.shutdown()
+        if self._process_pool is None:
+            # spawn: forking a process that already holds model threads is unsafe
+            context = multiprocessing.get_context("spawn")
+            self._segment_relay = _SegmentRelay(context)
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._local_workers,
+                mp_context=context,
+                initializer=_init_process,
+                initargs=(engine, self._segment_relay.queue),
+            )
+            self._process_pool_key = key
+        return self._process_pool
+
+    def shutdown(self) -> None:
+        """Stop the process pool, if one was started."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+            self._process_pool_key = None
+            self._segment_relay.close()
+            self._segment_relay = None
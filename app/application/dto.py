@@ -2,12 +2,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
+from app.domain.value_objects.quality_tier import QualityTier
+
 
 @dataclass(frozen=True)
 class SubmitTranscriptionRequest:
     filename: str
     file_data: bytes
     language: str = "pt-BR"
+    quality_tier: QualityTier | None = None
 
 
 @dataclass(frozen=True)
@@ -45,3 +48,14 @@ class TranscriptionResultResponse:
     language: str
     engine_name: str
     processing_duration_seconds: float
+    engine_latency_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class PartialSegmentResponse:
+    sequence: int
+    # Attempt of the job that published the segment (its retry count)
+    attempt: int
+    start_ms: int
+    end_ms: int
+    text: str
@@ -1,6 +1,11 @@
 from uuid import UUID
 
-from app.application.dto import AudioFileInfo, JobStatusResponse, TranscriptionResultResponse
+from app.application.dto import (
+    AudioFileInfo,
+    JobStatusResponse,
+    PartialSegmentResponse,
+    TranscriptionResultResponse,
+)
 from app.ports.job_repository import JobRepositoryPort
 
 
@@ -46,4 +51,22 @@ class GetJobStatusUseCase:
             language=result.language,
             engine_name=result.engine_name,
             processing_duration_seconds=result.processing_duration_seconds,
+            engine_latency_seconds=result.engine_latency_seconds,
         )
+
+    def get_partial_segments(
+        self, job_id: UUID, after_sequence: int = 0
+    ) -> list[PartialSegmentResponse]:
+        """Segments of a running job's live transcript after a sequence number."""
+        return [
+            PartialSegmentResponse(
+                sequence=sequence,
+                attempt=attempt,
+                start_ms=segment.start_ms,
+                end_ms=segment.end_ms,
+                text=segment.text,
+            )
+            for sequence, attempt, segment in self._repository.get_partial_segments(
+                job_id, after_sequence
+            )
+        ]
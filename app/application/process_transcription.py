@@ -1,23 +1,40 @@
 import logging
-import os
 import time
+from datetime import datetime, timezone
 from uuid import UUID
 
+from app.application.chunk_executor import ChunkExecutor
+from app.domain.entities.transcription_job import TranscriptionJob
 from app.domain.entities.transcription_result import TranscriptionResult
 from app.domain.services.chunking_strategy import (
     add_overlap,
-    compute_chunk_boundaries,
+    chunk_budget,
     needs_chunking,
-    stitch_transcriptions,
+    owned_segments,
+    plan_chunk_boundaries,
+    split_oversized,
+    stitch_segments,
 )
+from app.domain.services.result_cache import result_cache_key
 from app.domain.value_objects.job_status import JobStatus
-from app.ports.audio_converter import AudioConverterPort
+from app.domain.value_objects.route_outcome import RouteOutcome
+from app.domain.value_objects.transcript_segment import (
+    ChunkTranscript,
+    TranscriptSegment,
+)
+from app.ports.audio_converter import AudioConverterPort, AudioSession
 from app.ports.audio_storage import AudioStoragePort
+from app.ports.conversion_cache import ConversionCachePort
+from app.ports.job_queue import JobQueuePort
 from app.ports.job_repository import JobRepositoryPort
 from app.ports.transcription_engine import TranscriptionEnginePort
 
 logger = logging.getLogger(__name__)
 
+TARGET_SAMPLE_RATE = 16000
+TARGET_CHANNELS = 1
+TARGET_BYTES_PER_SECOND = TARGET_SAMPLE_RATE * TARGET_CHANNELS * 2  # PCM16
+
 
 class ProcessTranscriptionUseCase:
     def __init__(
@@ -26,11 +43,21 @@ class ProcessTranscriptionUseCase:
         storage: AudioStoragePort,
         converter: AudioConverterPort,
         engine: TranscriptionEnginePort,
+        conversion_cache: ConversionCachePort | None = None,
+        chunk_executor: ChunkExecutor | None = None,
+        chunk_queue: JobQueuePort | None = None,
+        result_cache_max_entries: int = 0,
     ) -> None:
         self._repository = repository
         self._storage = storage
         self._converter = converter
         self._engine = engine
+        self._conversion_cache = conversion_cache
+        self._chunk_executor = chunk_executor or ChunkExecutor(api_workers=1)
+        # When set, chunks of long files are fanned out as queue sub-jobs
+        self._chunk_queue = chunk_queue
+        # Transcripts kept for re-uploads of the same audio (0 = no cache)
+        self._result_cache_max_entries = result_cache_max_entries
 
     def execute(self, job_id: UUID) -> None:
         start_time = time.time()
@@ -46,6 +73,9 @@ class ProcessTranscriptionUseCase:
             self._repository.save_job(job)
             logger.info(f"Job {job_id}: PENDING → CONVERTING")
 
+            # A retry starts its live transcript over
+            self._repository.delete_partial_segments(job_id)
+
             # Get the audio file and resolve absolute path
             audio_file = self._repository.get_audio_file(job.audio_file_id)
             if audio_file is None:
@@ -53,103 +83,467 @@ class ProcessTranscriptionUseCase:
 
             absolute_input_path = self._storage.get_absolute_path(audio_file.storage_path)
 
-            # Build converted WAV path
-            converted_path = audio_file.storage_path.rsplit(".", 1)[0] + "_converted.wav"
-            absolute_converted_path = self._storage.get_absolute_path(converted_path)
+            if self._converter.is_normalized(
+                absolute_input_path, TARGET_SAMPLE_RATE, TARGET_CHANNELS
+            ):
+                # Upload is already 16kHz mono PCM WAV — use it as is
+                converted_path = audio_file.storage_path
+                absolute_converted_path = absolute_input_path
+                job.conversion_skipped = True
+                logger.info(f"Job {job_id}: Input already normalized, skipping conversion")
+            else:
+                # Build converted WAV path
+                converted_path = audio_file.storage_path.rsplit(".", 1)[0] + "_converted.wav"
+                absolute_converted_path = self._storage.get_absolute_path(converted_path)
 
-            # Convert to 16kHz mono WAV
-            self._converter.convert_to_wav(absolute_input_path, absolute_converted_path)
-            logger.info(f"Job {job_id}: Converted audio to WAV")
+                # Convert to 16kHz mono WAV, reusing an earlier conversion if cached
+                self._convert(
+                    job_id,
+                    audio_file.content_hash,
+                    absolute_input_path,
+                    absolute_converted_path,
+                )
+                job.conversion_skipped = False
 
-            # Update AudioFile with converted path and duration
-            duration = self._converter.get_duration_seconds(absolute_converted_path)
-            audio_file.converted_path = converted_path
-            audio_file.duration_seconds = duration
-            self._repository.create_audio_file(audio_file)
+            # Resolve the model the job asked for before anything is planned
+            engine = self._engine.for_quality_tier(job.quality_tier)
 
-            # CONVERTING → TRANSCRIBING (progress 50%)
-            job.transition_to(JobStatus.TRANSCRIBING)
-            job.update_progress(50)
-            self._repository.save_job(job)
-            logger.info(f"Job {job_id}: CONVERTING → TRANSCRIBING (50%)")
+            # Open the converted WAV once; duration, silence scan and chunk
+            # views all share the same buffer until the job finishes.
+            with self._converter.open_session(absolute_converted_path) as session:
+                # Update AudioFile with converted path and duration
+                duration = session.duration_seconds
+                audio_file.converted_path = converted_path
+                audio_file.duration_seconds = duration
+                self._repository.create_audio_file(audio_file)
 
-            # Transcribe — with chunking for long files
-            duration_ms = int(duration * 1000)
-            full_text = self._transcribe_audio(
-                job_id, absolute_converted_path, job.language, duration_ms
+                # CONVERTING → TRANSCRIBING (progress 50%)
+                job.transition_to(JobStatus.TRANSCRIBING)
+                job.update_progress(50)
+                self._repository.save_job(job)
+                logger.info(f"Job {job_id}: CONVERTING → TRANSCRIBING (50%)")
+
+                # Plan chunks for long files
+                duration_ms = int(duration * 1000)
+                cores = self._plan_chunks(engine, job_id, session, duration_ms)
+                if cores is not None and self._chunk_queue is not None:
+                    # Map: one sub-job per chunk; the reducer completes the
+                    # job. Both read the plan stored here instead of
+                    # planning the whole file again.
+                    self._repository.save_chunk_plan(job_id, cores)
+                    self._chunk_queue.enqueue_chunks(job_id, len(cores))
+                    logger.info(
+                        f"Job {job_id}: Distributed {len(cores)} chunks to workers"
+                    )
+                    return
+
+                full_text = self._transcribe_audio(engine, job, session, cores)
+                logger.info(f"Job {job_id}: Transcription complete")
+
+            requests = 1 if cores is None else len(cores)
+            self._complete(
+                job, full_text, time.time() - start_time, engine, requests
             )
-            logger.info(f"Job {job_id}: Transcription complete")
-
-            # Create TranscriptionResult entity
-            processing_duration = time.time() - start_time
-            result = TranscriptionResult(
-                job_id=job.id,
-                full_text=full_text,
-                language=job.language,
-                engine_name=job.engine_name,
-                processing_duration_seconds=processing_duration,
+
+        except Exception as e:
+            self._fail(job, e)
+
+    def transcribe_chunk(self, job_id: UUID, chunk_index: int) -> None:
+        """Map step: transcribe and checkpoint one chunk of a distributed job.
+
+        The chunk plan is the one the parent job stored. Failures propagate
+        to the queue; the reducer transcribes any chunk left without a
+        checkpoint.
+        """
+        job = self._repository.get_job(job_id)
+        if job is None:
+            logger.error(f"Job {job_id} not found")
+            return
+
+        engine = self._engine.for_quality_tier(job.quality_tier)
+        with self._converter.open_session(self._converted_path(job)) as session:
+            cores = self._stored_chunk_plan(engine, job_id, session) or []
+            if chunk_index >= len(cores):
+                logger.warning(
+                    f"Job {job_id}: Chunk {chunk_index} is not in the current plan"
+                )
+                return
+
+            boundaries = add_overlap(cores)
+            chunk = session.chunk_views(boundaries)[chunk_index]
+            audio_hash = chunk.content_hash()
+            if (chunk_index, audio_hash) in self._repository.get_chunk_results(job_id):
+                logger.info(f"Job {job_id}: Chunk {chunk_index} already transcribed")
+                return
+
+            offset_ms = boundaries[chunk_index][0]
+            [segments] = self._chunk_executor.transcribe_all(
+                engine,
+                [chunk],
+                job.language,
+                on_segment=lambda _, segment: self._publish_partial(
+                    job, owned_segments(cores, chunk_index, offset_ms, [segment])
+                ),
+            )
+            self._repository.save_chunk_result(
+                job_id, chunk_index, audio_hash, segments
             )
-            self._repository.save_result(result)
+        logger.info(f"Job {job_id}: Chunk {chunk_index} transcribed")
+        self._report_chunk_progress(job_id, len(cores))
 
-            # Transition → COMPLETED (progress 100%)
-            job.transition_to(JobStatus.COMPLETED)
-            job.update_progress(100)
-            self._repository.save_job(job)
-            logger.info(f"Job {job_id}: TRANSCRIBING → COMPLETED (100%)")
+    def reduce(self, job_id: UUID) -> None:
+        """Reduce step: stitch the checkpointed chunks and complete the job.
+
+        Chunks whose sub-job failed are transcribed here before stitching.
+        """
+        job = self._repository.get_job(job_id)
+        if job is None:
+            logger.error(f"Job {job_id} not found")
+            return
+
+        try:
+            engine = self._engine.for_quality_tier(job.quality_tier)
+            with self._converter.open_session(self._converted_path(job)) as session:
+                cores = self._stored_chunk_plan(engine, job_id, session)
+                # Sub-jobs already published their chunks
+                full_text = self._transcribe_audio(
+                    engine, job, session, cores, republish_checkpoints=False
+                )
+                logger.info(f"Job {job_id}: Transcription complete")
+
+            # Distributed jobs span several workers; time it from creation
+            processing_duration = (
+                datetime.now(timezone.utc) - job.created_at
+            ).total_seconds()
+            requests = 1 if cores is None else len(cores)
+            self._complete(job, full_text, processing_duration, engine, requests)
 
         except Exception as e:
-            logger.exception(f"Job {job_id} failed: {e}")
-            job.fail(str(e))
-            self._repository.save_job(job)
+            self._fail(job, e)
 
-            # Attempt retry if under the limit
-            if job.retry_count < 3:
-                try:
-                    job.retry()
-                    self._repository.save_job(job)
-                    logger.info(
-                        f"Job {job_id}: Scheduled retry {job.retry_count}/3"
-                    )
-                except Exception as retry_error:
-                    logger.error(
-                        f"Job {job_id}: Retry failed: {retry_error}"
-                    )
+    def _converted_path(self, job: TranscriptionJob) -> str:
+        """Absolute path of the WAV a mapped job was converted to."""
+        audio_file = self._repository.get_audio_file(job.audio_file_id)
+        if audio_file is None or audio_file.converted_path is None:
+            raise ValueError(f"Converted audio for job {job.id} not found")
+        return self._storage.get_absolute_path(audio_file.converted_path)
 
-    def _transcribe_audio(
+    def _publish_partial(
+        self, job: TranscriptionJob, segments: list[TranscriptSegment]
+    ) -> None:
+        """Append segments to the live transcript streamed to the web UI.
+
+        Segments are tagged with the job's attempt, so viewers can drop
+        what an earlier attempt published.
+        """
+        if not segments:
+            return
+        try:
+            self._repository.save_partial_segments(
+                job.id, segments, attempt=job.retry_count
+            )
+        except Exception as e:
+            # Only the preview is affected; the job carries on
+            logger.warning(f"Job {job.id}: Could not publish partial segments: {e}")
+
+    def _report_chunk_progress(self, job_id: UUID, chunk_count: int) -> None:
+        """Move progress from 50% to 95% as the chunks of a job are checkpointed."""
+        done = min(len(self._repository.get_chunk_results(job_id)), chunk_count)
+        # Sub-jobs run concurrently and finish in any order; only the progress
+        # column is updated, and only upwards while the job is transcribing
+        self._repository.raise_progress(job_id, 50 + 45 * done // chunk_count)
+
+    def _complete(
+        self,
+        job: TranscriptionJob,
+        full_text: str,
+        processing_duration: float,
+        engine: TranscriptionEnginePort,
+        requests: int,
+    ) -> None:
+        """Store the result and move the job to COMPLETED.
+
+        ``requests`` is how many engine requests the transcript is made of.
+        """
+        outcomes = self._route_outcomes(engine, requests)
+        latency = None
+        if outcomes:
+            # Name the engine(s) that actually answered, not the one the
+            # job was submitted to
+            job.engine_name = "+".join(
+                dict.fromkeys(outcome.engine_name for outcome in outcomes)
+            )
+            latency = sum(outcome.latency_seconds for outcome in outcomes)
+            logger.info(
+                f"Job {job.id}: Answered by {job.engine_name} in {latency:.2f}s"
+            )
+        result = TranscriptionResult(
+            job_id=job.id,
+            full_text=full_text,
+            language=job.language,
+            engine_name=job.engine_name,
+            processing_duration_seconds=processing_duration,
+            engine_latency_seconds=latency,
+        )
+        self._repository.save_result(result)
+        self._cache_result(job, result, engine, outcomes)
+
+        # The result is stored; chunk checkpoints and the live transcript
+        # are no longer needed
+        self._repository.delete_chunk_results(job.id)
+        self._repository.delete_partial_segments(job.id)
+
+        # Transition → COMPLETED (progress 100%)
+        job.transition_to(JobStatus.COMPLETED)
+        job.update_progress(100)
+        self._repository.save_job(job)
+        logger.info(f"Job {job.id}: TRANSCRIBING → COMPLETED (100%)")
+
+    @staticmethod
+    def _route_outcomes(
+        engine: TranscriptionEnginePort, requests: int
+    ) -> list[RouteOutcome] | None:
+        """Who answered each of the job's requests, or None if not all are known.
+
+        Engines that do not route record nothing. Chunks checkpointed by
+        sub-jobs, earlier attempts or chunk worker processes were answered
+        through another router, so their outcomes are missing here.
+        """
+        outcomes = engine.route_outcomes()
+        if outcomes is None or len(outcomes) != requests:
+            return None
+        return outcomes
+
+    def _cache_result(
+        self,
+        job: TranscriptionJob,
+        result: TranscriptionResult,
+        engine: TranscriptionEnginePort,
+        outcomes: list[RouteOutcome] | None,
+    ) -> None:
+        """Keep the transcript for later uploads of the same audio.
+
+        It is cached under the engine that answered, so a fallback
+        transcript is never served for the primary. Routed transcripts
+        mixing engines, or answered by engines not known here, are skipped.
+        """
+        if self._result_cache_max_entries <= 0:
+            return
+        audio_file = self._repository.get_audio_file(job.audio_file_id)
+        if audio_file is None or not audio_file.content_hash:
+            return
+        engine_name, parameters = engine.engine_name, engine.decoding_parameters
+        if outcomes is None and engine.route_outcomes() is not None:
+            logger.info(f"Job {job.id}: Not cached; answering engine unknown")
+            return
+        if outcomes:
+            if len({outcome.engine_name for outcome in outcomes}) > 1:
+                logger.info(f"Job {job.id}: Not cached; answered by {job.engine_name}")
+                return
+            engine_name = outcomes[0].engine_name
+            parameters = outcomes[0].decoding_parameters
+        cache_key = result_cache_key(
+            audio_file.content_hash, job.language, engine_name, parameters
+        )
+        try:
+            self._repository.save_cached_result(
+                cache_key, result, self._result_cache_max_entries
+            )
+        except Exception as e:
+            # The job itself succeeded; a cache miss later only costs time
+            logger.warning(f"Job {job.id}: Could not cache result: {e}")
+
+    def _fail(self, job: TranscriptionJob, error: Exception) -> None:
+        """Mark the job failed and schedule a retry if under the limit.
+
+        Once retries are exhausted the job's chunk checkpoints and live
+        transcript are deleted.
+        """
+        logger.exception(f"Job {job.id} failed: {error}")
+        job.fail(str(error))
+        self._repository.save_job(job)
+
+        # Attempt retry if under the limit
+        if job.retry_count < 3:
+            try:
+                job.retry()
+                self._repository.save_job(job)
+                logger.info(
+                    f"Job {job.id}: Scheduled retry {job.retry_count}/3"
+                )
+                return
+            except Exception as retry_error:
+                logger.error(
+                    f"Job {job.id}: Retry failed: {retry_error}"
+                )
+
+        # No attempt will resume from the checkpoints or extend the live
+        # transcript, so drop them
+        try:
+            self._repository.delete_chunk_results(job.id)
+            self._repository.delete_partial_segments(job.id)
+        except Exception as e:
+            logger.warning(f"Job {job.id}: Could not clear checkpoints: {e}")
+
+    def _convert(
         self,
         job_id: UUID,
-        audio_path: str,
-        language: str,
+        content_hash: str | None,
+        input_path: str,
+        output_path: str,
+    ) -> None:
+        """Convert input to the target WAV, consulting the conversion cache."""
+        cache = self._conversion_cache if content_hash else None
+        if cache and cache.fetch(
+            content_hash, TARGET_SAMPLE_RATE, TARGET_CHANNELS, output_path
+        ):
+            logger.info(f"Job {job_id}: Reused cached conversion")
+            return
+
+        converted = self._converter.convert_to_wav(
+            input_path, output_path, TARGET_SAMPLE_RATE, TARGET_CHANNELS
+        )
+        logger.info(f"Job {job_id}: Converted audio to WAV")
+
+        if cache and converted:
+            try:
+                cache.store(content_hash, TARGET_SAMPLE_RATE, TARGET_CHANNELS, output_path)
+            except OSError as e:
+                logger.warning(f"Job {job_id}: Could not cache conversion: {e}")
+
+    def _plan_chunks(
+        self,
+        engine: TranscriptionEnginePort,
+        job_id: UUID,
+        session: AudioSession,
         duration_ms: int,
-    ) -> str:
-        """Transcribe audio, splitting into chunks for long files."""
-        if not needs_chunking(duration_ms):
-            return self._engine.transcribe(audio_path, language)
+    ) -> list[tuple[int, int]] | None:
+        """Plan chunk cores (before overlap) sized for the engine.
+
+        Returns None when the audio fits in a single request.
+        """
+        budget = chunk_budget(engine.capabilities, TARGET_BYTES_PER_SECOND)
+        if not needs_chunking(duration_ms, budget.max_ms):
+            return None
 
-        logger.info(f"Job {job_id}: Audio is {duration_ms}ms — chunking enabled")
+        logger.info(
+            f"Job {job_id}: Audio is {duration_ms}ms — chunking enabled "
+            f"({budget.min_ms}-{budget.max_ms}ms per chunk)"
+        )
 
         # Detect silence boundaries and compute chunk regions
-        silence_segments = self._converter.detect_silence_boundaries(audio_path)
-        boundaries = compute_chunk_boundaries(silence_segments, duration_ms)
-        boundaries = add_overlap(boundaries)
+        silence_segments = session.detect_silence_boundaries()
+        boundaries = plan_chunk_boundaries(
+            silence_segments,
+            duration_ms,
+            target_ms=budget.target_ms,
+            min_ms=budget.min_ms,
+            max_ms=budget.max_ms,
+        )
+        cores = split_oversized(boundaries, budget.max_ms)
+        logger.info(f"Job {job_id}: Split into {len(cores)} chunks")
+        return cores
+
+    def _stored_chunk_plan(
+        self, engine: TranscriptionEnginePort, job_id: UUID, session: AudioSession
+    ) -> list[tuple[int, int]] | None:
+        """The chunk cores the parent job stored, planned again only if missing."""
+        cores = self._repository.get_chunk_plan(job_id)
+        if cores is None:
+            logger.warning(f"Job {job_id}: No stored chunk plan; planning again")
+            duration_ms = int(session.duration_seconds * 1000)
+            cores = self._plan_chunks(engine, job_id, session, duration_ms)
+        return cores
+
+    def _transcribe_audio(
+        self,
+        engine: TranscriptionEnginePort,
+        job: TranscriptionJob,
+        session: AudioSession,
+        cores: list[tuple[int, int]] | None,
+        republish_checkpoints: bool = True,
+    ) -> str:
+        """Transcribe audio whole, or chunk by chunk when a plan is given.
 
-        logger.info(f"Job {job_id}: Split into {len(boundaries)} chunks")
+        With republish_checkpoints, chunks reused from checkpoints are added
+        to the live transcript, which a new attempt starts empty.
+        """
+        job_id, language = job.id, job.language
+        if cores is None:
+            # Hand the engine the session's samples rather than the file
+            # path, so it does not read and decode the WAV a second time.
+            # prepare encodes them for upload exactly as it does chunks.
+            # Segments are published as the engine yields them.
+            audio = engine.prepare(session.full_view())
+            texts = []
+            for segment in engine.transcribe_stream(audio, language):
+                self._publish_partial(job, [segment])
+                if segment.text.strip():
+                    texts.append(segment.text.strip())
+            return " ".join(texts)
 
-        # Split audio into chunk files
-        chunk_paths = self._converter.split_at_boundaries(audio_path, boundaries)
+        boundaries = add_overlap(cores)
 
-        # Transcribe each chunk
-        chunk_texts: list[str] = []
-        for i, chunk_path in enumerate(chunk_paths):
-            logger.info(f"Job {job_id}: Transcribing chunk {i+1}/{len(chunk_paths)}")
-            text = self._engine.transcribe(chunk_path, language)
-            chunk_texts.append(text)
+        # Zero-copy views into the session buffer — no temp files to clean up
+        chunks = session.chunk_views(boundaries)
 
-            # Clean up temp chunk file
-            try:
-                os.unlink(chunk_path)
-            except OSError:
-                pass
+        # Reuse chunks checkpointed by an earlier attempt of this job, as
+        # long as the chunk covers exactly the same audio
+        audio_hashes = [chunk.content_hash() for chunk in chunks]
+        checkpoints = self._repository.get_chunk_results(job_id)
+        results = [
+            checkpoints.get((index, audio_hash))
+            for index, audio_hash in enumerate(audio_hashes)
+        ]
+        missing = [index for index, segments in enumerate(results) if segments is None]
+        if len(missing) < len(chunks):
+            logger.info(
+                f"Job {job_id}: Resuming — {len(chunks) - len(missing)} of "
+                f"{len(chunks)} chunks already transcribed"
+            )
+
+        def publish(index: int, segments: list[TranscriptSegment]) -> None:
+            self._publish_partial(
+                job, owned_segments(cores, index, boundaries[index][0], segments)
+            )
+
+        def checkpoint(position: int, segments: list[TranscriptSegment]) -> None:
+            index = missing[position]
+            results[index] = segments
+            self._repository.save_chunk_result(
+                job_id, index, audio_hashes[index], segments
+            )
+
+        # The live transcript restarted with this attempt; show the chunks
+        # it is not going to transcribe again
+        if republish_checkpoints:
+            for index, segments in enumerate(results):
+                if segments is not None:
+                    publish(index, segments)
+
+        # Stream chunks through engine.prepare and transcription; the next
+        # chunks are prepared while earlier ones are transcribed, segments
+        # are published as the engine yields them, and each result is
+        # checkpointed as it comes back
+        logger.info(f"Job {job_id}: Transcribing {len(missing)} chunks")
+        self._chunk_executor.transcribe_all(
+            engine,
+            [chunks[index] for index in missing],
+            language,
+            on_result=checkpoint,
+            on_segment=lambda position, segment: publish(missing[position], [segment]),
+        )
+        transcripts = [
+            ChunkTranscript(
+                offset_ms=start,
+                core_start_ms=core_start,
+                core_end_ms=core_end,
+                segments=tuple(segments),
+            )
+            for segments, (start, _), (core_start, core_end) in zip(
+                results, boundaries, cores
+            )
+        ]
 
-        # Stitch chunk transcriptions together
-        return stitch_transcriptions(chunk_texts)
+        # Resolve the overlaps by absolute time and join the chunks
+        return stitch_segments(transcripts)
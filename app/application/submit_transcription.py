@@ -1,14 +1,23 @@
+import dataclasses
+import hashlib
 import logging
 import os
-from uuid import UUID
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
 
 from app.application.dto import SubmitTranscriptionRequest, SubmitTranscriptionResponse
 from app.domain.entities.audio_file import AudioFile
 from app.domain.entities.transcription_job import TranscriptionJob
+from app.domain.entities.transcription_result import TranscriptionResult
+from app.domain.exceptions import AudioProbeError, InvalidAudioFormatError
 from app.domain.services.audio_validator import validate_audio_file
+from app.domain.services.result_cache import result_cache_key
+from app.domain.value_objects.job_status import JobStatus
+from app.ports.audio_converter import AudioConverterPort
 from app.ports.audio_storage import AudioStoragePort
 from app.ports.job_queue import JobQueuePort
 from app.ports.job_repository import JobRepositoryPort
+from app.ports.transcription_engine import TranscriptionEnginePort
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +29,17 @@ class SubmitTranscriptionUseCase:
         repository: JobRepositoryPort,
         queue: JobQueuePort,
         engine_name: str,
+        converter: AudioConverterPort | None = None,
+        engine: TranscriptionEnginePort | None = None,
     ) -> None:
         self._storage = storage
         self._repository = repository
         self._queue = queue
         self._engine_name = engine_name
+        self._converter = converter
+        # When set, re-uploads of already transcribed audio are answered
+        # from the result cache instead of being queued
+        self._engine = engine
 
     def execute(self, request: SubmitTranscriptionRequest) -> SubmitTranscriptionResponse:
         # Validate file format and size
@@ -33,12 +48,17 @@ class SubmitTranscriptionUseCase:
         # Store file
         storage_path = self._storage.store(request.filename, request.file_data)
 
+        # Read stream headers to reject undecodable uploads early
+        duration_seconds = self._probe_duration(request.filename, storage_path)
+
         # Create AudioFile entity
         audio_file = AudioFile(
             original_filename=request.filename,
             format=audio_format,
             size_bytes=len(request.file_data),
             storage_path=storage_path,
+            duration_seconds=duration_seconds,
+            content_hash=hashlib.sha256(request.file_data).hexdigest(),
         )
         self._repository.create_audio_file(audio_file)
 
@@ -47,16 +67,80 @@ class SubmitTranscriptionUseCase:
             audio_file_id=audio_file.id,
             language=request.language,
             engine_name=self._engine_name,
+            quality_tier=request.quality_tier,
         )
         self._repository.save_job(job)
 
-        # Enqueue for background processing
-        self._queue.enqueue(job.id)
-
-        logger.info(f"Submitted transcription job {job.id} for {request.filename}")
+        cached = self._find_cached_result(job, audio_file.content_hash)
+        if cached is not None:
+            self._complete_from_cache(job, cached)
+        else:
+            # Enqueue for background processing
+            self._queue.enqueue(job.id)
+            logger.info(f"Submitted transcription job {job.id} for {request.filename}")
 
         return SubmitTranscriptionResponse(
             job_id=job.id,
             status=job.status.value,
             redirect_url=f"/jobs/{job.id}",
         )
+
+    def _find_cached_result(
+        self, job: TranscriptionJob, content_hash: str
+    ) -> TranscriptionResult | None:
+        if self._engine is None:
+            return None
+        engine = self._engine.for_quality_tier(job.quality_tier)
+        cache_key = result_cache_key(
+            content_hash, job.language, engine.engine_name, engine.decoding_parameters
+        )
+        try:
+            return self._repository.get_cached_result(cache_key)
+        except Exception as e:
+            logger.warning(f"Result cache lookup failed for job {job.id}: {e}")
+            return None
+
+    def _complete_from_cache(
+        self, job: TranscriptionJob, cached: TranscriptionResult
+    ) -> None:
+        """Complete the job with a copy of an earlier job's transcript."""
+        result = dataclasses.replace(
+            cached,
+            id=uuid4(),
+            job_id=job.id,
+            processing_duration_seconds=0.0,
+            created_at=datetime.now(timezone.utc),
+        )
+        self._repository.save_result(result)
+
+        # The cached transcript may come from a fallback engine
+        job.engine_name = cached.engine_name
+        job.transition_to(JobStatus.CONVERTING)
+        job.transition_to(JobStatus.TRANSCRIBING)
+        job.transition_to(JobStatus.COMPLETED)
+        job.update_progress(100)
+        self._repository.save_job(job)
+        logger.info(f"Job {job.id}: Completed from result cache of job {cached.job_id}")
+
+    def _probe_duration(self, filename: str, storage_path: str) -> float | None:
+        """Probe the stored upload. Returns its duration, or None if unknown.
+
+        Raises InvalidAudioFormatError (after deleting the file) when the
+        upload is not readable audio.
+        """
+        if self._converter is None:
+            return None
+
+        absolute_path = self._storage.get_absolute_path(storage_path)
+        try:
+            metadata = self._converter.probe(absolute_path)
+        except AudioProbeError as e:
+            self._storage.delete(storage_path)
+            raise InvalidAudioFormatError(
+                f"'{filename}' could not be read as audio: {e}"
+            ) from e
+        except Exception as e:
+            logger.warning(f"Could not probe {filename}, skipping validation: {e}")
+            return None
+
+        return metadata.duration_seconds
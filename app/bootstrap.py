@@ -5,15 +5,20 @@ from dataclasses import dataclass
 
 from app.adapters.outbound.converter.pydub_converter import PydubAudioConverter
 from app.adapters.outbound.engines.faster_whisper_engine import FasterWhisperEngine
+from app.adapters.outbound.engines.model_registry import WhisperModelRegistry
 from app.adapters.outbound.persistence.sqlite_repository import SQLiteJobRepository
 from app.adapters.outbound.queue.rq_queue import RQJobQueue
+from app.adapters.outbound.storage.local_conversion_cache import LocalConversionCache
 from app.adapters.outbound.storage.local_file_storage import LocalFileStorage
+from app.application.chunk_executor import ChunkExecutor
 from app.application.get_job_status import GetJobStatusUseCase
 from app.application.process_transcription import ProcessTranscriptionUseCase
 from app.application.submit_transcription import SubmitTranscriptionUseCase
 from app.config import Settings, get_settings
+from app.domain.value_objects.quality_tier import QualityTier
 from app.ports.audio_converter import AudioConverterPort
 from app.ports.audio_storage import AudioStoragePort
+from app.ports.conversion_cache import ConversionCachePort
 from app.ports.job_queue import JobQueuePort
 from app.ports.job_repository import JobRepositoryPort
 from app.ports.transcription_engine import TranscriptionEnginePort
@@ -37,11 +42,90 @@ class Container:
 _container: Container | None = None
 
 
+def _create_converter(settings: Settings) -> AudioConverterPort:
+    converter_name = settings.audio_converter
+
+    if converter_name == "pydub":
+        return PydubAudioConverter()
+    elif converter_name == "ffmpeg":
+        from app.adapters.outbound.converter.ffmpeg_converter import (
+            FFmpegStreamingConverter,
+        )
+
+        return FFmpegStreamingConverter()
+    else:
+        raise ValueError(f"Unknown audio converter: {converter_name}")
+
+
+def _create_conversion_cache(settings: Settings) -> ConversionCachePort | None:
+    if settings.conversion_cache_max_bytes <= 0:
+        return None
+    return LocalConversionCache(
+        cache_dir=settings.conversion_cache_dir,
+        max_bytes=settings.conversion_cache_max_bytes,
+    )
+
+
+def _parse_tier_models(value: str) -> dict[QualityTier, str]:
+    """Parse "tier=model,..." pairs, e.g. "fast=small,accurate=large-v3"."""
+    tier_models = {}
+    for pair in filter(None, (item.strip() for item in value.split(","))):
+        tier, _, model = pair.partition("=")
+        tier_models[QualityTier(tier.strip().lower())] = model.strip()
+    return tier_models
+
+
 def _create_engine(settings: Settings) -> TranscriptionEnginePort:
-    engine_name = settings.transcription_engine
+    primary = _create_single_engine(settings.transcription_engine, settings)
+    if not (settings.hedge_engine or settings.fallback_engine):
+        return primary
+
+    from app.adapters.outbound.engines.routed_engine import RoutedEngine
+
+    def resolve(engine_name: str) -> TranscriptionEnginePort | None:
+        if not engine_name:
+            return None
+        if engine_name == settings.transcription_engine:
+            # Hedge with a duplicate request to the same provider
+            return primary
+        return _create_single_engine(engine_name, settings)
+
+    return RoutedEngine(
+        primary,
+        hedge=resolve(settings.hedge_engine),
+        fallback=resolve(settings.fallback_engine),
+        default_hedge_delay_seconds=settings.hedge_delay_seconds,
+        timeout_seconds=settings.engine_timeout_seconds,
+    )
 
+
+def _create_single_engine(
+    engine_name: str, settings: Settings
+) -> TranscriptionEnginePort:
     if engine_name == "faster-whisper":
-        return FasterWhisperEngine(model_size=settings.faster_whisper_model)
+        model_options = dict(
+            model_size=settings.faster_whisper_model,
+            device=settings.faster_whisper_device,
+            compute_type=settings.faster_whisper_compute_type,
+            cpu_threads=settings.faster_whisper_cpu_threads,
+            num_workers=settings.faster_whisper_num_workers,
+            beam_size=settings.faster_whisper_beam_size,
+            registry=WhisperModelRegistry(settings.faster_whisper_memory_budget_bytes),
+            tier_models=_parse_tier_models(settings.faster_whisper_tier_models),
+        )
+        if settings.faster_whisper_batch_size > 1:
+            from app.adapters.outbound.engines.batched_faster_whisper_engine import (
+                BatchedFasterWhisperEngine,
+            )
+
+            return BatchedFasterWhisperEngine(
+                batch_size=settings.faster_whisper_batch_size,
+                max_wait_ms=settings.faster_whisper_batch_wait_ms,
+                **model_options,
+            )
+        return FasterWhisperEngine(**model_options)
+    elif engine_name in ("openai", "groq") and settings.async_api_client:
+        return _create_async_api_engine(engine_name, settings)
     elif engine_name == "openai":
         from app.adapters.outbound.engines.openai_engine import OpenAIEngine
 
@@ -57,6 +141,43 @@ def _create_engine(settings: Settings) -> TranscriptionEnginePort:
         raise ValueError(f"Unknown transcription engine: {engine_name}")
 
 
+def _create_async_api_engine(
+    engine_name: str, settings: Settings
+) -> TranscriptionEnginePort:
+    from app.adapters.outbound.engines.async_api_engine import AsyncAPIEngine
+    from app.adapters.outbound.engines.groq_engine import GROQ_BASE_URL
+    from app.adapters.outbound.engines.openai_engine import (
+        OPENAI_BASE_URL,
+        OPENAI_MODEL,
+    )
+    from app.adapters.outbound.engines.rate_limiter import RateLimiter
+
+    rate_limiter = RateLimiter(
+        requests_per_minute=settings.api_requests_per_minute,
+        audio_seconds_per_hour=settings.api_audio_seconds_per_hour,
+    )
+    if engine_name == "groq":
+        return AsyncAPIEngine(
+            name="groq",
+            base_url=GROQ_BASE_URL,
+            api_key=settings.groq_api_key,
+            model=settings.groq_model,
+            timestamps=True,
+            encoding="flac",
+            rate_limiter=rate_limiter,
+            max_connections=settings.api_max_connections,
+        )
+    return AsyncAPIEngine(
+        name="openai",
+        base_url=OPENAI_BASE_URL,
+        api_key=settings.openai_api_key,
+        model=OPENAI_MODEL,
+        encoding="opus",
+        rate_limiter=rate_limiter,
+        max_connections=settings.api_max_connections,
+    )
+
+
 def bootstrap(settings: Settings | None = None) -> Container:
     """Create and wire all dependencies. Returns a Container."""
     global _container
@@ -74,7 +195,7 @@ def bootstrap(settings: Settings | None = None) -> Container:
     # Outbound adapters
     repository = SQLiteJobRepository(db_path=settings.sqlite_path)
     storage = LocalFileStorage(base_dir=settings.uploads_dir)
-    converter = PydubAudioConverter()
+    converter = _create_converter(settings)
     engine = _create_engine(settings)
     queue = RQJobQueue(redis_url=settings.redis_url)
 
@@ -84,6 +205,8 @@ def bootstrap(settings: Settings | None = None) -> Container:
         repository=repository,
         queue=queue,
         engine_name=engine.engine_name,
+        converter=converter,
+        engine=engine if settings.result_cache_max_entries > 0 else None,
     )
 
     process_transcription = ProcessTranscriptionUseCase(
@@ -91,6 +214,15 @@ def bootstrap(settings: Settings | None = None) -> Container:
         storage=storage,
         converter=converter,
         engine=engine,
+        conversion_cache=_create_conversion_cache(settings),
+        chunk_executor=ChunkExecutor(
+            api_workers=settings.chunk_concurrency,
+            local_workers=settings.local_chunk_processes,
+            max_retries=settings.chunk_max_retries,
+            prefetch=settings.chunk_prefetch,
+        ),
+        chunk_queue=queue if settings.distribute_chunks else None,
+        result_cache_max_entries=settings.result_cache_max_entries,
     )
 
     get_job_status = GetJobStatusUseCase(repository=repository)
@@ -1,7 +1,28 @@
+import json
 import os
 from dataclasses import dataclass, field
 
 
+def faster_whisper_profile_path() -> str:
+    """Where the tune command writes, and Settings reads, the host profile."""
+    return os.environ.get(
+        "FASTER_WHISPER_PROFILE",
+        os.path.join(os.environ.get("DATA_DIR", "./DATA"), "faster_whisper_profile.json"),
+    )
+
+
+def _profile_setting(env_var: str, key: str, default: str) -> str:
+    """Read a setting from the environment, else the tuned profile, else default."""
+    if env_var in os.environ:
+        return os.environ[env_var]
+    try:
+        with open(faster_whisper_profile_path()) as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return default
+    return str(profile.get(key, default))
+
+
 @dataclass(frozen=True)
 class Settings:
     transcription_engine: str = field(
@@ -26,11 +47,66 @@ class Settings:
         default_factory=lambda: os.environ.get("DEFAULT_LANGUAGE", "pt-BR")
     )
     max_upload_size_bytes: int = 524_288_000  # 500 MB
+    # "pydub" decodes whole files in memory; "ffmpeg" streams them
+    audio_converter: str = field(
+        default_factory=lambda: os.environ.get("AUDIO_CONVERTER", "pydub")
+    )
+    # Converted WAVs kept by upload content hash, oldest evicted first
+    conversion_cache_max_bytes: int = field(
+        default_factory=lambda: int(
+            os.environ.get("CONVERSION_CACHE_MAX_BYTES", 2 * 1024**3)
+        )
+    )
     faster_whisper_model: str = field(
         default_factory=lambda: os.environ.get(
             "FASTER_WHISPER_MODEL", "large-v3-turbo"
         )
     )
+    # Compute settings measured by `python -m app.adapters.inbound.tune`;
+    # environment variables override the profile
+    faster_whisper_device: str = field(
+        default_factory=lambda: _profile_setting(
+            "FASTER_WHISPER_DEVICE", "device", "auto"
+        )
+    )
+    faster_whisper_compute_type: str = field(
+        default_factory=lambda: _profile_setting(
+            "FASTER_WHISPER_COMPUTE_TYPE", "compute_type", "int8"
+        )
+    )
+    faster_whisper_cpu_threads: int = field(
+        default_factory=lambda: int(
+            _profile_setting("FASTER_WHISPER_CPU_THREADS", "cpu_threads", "0")
+        )
+    )
+    faster_whisper_num_workers: int = field(
+        default_factory=lambda: int(
+            _profile_setting("FASTER_WHISPER_NUM_WORKERS", "num_workers", "1")
+        )
+    )
+    faster_whisper_beam_size: int = field(
+        default_factory=lambda: int(
+            _profile_setting("FASTER_WHISPER_BEAM_SIZE", "beam_size", "5")
+        )
+    )
+    faster_whisper_batch_size: int = field(
+        default_factory=lambda: int(os.environ.get("FASTER_WHISPER_BATCH_SIZE", "0"))
+    )
+    faster_whisper_batch_wait_ms: int = field(
+        default_factory=lambda: int(
+            os.environ.get("FASTER_WHISPER_BATCH_WAIT_MS", "50")
+        )
+    )
+    # Models for jobs that ask for a quality tier, e.g. "fast=small,accurate=large-v3";
+    # jobs without a tier, or with an unlisted one, use faster_whisper_model
+    faster_whisper_tier_models: str = field(
+        default_factory=lambda: os.environ.get("FASTER_WHISPER_TIER_MODELS", "")
+    )
+    faster_whisper_memory_budget_bytes: int = field(
+        default_factory=lambda: int(
+            os.environ.get("FASTER_WHISPER_MEMORY_BUDGET_BYTES", 4 * 1024**3)
+        )
+    )
     groq_api_key: str = field(
         default_factory=lambda: os.environ.get("GROQ_API_KEY", "")
     )
@@ -39,6 +115,60 @@ class Settings:
             "GROQ_MODEL", "whisper-large-v3"
         )
     )
+    # Send OpenAI/Groq requests through the async pooled client, which
+    # queues requests that would exceed the limits below (0 = no limit).
+    # The limits apply per process: with N workers, set each to 1/N of
+    # the provider's quota
+    async_api_client: bool = field(
+        default_factory=lambda: os.environ.get("ASYNC_API_CLIENT", "false").lower()
+        in ("1", "true", "yes")
+    )
+    api_requests_per_minute: int = field(
+        default_factory=lambda: int(os.environ.get("API_REQUESTS_PER_MINUTE", "0"))
+    )
+    api_audio_seconds_per_hour: int = field(
+        default_factory=lambda: int(os.environ.get("API_AUDIO_SECONDS_PER_HOUR", "0"))
+    )
+    api_max_connections: int = field(
+        default_factory=lambda: int(os.environ.get("API_MAX_CONNECTIONS", "8"))
+    )
+    # Completed transcripts kept per audio hash, language, engine and model;
+    # uploads of the same audio complete without transcribing (0 = off)
+    result_cache_max_entries: int = field(
+        default_factory=lambda: int(os.environ.get("RESULT_CACHE_MAX_ENTRIES", "1000"))
+    )
+    # Optional engines around TRANSCRIPTION_ENGINE: a hedge gets a duplicate
+    # of requests slower than the primary's p95 (HEDGE_DELAY_SECONDS until
+    # enough requests are measured); the fallback takes requests when the
+    # primary's circuit is open or it fails or times out
+    hedge_engine: str = field(
+        default_factory=lambda: os.environ.get("HEDGE_ENGINE", "")
+    )
+    fallback_engine: str = field(
+        default_factory=lambda: os.environ.get("FALLBACK_ENGINE", "")
+    )
+    hedge_delay_seconds: float = field(
+        default_factory=lambda: float(os.environ.get("HEDGE_DELAY_SECONDS", "10"))
+    )
+    engine_timeout_seconds: float = field(
+        default_factory=lambda: float(os.environ.get("ENGINE_TIMEOUT_SECONDS", "300"))
+    )
+    chunk_concurrency: int = field(
+        default_factory=lambda: int(os.environ.get("CHUNK_CONCURRENCY", "4"))
+    )
+    local_chunk_processes: int = field(
+        default_factory=lambda: int(os.environ.get("LOCAL_CHUNK_PROCESSES", "1"))
+    )
+    chunk_max_retries: int = field(
+        default_factory=lambda: int(os.environ.get("CHUNK_MAX_RETRIES", "2"))
+    )
+    chunk_prefetch: int = field(
+        default_factory=lambda: int(os.environ.get("CHUNK_PREFETCH", "2"))
+    )
+    distribute_chunks: bool = field(
+        default_factory=lambda: os.environ.get("DISTRIBUTE_CHUNKS", "false").lower()
+        in ("1", "true", "yes")
+    )
 
     @property
     def sqlite_path(self) -> str:
@@ -52,6 +182,10 @@ class Settings:
     def uploads_dir(self) -> str:
         return os.path.join(self.data_dir, "uploads")
 
+    @property
+    def conversion_cache_dir(self) -> str:
+        return os.path.join(self.data_dir, "cache", "converted")
+
 
 def get_settings() -> Settings:
     return Settings()
@@ -20,6 +20,7 @@ class AudioFile:
         default_factory=lambda: datetime.now(timezone.utc)
     )
     converted_path: str | None = None
+    content_hash: str | None = None
 
     def __post_init__(self) -> None:
         self._validate()
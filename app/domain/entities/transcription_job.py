@@ -4,6 +4,7 @@ from uuid import UUID, uuid4
 
 from app.domain.exceptions import InvalidStateTransitionError, MaxRetriesExceededError
 from app.domain.value_objects.job_status import JobStatus
+from app.domain.value_objects.quality_tier import QualityTier
 
 MAX_RETRIES = 3
 
@@ -24,6 +25,9 @@ class TranscriptionJob:
     )
     error_message: str | None = None
     retry_count: int = 0
+    conversion_skipped: bool = False
+    # None runs the deployment's default model
+    quality_tier: QualityTier | None = None
 
     def transition_to(self, new_status: JobStatus) -> None:
         """Transition job to a new status following the state machine rules."""
@@ -10,6 +10,8 @@ class TranscriptionResult:
     language: str
     engine_name: str
     processing_duration_seconds: float
+    # Time the answering engine(s) spent on the requests, when routed
+    engine_latency_seconds: float | None = None
     id: UUID = field(default_factory=uuid4)
     created_at: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc)
@@ -31,3 +31,11 @@ class StorageError(DomainError):
 
 class MaxRetriesExceededError(DomainError):
     """Raised when a job exceeds its maximum retry count."""
+
+
+class AudioProbeError(DomainError):
+    """Raised when audio metadata cannot be read from a file."""
+
+
+class EngineLimitsError(DomainError):
+    """Raised when an engine's request limits leave no room for a chunk."""
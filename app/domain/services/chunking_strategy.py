@@ -1,14 +1,78 @@
 """Chunking strategy for splitting long audio files at silence boundaries."""
 
+import math
+from dataclasses import dataclass, replace
+
+from app.domain.exceptions import EngineLimitsError
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.transcript_segment import (
+    ChunkTranscript,
+    TranscriptSegment,
+)
+
 CHUNK_DURATION_MIN_MS = 5 * 60 * 1000  # 5 minutes
 CHUNK_DURATION_MAX_MS = 10 * 60 * 1000  # 10 minutes
+CHUNK_DURATION_TARGET_MS = 8 * 60 * 1000  # 8 minutes
 LONG_FILE_THRESHOLD_MS = 10 * 60 * 1000  # 10 minutes
 OVERLAP_MS = 500  # 0.5 second overlap between chunks
+MIN_CHUNK_BUDGET_MS = 1000  # shortest chunk core an engine must accept
+DEEP_GAP_MS = 2000  # pauses this long or longer count as ideal cut points
+GAP_WEIGHT = 0.5
+CHUNK_COST = 2.0  # per request, in units of squared relative deviation
+SHORT_CHUNK_PENALTY = 1.0
+PLANNER_MAX_SEGMENTS = 20_000  # above this, fall back to the greedy pass
+MAX_TO_TARGET_RATIO = 1.25
+MIN_TO_TARGET_RATIO = 0.625
+DEDUP_WINDOW_WORDS = 10  # words compared when deduplicating chunk overlap
+_PUNCTUATION = ".,;:!?¿¡…\"'“”‘’«»()[]-—–"
+
+
+@dataclass(frozen=True)
+class ChunkBudget:
+    """Chunk length bounds (ms) for one engine."""
+
+    target_ms: int = CHUNK_DURATION_TARGET_MS
+    min_ms: int = CHUNK_DURATION_MIN_MS
+    max_ms: int = CHUNK_DURATION_MAX_MS
+
+
+def chunk_budget(
+    capabilities: EngineCapabilities,
+    bytes_per_second: int,
+    overlap_ms: int = OVERLAP_MS,
+) -> ChunkBudget:
+    """Derive chunk bounds from an engine's preferred length and hard limits.
+
+    The default preference (8 minutes) reproduces the 5/8/10 minute bounds.
+    Hard limits (upload size at the given bitrate, request duration) cap the
+    maximum, leaving room for the overlap added on both sides of a chunk.
+    Raises EngineLimitsError when that leaves less than MIN_CHUNK_BUDGET_MS.
+    """
+    target_ms = int(capabilities.preferred_chunk_seconds * 1000)
+    max_ms = round(target_ms * MAX_TO_TARGET_RATIO)
+
+    request_ms = capabilities.max_request_ms(bytes_per_second)
+    if request_ms is not None:
+        max_ms = min(max_ms, request_ms - 2 * overlap_ms)
+        target_ms = min(target_ms, max_ms)
 
+    if max_ms < MIN_CHUNK_BUDGET_MS:
+        raise EngineLimitsError(
+            f"Engine limits leave {max_ms}ms of audio per chunk; "
+            f"at least {MIN_CHUNK_BUDGET_MS}ms plus {2 * overlap_ms}ms of overlap "
+            f"must fit in one request"
+        )
 
-def needs_chunking(duration_ms: int) -> bool:
+    return ChunkBudget(
+        target_ms=target_ms,
+        min_ms=round(target_ms * MIN_TO_TARGET_RATIO),
+        max_ms=max_ms,
+    )
+
+
+def needs_chunking(duration_ms: int, threshold_ms: int = LONG_FILE_THRESHOLD_MS) -> bool:
     """Return True if the audio is long enough to benefit from chunking."""
-    return duration_ms > LONG_FILE_THRESHOLD_MS
+    return duration_ms > threshold_ms
 
 
 def compute_chunk_boundaries(
@@ -47,6 +111,91 @@ def compute_chunk_boundaries(
     return chunks
 
 
+def plan_chunk_boundaries(
+    silence_boundaries: list[tuple[int, int]],
+    total_duration_ms: int,
+    target_ms: int = CHUNK_DURATION_TARGET_MS,
+    min_ms: int = CHUNK_DURATION_MIN_MS,
+    max_ms: int = CHUNK_DURATION_MAX_MS,
+) -> list[tuple[int, int]]:
+    """Plan chunk boundaries from silence segments with dynamic programming.
+
+    Given a list of non-silent (start_ms, end_ms) segments, groups them into
+    chunks of at most max_ms (a single segment longer than that becomes its
+    own chunk), cutting only in the gaps between segments. It picks the
+    grouping with the lowest total cost, where:
+
+    - each chunk costs CHUNK_COST (every request has a fixed overhead),
+      plus its squared relative deviation from target_ms, plus
+      SHORT_CHUNK_PENALTY if it is shorter than min_ms;
+    - each cut costs up to GAP_WEIGHT, less the deeper the pause it falls
+      in (nothing at DEEP_GAP_MS or more).
+
+    Falls back to compute_chunk_boundaries for very large segment lists.
+
+    Returns list of (chunk_start_ms, chunk_end_ms) tuples.
+    """
+    if not silence_boundaries:
+        return [(0, total_duration_ms)]
+    if len(silence_boundaries) > PLANNER_MAX_SEGMENTS:
+        return compute_chunk_boundaries(silence_boundaries, total_duration_ms)
+
+    segments = silence_boundaries
+    n = len(segments)
+
+    # best[j]: cost of the best plan covering segments[:j] whose last chunk
+    # ends with segments[j - 1]; cut_at[j]: where that last chunk starts.
+    best: list[float] = [math.inf] * (n + 1)
+    cut_at = [0] * (n + 1)
+    best[0] = 0.0
+
+    for j in range(1, n + 1):
+        chunk_end = segments[j - 1][1]
+        cut_cost = 0.0
+        if j < n:
+            gap = segments[j][0] - chunk_end
+            cut_cost = GAP_WEIGHT * (1 - min(max(gap, 0), DEEP_GAP_MS) / DEEP_GAP_MS)
+
+        for i in range(j - 1, -1, -1):
+            length = chunk_end - segments[i][0]
+            if length > max_ms and i < j - 1:
+                break
+            chunk_cost = CHUNK_COST + ((length - target_ms) / target_ms) ** 2
+            if length < min_ms:
+                chunk_cost += SHORT_CHUNK_PENALTY
+            candidate = best[i] + chunk_cost + cut_cost
+            if candidate < best[j]:
+                best[j] = candidate
+                cut_at[j] = i
+
+    chunks: list[tuple[int, int]] = []
+    j = n
+    while j > 0:
+        i = cut_at[j]
+        chunks.append((segments[i][0], segments[j - 1][1]))
+        j = i
+    chunks.reverse()
+    return chunks
+
+
+def split_oversized(
+    boundaries: list[tuple[int, int]],
+    max_ms: int,
+) -> list[tuple[int, int]]:
+    """Cut chunks longer than max_ms into equal parts.
+
+    Used when a single stretch of speech has no pause to split at but the
+    engine cannot accept it in one request.
+    """
+    result: list[tuple[int, int]] = []
+    for start, end in boundaries:
+        parts = math.ceil((end - start) / max_ms) if end - start > max_ms else 1
+        step = (end - start) / parts
+        for k in range(parts):
+            result.append((start + round(k * step), start + round((k + 1) * step)))
+    return result
+
+
 def add_overlap(
     boundaries: list[tuple[int, int]],
     overlap_ms: int = OVERLAP_MS,
@@ -68,42 +217,110 @@ def add_overlap(
     return result
 
 
+def _normalize_token(token: str) -> str:
+    return token.strip(_PUNCTUATION).casefold()
+
+
 def stitch_transcriptions(texts: list[str]) -> str:
     """Stitch transcription texts from chunks into a seamless result.
 
-    Removes duplicate sentences at chunk boundaries caused by overlap.
+    Removes duplicate words at chunk boundaries caused by overlap. Words are
+    compared without surrounding punctuation and case, and only the tail of
+    the text stitched so far is kept for comparison, so the pass is linear.
     """
-    if not texts:
-        return ""
+    result_parts: list[str] = []
+    tail: list[str] = []  # normalized last words of the stitched text
 
-    if len(texts) == 1:
-        return texts[0].strip()
+    for text in texts:
+        tokens = text.split()
+        if not tokens:
+            continue
 
-    result_parts = [texts[0].strip()]
+        # If the beginning of this chunk repeats the end of the previous
+        # result, skip the repeated words.
+        head = [_normalize_token(t) for t in tokens[:DEDUP_WINDOW_WORDS]]
+        for length in range(min(len(tail), len(head)), 0, -1):
+            if tail[-length:] == head[:length]:
+                tokens = tokens[length:]
+                break
 
-    for text in texts[1:]:
-        stripped = text.strip()
-        if not stripped:
-            continue
+        if tokens:
+            result_parts.append(" ".join(tokens))
+            tail = (tail + [_normalize_token(t) for t in tokens[-DEDUP_WINDOW_WORDS:]])[
+                -DEDUP_WINDOW_WORDS:
+            ]
 
-        # Simple dedup: if the beginning of the next chunk overlaps
-        # with the end of the previous result, skip the overlap.
-        prev = result_parts[-1]
-        if prev and stripped:
-            # Check if last sentence of prev matches first sentence of current
-            prev_words = prev.split()[-10:]  # last ~10 words
-            curr_words = stripped.split()[:10]  # first ~10 words
+    return " ".join(result_parts)
 
-            overlap_len = 0
-            for length in range(min(len(prev_words), len(curr_words)), 0, -1):
-                if prev_words[-length:] == curr_words[:length]:
-                    overlap_len = length
-                    break
 
-            if overlap_len > 0:
-                stripped = " ".join(stripped.split()[overlap_len:])
+def owned_segments(
+    cores: list[tuple[int, int]],
+    index: int,
+    offset_ms: int,
+    segments: list[TranscriptSegment],
+) -> list[TranscriptSegment]:
+    """Segments of one chunk moved onto the file timeline, overlap dropped.
 
-        if stripped:
-            result_parts.append(stripped)
+    Keeps the segments whose midpoint falls in the stretch of the timeline
+    chunk ``index`` owns, as in stitch_segments. Chunks can be previewed
+    this way as they finish, in any order; the final text still comes from
+    stitch_segments.
+    """
+    owned_from = (cores[index - 1][1] + cores[index][0]) / 2 if index > 0 else -math.inf
+    owned_to = (
+        (cores[index][1] + cores[index + 1][0]) / 2
+        if index < len(cores) - 1
+        else math.inf
+    )
+    owned = []
+    for segment in segments:
+        midpoint = offset_ms + (segment.start_ms + segment.end_ms) / 2
+        if owned_from <= midpoint < owned_to:
+            owned.append(
+                replace(
+                    segment,
+                    start_ms=segment.start_ms + offset_ms,
+                    end_ms=segment.end_ms + offset_ms,
+                    words=(),
+                )
+            )
+    return owned
 
-    return " ".join(result_parts)
+
+def stitch_segments(chunks: list[ChunkTranscript]) -> str:
+    """Stitch timed chunk transcripts by absolute time in one linear pass.
+
+    Each chunk owns the stretch of the timeline from the middle of the gap
+    before its core to the middle of the gap after it. A word (or, without
+    word timings, a whole segment) is kept only by the chunk that owns its
+    midpoint, which resolves the add_overlap regions without comparing
+    text. If any chunk lacks word timings, the per-chunk texts are
+    additionally deduplicated with stitch_transcriptions.
+    """
+    cuts = [
+        (current.core_end_ms + following.core_start_ms) / 2
+        for current, following in zip(chunks, chunks[1:])
+    ]
+    word_timed = True
+    texts: list[str] = []
+
+    for k, chunk in enumerate(chunks):
+        owned_from = cuts[k - 1] if k > 0 else -math.inf
+        owned_to = cuts[k] if k < len(cuts) else math.inf
+        pieces: list[str] = []
+        for segment in chunk.segments:
+            if segment.words:
+                timed = segment.words
+            else:
+                timed = (segment,)
+                if segment.text.strip():
+                    word_timed = False
+            for item in timed:
+                midpoint = chunk.offset_ms + (item.start_ms + item.end_ms) / 2
+                if owned_from <= midpoint < owned_to and item.text.strip():
+                    pieces.append(item.text.strip())
+        texts.append(" ".join(pieces))
+
+    if word_timed:
+        return " ".join(text for text in texts if text)
+    return stitch_transcriptions(texts)
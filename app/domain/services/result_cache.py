@@ -0,0 +1,26 @@
+import hashlib
+import json
+from collections.abc import Mapping
+
+
+def result_cache_key(
+    content_hash: str,
+    language: str,
+    engine_name: str,
+    decoding_parameters: Mapping[str, object],
+) -> str:
+    """Key of a transcript in the result cache.
+
+    The same audio transcribed in the same language by the same engine,
+    model and decoding settings yields the same text, so it shares a key.
+    """
+    payload = json.dumps(
+        {
+            "audio": content_hash,
+            "language": language,
+            "engine": engine_name,
+            "parameters": dict(decoding_parameters),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
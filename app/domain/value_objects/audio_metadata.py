@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AudioMetadata:
+    """Stream properties read from container headers, without decoding."""
+
+    duration_seconds: float
+    sample_rate: int
+    channels: int
+    codec: str = ""
+    bits_per_sample: int | None = None
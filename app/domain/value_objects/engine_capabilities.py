@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+WAV_HEADER_BYTES = 44
+
+
+@dataclass(frozen=True)
+class EngineCapabilities:
+    """Request limits and chunking preferences advertised by an engine.
+
+    None means the engine imposes no limit of that kind.
+    """
+
+    max_upload_bytes: int | None = None
+    max_duration_seconds: float | None = None
+    preferred_chunk_seconds: float = 480.0
+    preferred_encoding: str = "wav"
+    runs_locally: bool = False
+    # Requests the engine folds into one batched decode when they arrive together
+    batch_size: int = 1
+
+    def max_request_ms(self, bytes_per_second: int) -> int | None:
+        """Longest audio (ms) a single request may carry, or None if unbounded."""
+        limits = []
+        if self.max_duration_seconds is not None:
+            limits.append(int(self.max_duration_seconds * 1000))
+        if self.max_upload_bytes is not None:
+            payload = self.max_upload_bytes - WAV_HEADER_BYTES
+            limits.append(payload * 1000 // bytes_per_second)
+        return min(limits) if limits else None
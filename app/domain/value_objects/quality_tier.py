@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class QualityTier(str, Enum):
+    """Speed/accuracy trade-off a job asks for; engines map it to a model."""
+
+    FAST = "fast"
+    BALANCED = "balanced"
+    ACCURATE = "accurate"
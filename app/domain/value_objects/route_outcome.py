@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class RouteOutcome:
+    """Which engine answered one routed request, and how long it took."""
+
+    engine_name: str
+    latency_seconds: float
+    hedged: bool = False
+    fell_back: bool = False
+    # Settings of the engine that answered, for the result cache key
+    decoding_parameters: dict[str, object] = field(default_factory=dict)
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TimedWord:
+    """A recognized word with times (ms) relative to the transcribed audio."""
+
+    start_ms: int
+    end_ms: int
+    text: str
+
+
+@dataclass(frozen=True)
+class TranscriptSegment:
+    """A span of recognized speech with times (ms) relative to the audio.
+
+    ``words`` is empty when the engine does not report word timings.
+    """
+
+    start_ms: int
+    end_ms: int
+    text: str
+    words: tuple[TimedWord, ...] = ()
+
+
+@dataclass(frozen=True)
+class ChunkTranscript:
+    """Segments of one chunk, placed on the timeline of the whole file.
+
+    ``offset_ms`` is where the chunk audio (including overlap) starts;
+    ``core_start_ms``/``core_end_ms`` delimit the chunk before overlap
+    was added.
+    """
+
+    offset_ms: int
+    core_start_ms: int
+    core_end_ms: int
+    segments: tuple[TranscriptSegment, ...]
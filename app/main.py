@@ -12,9 +12,10 @@ from app.bootstrap import bootstrap, get_container
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Bootstrap the application on startup."""
-    bootstrap()
+    """Bootstrap the application on startup; release engine clients on shutdown."""
+    container = bootstrap()
     yield
+    container.engine.close()
 
 
 def create_app() -> FastAPI:
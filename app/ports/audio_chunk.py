@@ -0,0 +1,199 @@
+import hashlib
+import io
+import struct
+
+import numpy as np
+
+PCM16_MAX = 32768.0
+
+
+class _WavReader(io.RawIOBase):
+    """Read-only file object serving a WAV header followed by a PCM view.
+
+    Bytes are produced on demand from the underlying array, so the chunk is
+    never copied into a single contiguous buffer.
+    """
+
+    def __init__(self, header: bytes, pcm: memoryview, name: str) -> None:
+        self._header = header
+        self._pcm = pcm
+        self._size = len(header) + len(pcm)
+        self._position = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        target = memoryview(buffer).cast("B")
+        written = 0
+        header_len = len(self._header)
+        while written < len(target) and self._position < self._size:
+            if self._position < header_len:
+                source = self._header[self._position:]
+            else:
+                source = self._pcm[self._position - header_len:]
+            count = min(len(source), len(target) - written)
+            target[written:written + count] = source[:count]
+            written += count
+            self._position += count
+        return written
+
+
+class AudioChunk:
+    """A time range of 16-bit PCM audio backed by a zero-copy array view.
+
+    Engines consume the samples directly (``to_float32``) or, when they
+    need a file upload, ``open()`` a WAV stream that is materialized
+    lazily from the same view.
+    """
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        channels: int = 1,
+        start_ms: int = 0,
+        index: int = 0,
+    ) -> None:
+        if samples.dtype.kind != "i" or samples.dtype.itemsize != 2:
+            raise ValueError(f"AudioChunk requires int16 samples, got {samples.dtype}")
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.start_ms = start_ms
+        self.index = index
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.samples) // self.channels
+
+    @property
+    def duration_ms(self) -> int:
+        return round(1000 * self.frame_count / self.sample_rate)
+
+    @property
+    def end_ms(self) -> int:
+        return self.start_ms + self.duration_ms
+
+    @property
+    def name(self) -> str:
+        return f"chunk_{self.index:03d}_{self.start_ms}-{self.end_ms}ms.wav"
+
+    @property
+    def wav_size_bytes(self) -> int:
+        return 44 + self.samples.nbytes
+
+    def content_hash(self) -> str:
+        """SHA-256 of the sample format and PCM data of the chunk."""
+        digest = hashlib.sha256(f"{self.sample_rate}:{self.channels}:".encode())
+        digest.update(memoryview(np.ascontiguousarray(self.samples)).cast("B"))
+        return digest.hexdigest()
+
+    def to_float32(self) -> np.ndarray:
+        """Return samples scaled to [-1, 1) as float32, downmixed to mono."""
+        audio = self.samples.astype(np.float32) / PCM16_MAX
+        if self.channels > 1:
+            audio = audio.reshape(-1, self.channels).mean(axis=1)
+        return audio
+
+    def _wav_header(self) -> bytes:
+        data_size = self.samples.nbytes
+        block_align = self.channels * 2
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + data_size,
+            b"WAVE",
+            b"fmt ",
+            16,
+            1,  # PCM
+            self.channels,
+            self.sample_rate,
+            self.sample_rate * block_align,
+            block_align,
+            16,
+            b"data",
+            data_size,
+        )
+
+    def open(self) -> io.BufferedReader:
+        """Open the chunk as a readable, seekable WAV file object."""
+        pcm = memoryview(np.ascontiguousarray(self.samples)).cast("B")
+        return io.BufferedReader(_WavReader(self._wav_header(), pcm, self.name))
+
+    def load(self) -> "AudioChunk":
+        """Return a copy whose samples are resident in memory.
+
+        Reading a memory-mapped view pages it in from disk; doing that ahead
+        of time keeps the I/O off the transcription path.
+        """
+        return AudioChunk(
+            np.array(self.samples),
+            self.sample_rate,
+            channels=self.channels,
+            start_ms=self.start_ms,
+            index=self.index,
+        )
+
+    def encode_wav(self) -> "EncodedAudio":
+        """Materialize the chunk as an in-memory WAV file."""
+        with self.open() as f:
+            data = f.read()
+        return EncodedAudio(
+            data, self.name, self.duration_ms, start_ms=self.start_ms, index=self.index
+        )
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class EncodedAudio:
+    """A chunk already encoded into an upload-ready file image."""
+
+    def __init__(
+        self,
+        data: bytes,
+        name: str,
+        duration_ms: int,
+        start_ms: int = 0,
+        index: int = 0,
+    ) -> None:
+        self.data = data
+        self.name = name
+        self.duration_ms = duration_ms
+        self.start_ms = start_ms
+        self.index = index
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.data)
+
+    def open(self) -> io.BytesIO:
+        """Open the encoded file image as a readable binary file object."""
+        f = io.BytesIO(self.data)
+        f.name = self.name
+        return f
+
+    def __str__(self) -> str:
+        return self.name
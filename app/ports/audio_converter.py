@@ -1,5 +1,47 @@
 from abc import ABC, abstractmethod
 
+from app.domain.value_objects.audio_metadata import AudioMetadata
+from app.ports.audio_chunk import AudioChunk
+
+
+class AudioSession(ABC):
+    """Audio decoded once and kept in memory for the lifetime of a job.
+
+    Use as a context manager so the decoded buffer is released on exit.
+    """
+
+    @property
+    @abstractmethod
+    def duration_seconds(self) -> float:
+        """Duration of the decoded audio in seconds."""
+
+    @abstractmethod
+    def detect_silence_boundaries(
+        self, min_silence_ms: int = 500, silence_thresh_db: float = -40.0
+    ) -> list[tuple[int, int]]:
+        """Detect non-silent segments. Returns list of (start_ms, end_ms) tuples."""
+
+    @abstractmethod
+    def chunk_views(self, boundaries: list[tuple[int, int]]) -> list[AudioChunk]:
+        """Return zero-copy views of the given (start_ms, end_ms) ranges.
+
+        Views stay valid only while the session is open.
+        """
+
+    @abstractmethod
+    def full_view(self) -> AudioChunk:
+        """Return a zero-copy view of the whole audio, valid while the session is open."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the decoded audio buffer."""
+
+    def __enter__(self) -> "AudioSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
 
 class AudioConverterPort(ABC):
     @abstractmethod
@@ -12,13 +54,33 @@ class AudioConverterPort(ABC):
     ) -> bool:
         """Convert audio file to WAV format. Returns success status."""
 
+    @abstractmethod
+    def is_normalized(
+        self, audio_path: str, sample_rate: int = 16000, channels: int = 1
+    ) -> bool:
+        """True if the file is already 16-bit PCM WAV at the target rate and channels."""
+
+    @abstractmethod
+    def open_session(self, audio_path: str) -> AudioSession:
+        """Decode audio once and return a session reusing the decoded buffer."""
+
+    @abstractmethod
+    def probe(self, audio_path: str) -> AudioMetadata:
+        """Read duration, sample rate and channels from headers, without decoding.
+
+        Raises AudioProbeError if the file is not readable audio.
+        """
+
     @abstractmethod
     def get_duration_seconds(self, audio_path: str) -> float:
         """Get audio file duration in seconds."""
 
     @abstractmethod
     def detect_silence_boundaries(
-        self, audio_path: str, min_silence_ms: int = 500
+        self,
+        audio_path: str,
+        min_silence_ms: int = 500,
+        silence_thresh_db: float = -40.0,
     ) -> list[tuple[int, int]]:
         """Detect non-silent segments. Returns list of (start_ms, end_ms) tuples."""
 
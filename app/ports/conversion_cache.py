@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class ConversionCachePort(ABC):
+    """Converted WAVs keyed by source content hash and conversion parameters."""
+
+    @abstractmethod
+    def fetch(
+        self, content_hash: str, sample_rate: int, channels: int, dest_path: str
+    ) -> bool:
+        """Place a cached conversion at dest_path. Returns False on a miss."""
+
+    @abstractmethod
+    def store(
+        self, content_hash: str, sample_rate: int, channels: int, wav_path: str
+    ) -> None:
+        """Add a converted WAV to the cache, evicting old entries if needed."""
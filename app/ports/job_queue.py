@@ -6,3 +6,7 @@ class JobQueuePort(ABC):
     @abstractmethod
     def enqueue(self, job_id: UUID) -> None:
         """Submit job for background processing."""
+
+    @abstractmethod
+    def enqueue_chunks(self, job_id: UUID, chunk_count: int) -> None:
+        """Submit one sub-job per chunk, then a reducer that runs after all of them."""
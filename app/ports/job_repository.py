@@ -5,6 +5,7 @@ from app.domain.entities.audio_file import AudioFile
 from app.domain.entities.transcription_job import TranscriptionJob
 from app.domain.entities.transcription_result import TranscriptionResult
 from app.domain.value_objects.job_status import JobStatus
+from app.domain.value_objects.transcript_segment import TranscriptSegment
 
 
 class JobRepositoryPort(ABC):
@@ -43,3 +44,69 @@ class JobRepositoryPort(ABC):
     @abstractmethod
     def delete_all_jobs(self) -> int:
         """Delete all jobs, results, and audio file records. Return count of deleted jobs."""
+
+    @abstractmethod
+    def raise_progress(self, job_id: UUID, progress_percent: int) -> None:
+        """Raise a TRANSCRIBING job's progress in place; never lower it.
+
+        Jobs in any other status are left alone, so concurrent workers can
+        report progress without overwriting each other or a status change.
+        """
+
+    @abstractmethod
+    def save_chunk_result(
+        self,
+        job_id: UUID,
+        chunk_index: int,
+        audio_hash: str,
+        segments: list[TranscriptSegment],
+    ) -> None:
+        """Checkpoint the transcription of one chunk of a job."""
+
+    @abstractmethod
+    def get_chunk_results(
+        self, job_id: UUID
+    ) -> dict[tuple[int, str], list[TranscriptSegment]]:
+        """Get checkpointed chunks of a job, keyed by (chunk_index, audio_hash)."""
+
+    @abstractmethod
+    def delete_chunk_results(self, job_id: UUID) -> None:
+        """Drop the chunk checkpoints and the chunk plan of a job."""
+
+    @abstractmethod
+    def save_chunk_plan(self, job_id: UUID, cores: list[tuple[int, int]]) -> None:
+        """Store the chunk cores (start, end ms) a distributed job was split into."""
+
+    @abstractmethod
+    def get_chunk_plan(self, job_id: UUID) -> list[tuple[int, int]] | None:
+        """Get the stored chunk cores of a job, or None if none were stored."""
+
+    @abstractmethod
+    def save_partial_segments(
+        self, job_id: UUID, segments: list[TranscriptSegment], attempt: int = 0
+    ) -> None:
+        """Append segments, published by one attempt of a job, to its live transcript."""
+
+    @abstractmethod
+    def get_partial_segments(
+        self, job_id: UUID, after_sequence: int = 0
+    ) -> list[tuple[int, int, TranscriptSegment]]:
+        """Get (sequence, attempt, segment) triples appended after a sequence number.
+
+        Sequence numbers increase across every job and attempt, so a reader
+        can poll with the last one it has seen.
+        """
+
+    @abstractmethod
+    def delete_partial_segments(self, job_id: UUID) -> None:
+        """Drop the partial transcript of a job."""
+
+    @abstractmethod
+    def get_cached_result(self, cache_key: str) -> TranscriptionResult | None:
+        """Get the cached result for a result cache key, marking it recently used."""
+
+    @abstractmethod
+    def save_cached_result(
+        self, cache_key: str, result: TranscriptionResult, max_entries: int
+    ) -> None:
+        """Cache a result, evicting least recently used entries beyond max_entries."""
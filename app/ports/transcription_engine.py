@@ -1,16 +1,98 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.quality_tier import QualityTier
+from app.domain.value_objects.route_outcome import RouteOutcome
+from app.domain.value_objects.transcript_segment import TranscriptSegment
+from app.ports.audio_chunk import AudioChunk, EncodedAudio
+
+# A file path, a zero-copy view of a range of already-decoded audio, or a
+# chunk the engine has already encoded in prepare()
+AudioInput = str | AudioChunk | EncodedAudio
 
 
 class TranscriptionEnginePort(ABC):
     @abstractmethod
-    def transcribe(self, audio_path: str, language: str) -> str:
-        """Transcribe audio file at given path in given language.
+    def transcribe(self, audio: AudioInput, language: str) -> str:
+        """Transcribe audio (file path or chunk view) in given language.
 
         Returns full transcription text.
         Raises TranscriptionError on failure.
         """
 
+    @abstractmethod
+    def prepare(self, audio: AudioInput) -> AudioInput:
+        """Do the per-chunk work that needs no engine slot, ahead of time.
+
+        Called from a producer thread while earlier chunks are still being
+        transcribed (page-in, encoding). Returns what to pass to transcribe.
+        """
+
+    @abstractmethod
+    def transcribe_segments(
+        self, audio: AudioInput, language: str
+    ) -> list[TranscriptSegment]:
+        """Transcribe audio into timed segments, with word timings if available.
+
+        Times are in ms relative to the start of the given audio.
+        Raises TranscriptionError on failure.
+        """
+
+    def transcribe_stream(
+        self, audio: AudioInput, language: str
+    ) -> Iterator[TranscriptSegment]:
+        """Yield timed segments as the engine produces them.
+
+        Engines that only get whole responses yield every segment at once
+        when the response arrives.
+        Raises TranscriptionError on failure.
+        """
+        yield from self.transcribe_segments(audio, language)
+
+    def warm_up(self) -> None:
+        """Load models or open clients ahead of the first job.
+
+        Engines with nothing to preload keep this no-op.
+        """
+
+    def close(self) -> None:
+        """Release connections and threads the engine holds, on shutdown.
+
+        Engines that hold none keep this no-op.
+        """
+
+    def for_quality_tier(
+        self, tier: QualityTier | None
+    ) -> "TranscriptionEnginePort":
+        """Return the engine to use for a job that asked for this tier.
+
+        Engines that run a single model return themselves.
+        """
+        return self
+
+    def route_outcomes(self) -> list[RouteOutcome] | None:
+        """Which engine answered each request made through this engine.
+
+        Engines that do not route between other engines return None.
+        """
+        return None
+
+    @property
+    def decoding_parameters(self) -> dict[str, object]:
+        """Model and settings that change the transcript, for the result cache.
+
+        Two runs with equal engine names and parameters must give the same
+        text for the same audio.
+        """
+        return {}
+
     @property
     @abstractmethod
     def engine_name(self) -> str:
         """Return the identifier of this engine."""
+
+    @property
+    @abstractmethod
+    def capabilities(self) -> EngineCapabilities:
+        """Return request limits and chunking preferences of this engine."""
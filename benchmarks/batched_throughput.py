@@ -0,0 +1,97 @@
+"""Throughput benchmark: per-file faster-whisper vs batched decoding.
+
+Cuts a speech recording into clips and transcribes them all, first one
+call at a time with FasterWhisperEngine, then concurrently with
+BatchedFasterWhisperEngine, which folds them into batched decodes. Run on
+a CPU-only host to measure the CPU gain. Use real speech: VAD drops
+synthetic tones, leaving nothing to decode.
+
+Usage:
+    python -m benchmarks.batched_throughput --audio speech.mp3 \
+        [--clips 16] [--seconds 30] [--batch-size 8] [--model large-v3-turbo]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from app.adapters.outbound.engines.batched_faster_whisper_engine import (
+    BatchedFasterWhisperEngine,
+)
+from app.adapters.outbound.engines.faster_whisper_engine import (
+    WHISPER_SAMPLE_RATE,
+    FasterWhisperEngine,
+)
+from app.ports.audio_chunk import AudioChunk
+
+
+def _clips(audio_path: str, count: int, seconds: float) -> list[AudioChunk]:
+    """Consecutive clips of the recording, wrapping around if it is short."""
+    from faster_whisper import decode_audio
+
+    audio = decode_audio(audio_path, sampling_rate=WHISPER_SAMPLE_RATE)
+    samples = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    clip_len = int(seconds * WHISPER_SAMPLE_RATE)
+    samples = np.resize(samples, max(len(samples), clip_len * count))
+    return [
+        AudioChunk(
+            samples[i * clip_len:(i + 1) * clip_len],
+            WHISPER_SAMPLE_RATE,
+            start_ms=int(i * seconds * 1000),
+            index=i,
+        )
+        for i in range(count)
+    ]
+
+
+def _per_file(model: str, clips: list[AudioChunk]) -> float:
+    engine = FasterWhisperEngine(model_size=model)
+    engine.warm_up()
+    started = time.perf_counter()
+    for clip in clips:
+        engine.transcribe_segments(clip, "pt-BR")
+    return time.perf_counter() - started
+
+
+def _batched(model: str, clips: list[AudioChunk], batch_size: int) -> float:
+    engine = BatchedFasterWhisperEngine(model_size=model, batch_size=batch_size)
+    engine.warm_up()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=batch_size) as pool:
+        list(pool.map(lambda clip: engine.transcribe_segments(clip, "pt-BR"), clips))
+    return time.perf_counter() - started
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--audio", required=True, help="Speech recording to cut clips from")
+    parser.add_argument("--clips", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument(
+        "--model", default=os.environ.get("FASTER_WHISPER_MODEL", "large-v3-turbo")
+    )
+    args = parser.parse_args(argv)
+
+    clips = _clips(args.audio, args.clips, args.seconds)
+    audio_seconds = args.clips * args.seconds
+    print(f"Model: {args.model}, {args.clips} clips of {args.seconds:g}s")
+    print()
+    print(f"{'mode':<12} {'time (s)':>10} {'clips/s':>9} {'x realtime':>11}")
+    for mode, seconds in (
+        ("per-file", _per_file(args.model, clips)),
+        (f"batched/{args.batch_size}", _batched(args.model, clips, args.batch_size)),
+    ):
+        print(
+            f"{mode:<12} {seconds:>10.2f} {args.clips / seconds:>9.2f} "
+            f"{audio_seconds / seconds:>11.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
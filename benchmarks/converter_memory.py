@@ -0,0 +1,92 @@
+"""Peak-memory benchmark: pydub vs streaming ffmpeg WAV conversion.
+
+Generates a synthetic input of the requested length with ffmpeg, then
+converts it with each adapter in a fresh child process and reports the
+child's peak RSS (the larger of the Python process and any ffmpeg
+subprocess it waited on) and wall time.
+
+Usage:
+    python -m benchmarks.converter_memory [--minutes 60] [--format mp3]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+CONVERTERS = {
+    "pydub": "app.adapters.outbound.converter.pydub_converter:PydubAudioConverter",
+    "ffmpeg": "app.adapters.outbound.converter.ffmpeg_converter:FFmpegStreamingConverter",
+}
+
+
+def _generate_input(path: str, minutes: float) -> None:
+    """Write a stereo 44.1 kHz tone of the given length."""
+    subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi",
+            "-i", f"sine=frequency=440:sample_rate=44100:duration={minutes * 60}",
+            "-ac", "2",
+            path,
+        ],
+        check=True,
+    )
+
+
+def _run_child(converter: str, input_path: str, output_path: str) -> None:
+    """Entry point executed inside the measured child process."""
+    module_name, class_name = CONVERTERS[converter].split(":")
+    module = __import__(module_name, fromlist=[class_name])
+    ok = getattr(module, class_name)().convert_to_wav(input_path, output_path)
+    sys.exit(0 if ok else 1)
+
+
+def _measure(converter: str, input_path: str, output_path: str) -> tuple[float, float]:
+    """Return (peak_rss_mb, seconds) for one conversion in a fresh process."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.converter_memory",
+         "--child", converter, input_path, output_path],
+    )
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"{converter} conversion failed")
+    # ru_maxrss is reported in KiB on Linux
+    return usage.ru_maxrss / 1024, elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=60.0)
+    parser.add_argument("--format", default="mp3", choices=["mp3", "ogg", "flac", "wav"])
+    parser.add_argument("--child", nargs=3, metavar=("CONVERTER", "INPUT", "OUTPUT"))
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _run_child(*args.child)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = os.path.join(tmpdir, f"input.{args.format}")
+        print(f"Generating {args.minutes:g} min {args.format} input...")
+        _generate_input(input_path, args.minutes)
+        size_mb = os.path.getsize(input_path) / 1_048_576
+        print(f"Input size: {size_mb:.1f} MB")
+        print()
+        print(f"{'converter':<10} {'peak RSS (MB)':>14} {'time (s)':>10}")
+        for name in CONVERTERS:
+            output_path = os.path.join(tmpdir, f"{name}.wav")
+            peak_mb, seconds = _measure(name, input_path, output_path)
+            print(f"{name:<10} {peak_mb:>14.1f} {seconds:>10.2f}")
+            os.remove(output_path)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
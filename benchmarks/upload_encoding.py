@@ -0,0 +1,143 @@
+"""Upload benchmark: bytes sent and end-to-end latency per upload encoding.
+
+Cuts a recording into chunks and sends them through AsyncAPIEngine once
+per encoding (WAV, FLAC, Opus, MP3). Chunks go through ChunkExecutor as
+they do in a job, so each chunk is encoded while the previous one is
+being uploaded. By default the requests go to a local stub API that reads
+uploads at --uplink-mbps to stand in for a slow uplink. Pass --base-url,
+--model and an API key in API_KEY to time a real provider instead.
+
+Usage:
+    python -m benchmarks.upload_encoding --audio speech.mp3 \
+        [--chunk-seconds 60] [--uplink-mbps 10] [--workers 2]
+        [--encodings wav,flac,opus,mp3] [--base-url URL --model MODEL]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.adapters.outbound.converter.pydub_converter import PydubAudioConverter
+from app.adapters.outbound.engines.async_api_engine import AsyncAPIEngine
+from app.application.chunk_executor import ChunkExecutor
+
+READ_BLOCK_BYTES = 16 * 1024
+
+
+def _stub_server(uplink_mbps: float) -> ThreadingHTTPServer:
+    """A transcription endpoint that accepts uploads at the given rate."""
+    bytes_per_second = uplink_mbps * 1_000_000 / 8
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            remaining = int(self.headers["Content-Length"])
+            started = time.perf_counter()
+            received = 0
+            while remaining:
+                block = self.rfile.read(min(READ_BLOCK_BYTES, remaining))
+                remaining -= len(block)
+                received += len(block)
+                ahead = received / bytes_per_second - (time.perf_counter() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+            data = json.dumps({"text": "ok"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _measure(engine: AsyncAPIEngine, chunks, workers: int) -> tuple[int, float, float]:
+    """Bytes sent, mean encode time per chunk and end-to-end time for all chunks."""
+    started = time.perf_counter()
+    sizes = [len(engine.prepare(chunk).open().read()) for chunk in chunks]
+    encode_seconds = (time.perf_counter() - started) / len(chunks)
+
+    executor = ChunkExecutor(api_workers=workers, max_retries=0)
+    started = time.perf_counter()
+    executor.transcribe_all(engine, chunks, "pt-BR")
+    return sum(sizes), encode_seconds, time.perf_counter() - started
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--audio", required=True, help="Recording to cut chunks from")
+    parser.add_argument("--chunk-seconds", type=float, default=60.0)
+    parser.add_argument("--uplink-mbps", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--encodings", default="wav,flac,opus,mp3")
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--model", default="whisper-large-v3")
+    args = parser.parse_args(argv)
+
+    converter = PydubAudioConverter()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        wav_path = os.path.join(tmpdir, "audio.wav")
+        converter.convert_to_wav(args.audio, wav_path, 16000, 1)
+        with converter.open_session(wav_path) as session:
+            chunk_ms = int(args.chunk_seconds * 1000)
+            duration_ms = int(session.duration_seconds * 1000)
+            chunks = [
+                chunk.load()
+                for chunk in session.chunk_views(
+                    [
+                        (start, min(start + chunk_ms, duration_ms))
+                        for start in range(0, duration_ms, chunk_ms)
+                    ]
+                )
+            ]
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = _stub_server(args.uplink_mbps)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        print(f"Stub API with a {args.uplink_mbps:g} Mbit/s uplink")
+    print(f"{len(chunks)} chunks of {args.chunk_seconds:g}s, {args.workers} workers")
+    print()
+    print(f"{'encoding':<9} {'bytes sent':>12} {'vs wav':>7} "
+          f"{'encode/chunk (s)':>17} {'end-to-end (s)':>15}")
+
+    # WAV goes first: it is the baseline the others are compared against
+    encodings = ["wav"] + [e for e in args.encodings.split(",") if e != "wav"]
+    wav_bytes = None
+    for encoding in encodings:
+        engine = AsyncAPIEngine(
+            name="benchmark",
+            base_url=base_url,
+            api_key=os.environ.get("API_KEY", ""),
+            model=args.model,
+            encoding=encoding,
+        )
+        try:
+            sent, encode_seconds, total_seconds = _measure(engine, chunks, args.workers)
+        finally:
+            engine.close()
+        wav_bytes = wav_bytes or sent
+        print(
+            f"{encoding:<9} {sent:>12,} {sent / wav_bytes:>7.0%} "
+            f"{encode_seconds:>17.3f} {total_seconds:>15.2f}"
+        )
+
+    if server is not None:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Per-job latency benchmark: forking RQ worker vs warm-model worker.
+
+A forking ``rq worker`` runs every job in a fresh work-horse, which imports
+faster-whisper and loads the model before transcribing. The warm worker
+loads the model once and runs every job in the same process. This times a
+short clip through both paths with FasterWhisperEngine.
+
+Usage:
+    python -m benchmarks.worker_startup [--jobs 5] [--seconds 5] [--model large-v3-turbo]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+def _write_clip(path: str, seconds: float) -> None:
+    """Write a 16 kHz mono tone of the given length."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    samples = (0.3 * 32767 * np.sin(2 * np.pi * 440 * t)).astype("<i2")
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(samples.tobytes())
+
+
+def _run_child(clip_path: str, model: str) -> None:
+    """One job as a forked work-horse runs it: import, load, transcribe."""
+    from app.adapters.outbound.engines.faster_whisper_engine import (
+        FasterWhisperEngine,
+    )
+
+    FasterWhisperEngine(model_size=model).transcribe(clip_path, "pt-BR")
+
+
+def _cold_jobs(clip_path: str, model: str, jobs: int) -> list[float]:
+    """Wall time of each job run in a fresh process."""
+    timings = []
+    for _ in range(jobs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.worker_startup",
+             "--child", clip_path, model],
+            check=True,
+        )
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _warm_jobs(clip_path: str, model: str, jobs: int) -> tuple[float, list[float]]:
+    """Model load time, then wall time of each job in this process."""
+    from app.adapters.outbound.engines.faster_whisper_engine import (
+        FasterWhisperEngine,
+    )
+
+    engine = FasterWhisperEngine(model_size=model)
+    started = time.perf_counter()
+    engine.warm_up()
+    load_seconds = time.perf_counter() - started
+
+    timings = []
+    for _ in range(jobs):
+        started = time.perf_counter()
+        engine.transcribe(clip_path, "pt-BR")
+        timings.append(time.perf_counter() - started)
+    return load_seconds, timings
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=5)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--model", default=os.environ.get("FASTER_WHISPER_MODEL", "large-v3-turbo")
+    )
+    parser.add_argument("--child", nargs=2, metavar=("CLIP", "MODEL"))
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _run_child(*args.child)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        clip_path = os.path.join(tmpdir, "clip.wav")
+        _write_clip(clip_path, args.seconds)
+
+        print(f"Model: {args.model}, {args.jobs} jobs of {args.seconds:g}s audio")
+        cold = _cold_jobs(clip_path, args.model, args.jobs)
+        load_seconds, warm = _warm_jobs(clip_path, args.model, args.jobs)
+
+    print(f"Warm worker startup (model load): {load_seconds:.2f}s, paid once")
+    print()
+    print(f"{'worker':<10} {'first job (s)':>14} {'mean job (s)':>13}")
+    print(f"{'forking':<10} {cold[0]:>14.2f} {statistics.mean(cold):>13.2f}")
+    print(f"{'warm':<10} {warm[0]:>14.2f} {statistics.mean(warm):>13.2f}")
+    print(f"Per-job saving: {statistics.mean(cold) - statistics.mean(warm):.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
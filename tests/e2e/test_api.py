@@ -1,5 +1,6 @@
 """End-to-end API tests for the web application."""
 
+import json
 import os
 import struct
 import tempfile
@@ -23,6 +24,9 @@ class NoOpQueue(JobQueuePort):
     def enqueue(self, job_id: UUID) -> None:
         self.enqueued.append(job_id)
 
+    def enqueue_chunks(self, job_id: UUID, chunk_count: int) -> None:
+        pass
+
 
 def _make_wav_bytes(duration_seconds: float = 1.0, sample_rate: int = 16000) -> bytes:
     """Generate minimal valid WAV file bytes."""
@@ -164,6 +168,48 @@ class TestJobStatusEndpoint:
         assert data["language"] == "pt-BR"
 
 
+class TestProgressEndpoint:
+    @pytest.mark.asyncio
+    async def test_streams_partial_segments(self, app, client, wav_bytes):
+        from app.bootstrap import get_container
+        from app.domain.value_objects.job_status import JobStatus
+        from app.domain.value_objects.transcript_segment import TranscriptSegment
+
+        upload_resp = await client.post(
+            "/api/upload",
+            files={"file": ("test.wav", wav_bytes, "audio/wav")},
+            data={"language": "pt-BR"},
+        )
+        job_id = UUID(upload_resp.json()["job_id"])
+
+        repository = get_container().repository
+        repository.save_partial_segments(
+            job_id,
+            [TranscriptSegment(0, 1_000, "Olá"), TranscriptSegment(1_000, 2_000, "mundo")],
+        )
+        job = repository.get_job(job_id)
+        job.status = JobStatus.COMPLETED
+        repository.save_job(job)
+
+        response = await client.get(f"/api/jobs/{job_id}/progress")
+
+        events = [
+            block.split("\n")
+            for block in response.text.strip().split("\n\n")
+        ]
+        assert [lines[0] for lines in events] == [
+            "event: partial",
+            "event: partial",
+            "event: status",
+            "event: done",
+        ]
+        partials = [json.loads(lines[1].removeprefix("data: ")) for lines in events[:2]]
+        assert partials == [
+            {"attempt": 0, "start_ms": 0, "end_ms": 1_000, "text": "Olá"},
+            {"attempt": 0, "start_ms": 1_000, "end_ms": 2_000, "text": "mundo"},
+        ]
+
+
 class TestResultEndpoint:
     @pytest.mark.asyncio
     async def test_result_not_found_returns_404(self, client):
@@ -0,0 +1,213 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from app.adapters.outbound.engines.async_api_engine import AsyncAPIEngine
+from app.adapters.outbound.engines.rate_limiter import RateLimiter, TokenBucket
+from app.domain.exceptions import TranscriptionError
+from app.ports.audio_chunk import AudioChunk
+
+VERBOSE_RESPONSE = {
+    "text": "olá mundo",
+    "segments": [{"start": 0.0, "end": 1.0, "text": " olá mundo"}],
+    "words": [
+        {"start": 0.0, "end": 0.4, "word": "olá"},
+        {"start": 0.5, "end": 1.0, "word": "mundo"},
+    ],
+}
+
+
+class StubAPI(ThreadingHTTPServer):
+    """OpenAI-compatible /audio/transcriptions endpoint on localhost."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.requests = []  # (client port, form body)
+        self.rate_limited = 0  # answer this many requests with 429 first
+        self.fail_status = None
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive between requests
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        with server.lock:
+            server.requests.append((self.client_address[1], body))
+            limited = server.rate_limited > 0
+            if limited:
+                server.rate_limited -= 1
+
+        if limited:
+            self._reply(429, {"error": "rate limited"}, {"Retry-After": "0"})
+        elif server.fail_status:
+            self._reply(server.fail_status, {"error": "boom"})
+        elif self.path == "/v1/audio/transcriptions":
+            self._reply(200, VERBOSE_RESPONSE)
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def _reply(self, status, payload, headers=None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = StubAPI()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _engine(stub, **options):
+    return AsyncAPIEngine(
+        name="groq",
+        base_url=stub.url,
+        api_key="test-key",
+        model="whisper-large-v3",
+        timestamps=True,
+        **options,
+    )
+
+
+def _chunk(seconds=1.0):
+    return AudioChunk(np.zeros(int(seconds * 16000), dtype=np.int16), 16000)
+
+
+class TestAsyncAPIEngine:
+    def test_transcribes_segments_with_word_timings(self, stub):
+        engine = _engine(stub)
+        try:
+            segments = engine.transcribe_segments(engine.prepare(_chunk()), "pt-BR")
+        finally:
+            engine.close()
+
+        assert [s.text for s in segments] == ["olá mundo"]
+        assert [w.text for w in segments[0].words] == ["olá", "mundo"]
+        [(_, body)] = stub.requests
+        assert b'name="language"\r\n\r\npt' in body
+        assert b'name="response_format"\r\n\r\nverbose_json' in body
+
+    def test_concurrent_requests_share_pooled_connections(self, stub):
+        engine = _engine(stub, max_connections=2)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                texts = list(
+                    pool.map(lambda _: engine.transcribe(_chunk(), "pt-BR"), range(16))
+                )
+        finally:
+            engine.close()
+
+        assert texts == ["olá mundo"] * 16
+        assert len({port for port, _ in stub.requests}) <= 2
+
+    def test_rate_limited_request_retried_instead_of_failing(self, stub):
+        stub.rate_limited = 2
+        engine = _engine(stub)
+        try:
+            text = engine.transcribe(_chunk(), "pt-BR")
+        finally:
+            engine.close()
+
+        assert text == "olá mundo"
+        assert len(stub.requests) == 3
+
+    def test_rate_limited_retry_charges_audio_seconds_once(self, stub):
+        stub.rate_limited = 1
+        limiter = RateLimiter(audio_seconds_per_hour=3600, clock=lambda: 0.0)
+        engine = _engine(stub, rate_limiter=limiter)
+        try:
+            engine.transcribe(_chunk(seconds=2.0), "pt-BR")
+        finally:
+            engine.close()
+
+        assert len(stub.requests) == 2
+        assert limiter._audio_seconds._tokens == 3600 - 2.0
+
+    def test_persistent_rate_limit_raises(self, stub):
+        stub.rate_limited = 10
+        engine = _engine(stub, max_rate_limit_retries=2)
+        try:
+            with pytest.raises(TranscriptionError, match="rate limiting"):
+                engine.transcribe(_chunk(), "pt-BR")
+        finally:
+            engine.close()
+
+        assert len(stub.requests) == 3
+
+    def test_server_error_raises_transcription_error(self, stub):
+        stub.fail_status = 500
+        engine = _engine(stub)
+        try:
+            with pytest.raises(TranscriptionError, match="500"):
+                engine.transcribe(_chunk(), "pt-BR")
+        finally:
+            engine.close()
+
+    def test_requests_over_limit_queue(self, stub):
+        # 120 requests per minute: a burst of 120, then one every 0.5 s
+        engine = _engine(stub, rate_limiter=RateLimiter(requests_per_minute=120))
+        engine._rate_limiter._requests._tokens = 1
+        try:
+            started = time.monotonic()
+            engine.transcribe(_chunk(), "pt-BR")
+            engine.transcribe(_chunk(), "pt-BR")
+            elapsed = time.monotonic() - started
+        finally:
+            engine.close()
+
+        assert len(stub.requests) == 2
+        assert elapsed >= 0.4
+
+
+class TestTokenBucket:
+    async def test_waits_for_refill(self):
+        bucket = TokenBucket(capacity=2, refill_per_second=20)
+
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert time.monotonic() - started >= 0.04
+
+    async def test_oversized_request_waits_for_full_bucket(self):
+        bucket = TokenBucket(capacity=10, refill_per_second=1000)
+
+        await bucket.acquire(10)
+        started = time.monotonic()
+        await bucket.acquire(25)
+
+        assert time.monotonic() - started >= 0.009
+        assert bucket._tokens < 0
+
+    async def test_audio_seconds_limit_applies_per_request_duration(self):
+        limiter = RateLimiter(audio_seconds_per_hour=3600)  # one second per second
+
+        await limiter.acquire(3599.95)
+        started = time.monotonic()
+        await limiter.acquire(0.1)
+
+        assert time.monotonic() - started >= 0.04
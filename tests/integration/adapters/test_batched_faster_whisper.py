@@ -0,0 +1,144 @@
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.adapters.outbound.engines.batched_faster_whisper_engine import (
+    REQUEST_GAP_SECONDS,
+    BatchedFasterWhisperEngine,
+)
+from app.adapters.outbound.engines.faster_whisper_engine import FasterWhisperEngine
+from app.adapters.outbound.engines.model_registry import WhisperModelRegistry
+from app.domain.exceptions import TranscriptionError
+from app.ports.audio_chunk import AudioChunk
+
+
+class FakePipeline:
+    """Reports one segment per non-silent stretch of the joined input."""
+
+    def __init__(self, model=None, fail=False):
+        self.model = model
+        self.fail = fail
+        self.calls = []
+        self.options = []
+
+    def transcribe(self, audio, language, **options):
+        self.calls.append((len(audio), language, options["batch_size"]))
+        self.options.append(options)
+        if self.fail:
+            raise RuntimeError("decoder crashed")
+        voiced = np.flatnonzero(np.abs(audio) > 0)
+        runs = np.split(voiced, np.flatnonzero(np.diff(voiced) > 1) + 1)
+        segments = []
+        for run in runs:
+            start, end = run[0] / 16000, (run[-1] + 1) / 16000
+            word = SimpleNamespace(start=start, end=end, word=f"{end - start:.1f}s")
+            segments.append(
+                SimpleNamespace(start=start, end=end, text=word.word, words=[word])
+            )
+        return iter(segments), None
+
+
+def _engine(pipeline, batch_size=4, max_wait_ms=200):
+    pipeline.model = object()
+    engine = BatchedFasterWhisperEngine(
+        model_size="tiny",
+        batch_size=batch_size,
+        max_wait_ms=max_wait_ms,
+        registry=WhisperModelRegistry(loader=lambda spec: pipeline.model),
+    )
+    engine._pipeline = pipeline
+    return engine
+
+
+def _speech(seconds, lead_seconds=0.0):
+    silence = np.zeros(int(lead_seconds * 16000), dtype=np.int16)
+    voiced = np.full(int(seconds * 16000), 1000, dtype=np.int16)
+    return AudioChunk(np.concatenate([silence, voiced]), 16000)
+
+
+def _transcribe_concurrently(engine, chunks, language="pt-BR"):
+    results = [None] * len(chunks)
+
+    def run(index):
+        results[index] = engine.transcribe_segments(chunks[index], language)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(chunks))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestBatchedFasterWhisperEngine:
+    def test_concurrent_requests_decoded_in_one_batch(self):
+        pipeline = FakePipeline()
+        engine = _engine(pipeline)
+        chunks = [_speech(1.0), _speech(2.0, lead_seconds=0.5), _speech(3.0)]
+
+        results = _transcribe_concurrently(engine, chunks)
+
+        assert len(pipeline.calls) == 1
+        joined_samples, language, batch_size = pipeline.calls[0]
+        assert language == "pt"
+        assert batch_size == 4
+        assert joined_samples == sum(
+            len(chunk.samples) + REQUEST_GAP_SECONDS * 16000 for chunk in chunks
+        )
+        # Every request gets its own segments, on its own timeline
+        assert [[s.text for s in segments] for segments in results] == [
+            ["1.0s"], ["2.0s"], ["3.0s"]
+        ]
+        assert (results[1][0].start_ms, results[1][0].end_ms) == (500, 2_500)
+        assert results[1][0].words[0].start_ms == 500
+
+    def test_languages_decoded_separately(self):
+        pipeline = FakePipeline()
+        engine = _engine(pipeline)
+        results = [None, None]
+
+        def run(index, language):
+            results[index] = engine.transcribe_segments(_speech(1.0), language)
+
+        threads = [
+            threading.Thread(target=run, args=(0, "pt-BR")),
+            threading.Thread(target=run, args=(1, "en")),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(call[1] for call in pipeline.calls) == ["en", "pt"]
+        assert all(len(segments) == 1 for segments in results)
+
+    def test_decode_failure_raised_to_every_request(self):
+        engine = _engine(FakePipeline(fail=True), max_wait_ms=0)
+
+        with pytest.raises(TranscriptionError, match="decoder crashed"):
+            engine.transcribe_segments(_speech(1.0), "pt-BR")
+
+    def test_capabilities_advertise_batch_size(self):
+        capabilities = _engine(FakePipeline(), batch_size=6).capabilities
+
+        assert capabilities.batch_size == 6
+        assert capabilities.runs_locally
+
+    def test_decodes_with_sequential_engine_options(self):
+        pipeline = FakePipeline()
+        engine = _engine(pipeline, max_wait_ms=0)
+        sequential = FasterWhisperEngine(model_size="tiny")
+
+        engine.transcribe_segments(_speech(1.0), "pt-BR")
+
+        options = dict(pipeline.options[0])
+        assert options.pop("batch_size") == 4
+        expected = sequential._decoding_options("pt")
+        expected.pop("language")
+        assert options == expected
+        assert engine.decoding_parameters == {
+            **sequential.decoding_parameters,
+            "batch_size": 4,
+        }
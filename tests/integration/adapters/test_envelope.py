@@ -0,0 +1,122 @@
+import os
+import wave
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from app.adapters.outbound.converter.envelope import (
+    EnvelopeBuilder,
+    compute_envelope,
+    detect_nonsilent_from_envelope,
+    envelope_path,
+    load_envelope,
+    save_envelope,
+)
+from app.adapters.outbound.converter.memmap_session import WavMemmapSession
+from app.adapters.outbound.converter.silence import detect_nonsilent
+
+
+def _tone_and_silence(pattern: list[tuple[str, int]]) -> np.ndarray:
+    audio = AudioSegment.silent(duration=0, frame_rate=16000)
+    for kind, ms in pattern:
+        if kind == "tone":
+            audio += Sine(220).to_audio_segment(duration=ms, volume=-12).set_frame_rate(16000)
+        else:
+            audio += AudioSegment.silent(duration=ms, frame_rate=16000)
+    audio = audio.set_channels(1).set_sample_width(2)
+    return np.frombuffer(audio.raw_data, dtype=np.int16)
+
+
+def _write_wav(path, samples, sample_rate=16000):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(samples.tobytes())
+    return str(path)
+
+
+class TestEnvelope:
+    def test_one_value_per_10ms_frame(self):
+        samples = np.full(16000 + 80, 16384, dtype=np.int16)
+
+        envelope = compute_envelope(samples, 16000)
+
+        assert envelope.dtype == np.float16
+        assert len(envelope) == 101  # 100 full frames + a partial one
+        np.testing.assert_allclose(envelope, 0.5, rtol=1e-3)
+
+    def test_builder_matches_one_pass_for_any_block_split(self):
+        samples = _tone_and_silence([("tone", 730), ("silence", 615)])
+        raw = samples.tobytes()
+        builder = EnvelopeBuilder(16000)
+        # Odd-sized blocks split frames and individual samples
+        for start in range(0, len(raw), 1001):
+            builder.add(raw[start:start + 1001])
+
+        np.testing.assert_array_equal(builder.finish(), compute_envelope(samples, 16000))
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = envelope_path(str(tmp_path / "audio_converted.wav"))
+        envelope = np.linspace(0, 1, 50).astype(np.float16)
+
+        save_envelope(path, envelope)
+
+        assert path.endswith("audio_converted.envelope.npy")
+        np.testing.assert_array_equal(load_envelope(path), envelope)
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            [("tone", 1200), ("silence", 800), ("tone", 1500)],
+            [("silence", 600), ("tone", 2000), ("silence", 1200), ("tone", 300)],
+            [("tone", 3000)],
+            [("silence", 2500)],
+        ],
+    )
+    def test_matches_sample_level_detection_within_a_frame(self, pattern):
+        samples = _tone_and_silence(pattern)
+        duration_ms = round(1000 * len(samples) / 16000)
+
+        from_envelope = detect_nonsilent_from_envelope(
+            compute_envelope(samples, 16000), duration_ms
+        )
+        from_samples = detect_nonsilent(samples, 16000)
+
+        assert len(from_envelope) == len(from_samples)
+        for (es, ee), (ss, se) in zip(from_envelope, from_samples):
+            assert abs(es - ss) <= 10
+            assert abs(ee - se) <= 10
+
+
+class TestSessionEnvelope:
+    def test_builds_and_saves_missing_envelope(self, tmp_path):
+        samples = _tone_and_silence([("tone", 1000), ("silence", 1000), ("tone", 1000)])
+        wav_path = _write_wav(tmp_path / "job_converted.wav", samples)
+
+        with WavMemmapSession(wav_path) as session:
+            ranges = session.detect_silence_boundaries()
+
+        assert len(ranges) == 2
+        assert os.path.exists(envelope_path(wav_path))
+
+    def test_reuses_saved_envelope(self, tmp_path):
+        samples = _tone_and_silence([("tone", 1000), ("silence", 1000)])
+        wav_path = _write_wav(tmp_path / "job_converted.wav", samples)
+        # A deliberately different envelope proves the saved one is read
+        save_envelope(envelope_path(wav_path), np.zeros(200, dtype=np.float16))
+
+        with WavMemmapSession(wav_path) as session:
+            assert session.detect_silence_boundaries() == []
+
+    def test_rebuilds_envelope_of_wrong_length(self, tmp_path):
+        samples = _tone_and_silence([("tone", 1000), ("silence", 1000)])
+        wav_path = _write_wav(tmp_path / "job_converted.wav", samples)
+        save_envelope(envelope_path(wav_path), np.zeros(5, dtype=np.float16))
+
+        with WavMemmapSession(wav_path) as session:
+            assert session.detect_silence_boundaries() != []
+
+        assert len(load_envelope(envelope_path(wav_path))) == 200
@@ -0,0 +1,47 @@
+import os
+import shutil
+import wave
+
+import pytest
+from pydub import AudioSegment
+
+from app.adapters.outbound.converter.ffmpeg_converter import FFmpegStreamingConverter
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg binary not available"
+)
+
+
+@pytest.fixture
+def converter():
+    # A tiny block size forces many read/write iterations
+    return FFmpegStreamingConverter(block_frames=1024)
+
+
+class TestFFmpegStreamingConverter:
+
+    def test_convert_to_wav_resamples_and_downmixes(self, tmp_path, converter):
+        stereo = AudioSegment.silent(duration=1500, frame_rate=44100).set_channels(2)
+        input_path = str(tmp_path / "input.wav")
+        stereo.export(input_path, format="wav")
+
+        output_path = str(tmp_path / "output.wav")
+        result = converter.convert_to_wav(input_path, output_path)
+
+        assert result is True
+        with wave.open(output_path, "rb") as wf:
+            assert wf.getnchannels() == 1
+            assert wf.getframerate() == 16000
+            assert wf.getsampwidth() == 2
+            assert wf.getnframes() == pytest.approx(24000, abs=160)
+
+    def test_invalid_input_returns_false_and_removes_output(self, tmp_path, converter):
+        input_path = str(tmp_path / "broken.mp3")
+        with open(input_path, "wb") as f:
+            f.write(b"definitely not audio")
+
+        output_path = str(tmp_path / "output.wav")
+        result = converter.convert_to_wav(input_path, output_path)
+
+        assert result is False
+        assert not os.path.exists(output_path)
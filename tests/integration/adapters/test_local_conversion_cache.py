@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from app.adapters.outbound.storage.local_conversion_cache import LocalConversionCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LocalConversionCache(cache_dir=str(tmp_path / "cache"), max_bytes=1000)
+
+
+def _write(path, size):
+    with open(path, "wb") as f:
+        f.write(b"\x00" * size)
+    return str(path)
+
+
+class TestLocalConversionCache:
+    def test_miss_then_hit(self, cache, tmp_path):
+        dest = str(tmp_path / "dest.wav")
+        assert not cache.fetch("abc", 16000, 1, dest)
+
+        cache.store("abc", 16000, 1, _write(tmp_path / "converted.wav", 100))
+
+        assert cache.fetch("abc", 16000, 1, dest)
+        assert os.path.getsize(dest) == 100
+
+    def test_key_includes_conversion_parameters(self, cache, tmp_path):
+        cache.store("abc", 16000, 1, _write(tmp_path / "converted.wav", 100))
+
+        assert not cache.fetch("abc", 8000, 1, str(tmp_path / "a.wav"))
+        assert not cache.fetch("abc", 16000, 2, str(tmp_path / "b.wav"))
+
+    def test_deleting_fetched_copy_keeps_entry(self, cache, tmp_path):
+        cache.store("abc", 16000, 1, _write(tmp_path / "converted.wav", 100))
+        dest = str(tmp_path / "dest.wav")
+        cache.fetch("abc", 16000, 1, dest)
+
+        os.remove(dest)
+
+        assert cache.fetch("abc", 16000, 1, dest)
+
+    def test_evicts_least_recently_used(self, cache, tmp_path):
+        for i, name in enumerate(["first", "second"]):
+            cache.store(name, 16000, 1, _write(tmp_path / f"{name}.wav", 400))
+            entry = os.path.join(cache.cache_dir, f"{name}_16000hz_1ch.wav")
+            os.utime(entry, (1000 + i, 1000 + i))
+        # Using "first" makes "second" the least recently used entry
+        assert cache.fetch("first", 16000, 1, str(tmp_path / "hit.wav"))
+
+        cache.store("third", 16000, 1, _write(tmp_path / "third.wav", 400))
+
+        assert not cache.fetch("second", 16000, 1, str(tmp_path / "x.wav"))
+        assert cache.fetch("first", 16000, 1, str(tmp_path / "y.wav"))
+        assert cache.fetch("third", 16000, 1, str(tmp_path / "z.wav"))
+
+    def test_skips_entries_larger_than_cache(self, cache, tmp_path):
+        cache.store("huge", 16000, 1, _write(tmp_path / "huge.wav", 2000))
+
+        assert not cache.fetch("huge", 16000, 1, str(tmp_path / "dest.wav"))
@@ -0,0 +1,102 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from app.adapters.outbound.converter.memmap_session import WavMemmapSession
+from app.ports.audio_chunk import AudioChunk
+
+
+def _write_wav(path, samples, sample_rate=16000, channels=1):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(samples.astype("<i2").tobytes())
+
+
+class TestWavMemmapSession:
+    def test_chunk_views_slice_the_map(self, tmp_path):
+        samples = np.arange(32000, dtype=np.int16)
+        path = tmp_path / "ramp.wav"
+        _write_wav(path, samples)
+
+        with WavMemmapSession(str(path)) as session:
+            assert session.duration_seconds == pytest.approx(2.0)
+            first, second = session.chunk_views([(0, 500), (500, 2000)])
+
+            np.testing.assert_array_equal(first.samples, samples[:8000])
+            np.testing.assert_array_equal(second.samples, samples[8000:])
+            assert np.shares_memory(second.samples, session.samples)
+
+        with pytest.raises(RuntimeError):
+            session.samples
+
+    def test_full_view_covers_every_sample(self, tmp_path):
+        samples = np.arange(16001, dtype=np.int16)
+        path = tmp_path / "ramp.wav"
+        _write_wav(path, samples)
+
+        with WavMemmapSession(str(path)) as session:
+            view = session.full_view()
+
+            np.testing.assert_array_equal(view.samples, samples)
+            assert np.shares_memory(view.samples, session.samples)
+            assert view.sample_rate == 16000
+
+    def test_rejects_non_pcm16(self, tmp_path):
+        path = tmp_path / "8bit.wav"
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(1)
+            wf.setframerate(8000)
+            wf.writeframes(bytes(800))
+
+        with pytest.raises(ValueError):
+            WavMemmapSession(str(path))
+
+
+class TestAudioChunk:
+    def test_open_streams_a_valid_wav(self):
+        samples = np.array([0, 1000, -1000, 32767, -32768, 5], dtype=np.int16)
+        chunk = AudioChunk(samples[1:], 16000, start_ms=250, index=3)
+
+        with chunk.open() as f:
+            data = f.read()
+            assert len(data) == chunk.wav_size_bytes
+            f.seek(0)
+            with wave.open(f, "rb") as wf:
+                frames = wf.readframes(wf.getnframes())
+
+        assert np.frombuffer(frames, dtype="<i2").tolist() == samples[1:].tolist()
+        assert chunk.name.startswith("chunk_003_250-")
+
+    def test_seek_end_and_partial_reads(self):
+        chunk = AudioChunk(np.ones(10, dtype=np.int16), 16000)
+
+        with chunk.open() as f:
+            assert f.seek(-4, io.SEEK_END) == chunk.wav_size_bytes - 4
+            assert f.read() == b"\x01\x00\x01\x00"
+
+    def test_to_float32_downmixes_stereo(self):
+        stereo = np.array([16384, -16384, 16384, 16384], dtype=np.int16)
+        chunk = AudioChunk(stereo, 16000, channels=2)
+
+        mono = chunk.to_float32()
+
+        assert mono.dtype == np.float32
+        np.testing.assert_allclose(mono, [0.0, 0.5])
+
+    def test_rejects_non_int16_samples(self):
+        with pytest.raises(ValueError):
+            AudioChunk(np.zeros(4, dtype=np.float32), 16000)
+
+    def test_content_hash_follows_the_audio(self):
+        samples = np.arange(3200, dtype=np.int16)
+        view = AudioChunk(samples[::2], 16000, start_ms=0, index=0)
+        copy = AudioChunk(np.array(samples[::2]), 16000, start_ms=500, index=3)
+
+        assert view.content_hash() == copy.content_hash()
+        assert view.content_hash() != AudioChunk(samples[1::2], 16000).content_hash()
+        assert view.content_hash() != AudioChunk(samples[::2], 8000).content_hash()
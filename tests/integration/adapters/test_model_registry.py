@@ -0,0 +1,132 @@
+import pickle
+from types import SimpleNamespace
+
+from app.adapters.outbound.engines.faster_whisper_engine import FasterWhisperEngine
+from app.adapters.outbound.engines.model_registry import (
+    ModelSpec,
+    WhisperModelRegistry,
+    estimate_model_bytes,
+)
+from app.domain.value_objects.quality_tier import QualityTier
+
+MB = 1_000_000
+
+
+class FakeLoader:
+    def __init__(self):
+        self.loaded = []
+
+    def __call__(self, spec):
+        self.loaded.append(spec.model_size)
+        return object()
+
+
+class TestWhisperModelRegistry:
+    def test_estimates_size_from_model_and_compute_type(self):
+        assert estimate_model_bytes(ModelSpec("small")) == 244 * MB
+        assert estimate_model_bytes(ModelSpec("large-v3-turbo")) == 809 * MB
+        assert estimate_model_bytes(ModelSpec("distil-large-v3")) == 756 * MB
+        assert estimate_model_bytes(ModelSpec("base.en", compute_type="float32")) == (
+            74 * 4 * MB
+        )
+        # Unknown models are sized like the largest one
+        assert estimate_model_bytes(ModelSpec("/models/custom")) == 1550 * MB
+
+    def test_loads_each_model_once(self):
+        loader = FakeLoader()
+        registry = WhisperModelRegistry(loader=loader)
+
+        first = registry.get(ModelSpec("small"))
+        second = registry.get(ModelSpec("small"))
+
+        assert first is second
+        assert loader.loaded == ["small"]
+
+    def test_evicts_least_recently_used_over_budget(self):
+        loader = FakeLoader()
+        registry = WhisperModelRegistry(memory_budget_bytes=330 * MB, loader=loader)
+
+        registry.get(ModelSpec("base"))
+        registry.get(ModelSpec("small"))
+        registry.get(ModelSpec("base"))  # small is now least recently used
+        registry.get(ModelSpec("tiny"))
+
+        assert [spec.model_size for spec in registry.loaded()] == ["base", "tiny"]
+        assert registry.loaded_bytes <= 330 * MB
+
+    def test_model_over_budget_still_loaded_alone(self):
+        registry = WhisperModelRegistry(memory_budget_bytes=100 * MB, loader=FakeLoader())
+
+        registry.get(ModelSpec("base"))
+        registry.get(ModelSpec("small"))
+
+        assert [spec.model_size for spec in registry.loaded()] == ["small"]
+
+    def test_pickles_without_loaded_models(self):
+        registry = WhisperModelRegistry(memory_budget_bytes=400 * MB, loader=FakeLoader())
+        registry.get(ModelSpec("base"))
+
+        copy = pickle.loads(pickle.dumps(registry))
+
+        assert copy.loaded() == []
+        assert copy._memory_budget_bytes == 400 * MB
+
+
+class TestFasterWhisperEngineTiers:
+    def _engine(self, loader):
+        return FasterWhisperEngine(
+            model_size="large-v3-turbo",
+            registry=WhisperModelRegistry(loader=loader),
+            tier_models={QualityTier.FAST: "small", QualityTier.ACCURATE: "large-v3"},
+        )
+
+    def test_tier_engines_share_registry_and_are_reused(self):
+        loader = FakeLoader()
+        engine = self._engine(loader)
+
+        fast = engine.for_quality_tier(QualityTier.FAST)
+        fast.warm_up()
+        engine.warm_up()
+
+        assert fast is engine.for_quality_tier(QualityTier.FAST)
+        assert fast.engine_name == engine.engine_name
+        assert loader.loaded == ["small", "large-v3-turbo"]
+
+    def test_unmapped_tier_uses_default_model(self):
+        engine = self._engine(FakeLoader())
+
+        assert engine.for_quality_tier(None) is engine
+        assert engine.for_quality_tier(QualityTier.BALANCED) is engine
+
+
+class LazyModel:
+    """Decodes one segment per iteration, like faster-whisper's generator."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.decoded = 0
+
+    def transcribe(self, audio, **kwargs):
+        def segments():
+            for i, text in enumerate(self.texts):
+                self.decoded += 1
+                yield SimpleNamespace(start=i, end=i + 1, text=f" {text}", words=[])
+
+        return segments(), None
+
+
+class TestFasterWhisperEngineStreaming:
+    def test_segments_yielded_as_decoded(self):
+        model = LazyModel(["Olá", "mundo"])
+        engine = FasterWhisperEngine(
+            registry=WhisperModelRegistry(loader=lambda spec: model)
+        )
+
+        stream = engine.transcribe_stream("a.wav", "pt-BR")
+        first = next(stream)
+
+        assert first.text == "Olá"
+        assert (first.start_ms, first.end_ms) == (0, 1000)
+        assert model.decoded == 1
+        assert [segment.text for segment in stream] == ["mundo"]
+        assert engine.transcribe("a.wav", "pt-BR") == "Olá mundo"
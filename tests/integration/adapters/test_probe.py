@@ -0,0 +1,96 @@
+import shutil
+import struct
+
+import pytest
+from pydub import AudioSegment
+
+from app.adapters.outbound.converter.probe import probe_audio
+from app.adapters.outbound.converter.wav_header import read_wav_header
+from app.domain.exceptions import AudioProbeError
+
+
+def _wav_bytes(
+    data: bytes,
+    sample_rate: int = 16000,
+    channels: int = 1,
+    bits: int = 16,
+    extra_chunk: bytes = b"",
+    data_size: int | None = None,
+) -> bytes:
+    block_align = channels * bits // 8
+    fmt = struct.pack(
+        "<4sIHHIIHH",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bits,
+    )
+    size = len(data) if data_size is None else data_size
+    body = b"WAVE" + fmt + extra_chunk + struct.pack("<4sI", b"data", size) + data
+    return struct.pack("<4sI", b"RIFF", len(body)) + body
+
+
+class TestWavProbe:
+
+    def test_probe_wav_reads_header(self, tmp_path):
+        path = tmp_path / "mono.wav"
+        path.write_bytes(_wav_bytes(b"\x00\x00" * 48000))
+
+        metadata = probe_audio(str(path))
+
+        assert metadata.duration_seconds == pytest.approx(3.0)
+        assert metadata.sample_rate == 16000
+        assert metadata.channels == 1
+        assert metadata.codec == "pcm_s16le"
+        assert metadata.bits_per_sample == 16
+
+    def test_probe_skips_unknown_chunks(self, tmp_path):
+        list_chunk = struct.pack("<4sI", b"LIST", 5) + b"INFOx" + b"\x00"  # odd size padded
+        path = tmp_path / "tagged.wav"
+        path.write_bytes(
+            _wav_bytes(b"\x00\x00" * 88200, sample_rate=44100, channels=2, extra_chunk=list_chunk)
+        )
+
+        header = read_wav_header(str(path))
+
+        assert header.channels == 2
+        assert header.sample_rate == 44100
+        assert header.duration_seconds == pytest.approx(1.0)
+        assert header.data_offset == 12 + 24 + len(list_chunk) + 8
+
+    def test_placeholder_data_size_uses_file_length(self, tmp_path):
+        path = tmp_path / "streamed.wav"
+        path.write_bytes(_wav_bytes(b"\x00\x00" * 16000, data_size=0xFFFFFFFF))
+
+        assert probe_audio(str(path)).duration_seconds == pytest.approx(1.0)
+
+    def test_truncated_wav_raises_probe_error(self, tmp_path):
+        path = tmp_path / "broken.wav"
+        path.write_bytes(b"RIFF\x00\x00\x00\x00WAVE")
+
+        with pytest.raises(AudioProbeError):
+            probe_audio(str(path))
+
+    def test_matches_pydub_duration(self, tmp_path):
+        path = str(tmp_path / "pydub.wav")
+        AudioSegment.silent(duration=2500, frame_rate=22050).export(path, format="wav")
+
+        assert probe_audio(path).duration_seconds == pytest.approx(2.5, abs=0.001)
+
+
+@pytest.mark.skipif(shutil.which("ffprobe") is None, reason="ffprobe not available")
+class TestFFprobe:
+
+    def test_probe_mp3(self, tmp_path):
+        path = str(tmp_path / "tone.mp3")
+        AudioSegment.silent(duration=2000, frame_rate=44100).export(path, format="mp3")
+
+        metadata = probe_audio(path)
+
+        assert metadata.duration_seconds == pytest.approx(2.0, abs=0.1)
+        assert metadata.sample_rate == 44100
+        assert metadata.codec == "mp3"
+
+    def test_probe_garbage_raises(self, tmp_path):
+        path = tmp_path / "garbage.ogg"
+        path.write_bytes(b"not audio at all")
+
+        with pytest.raises(AudioProbeError):
+            probe_audio(str(path))
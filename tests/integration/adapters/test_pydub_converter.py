@@ -2,9 +2,14 @@ import pytest
 import os
 import wave
 
+import numpy as np
 from pydub import AudioSegment
 
-from app.adapters.outbound.converter.pydub_converter import PydubAudioConverter
+from app.adapters.outbound.converter.memmap_session import WavMemmapSession
+from app.adapters.outbound.converter.pydub_converter import (
+    PydubAudioConverter,
+    PydubAudioSession,
+)
 
 
 @pytest.fixture
@@ -40,3 +45,62 @@ class TestPydubAudioConverter:
 
         duration = converter.get_duration_seconds(wav_path)
         assert duration == pytest.approx(2.0, abs=0.1)
+
+    def test_session_reuses_decoded_audio(self, tmp_path, converter):
+        decoded = PydubAudioSession(AudioSegment.silent(duration=2000))
+
+        with decoded as session:
+            assert session.duration_seconds == pytest.approx(2.0, abs=0.1)
+            chunks = session.chunk_views([(0, 500), (500, 1500)])
+            assert [c.duration_ms for c in chunks] == [500, 1000]
+
+        with pytest.raises(RuntimeError):
+            session.duration_seconds
+
+    def test_pcm_wav_session_is_memory_mapped(self, tmp_path, converter):
+        audio = AudioSegment.silent(duration=3000, frame_rate=16000)
+        wav_path = str(tmp_path / "converted.wav")
+        audio.export(wav_path, format="wav")
+
+        with converter.open_session(wav_path) as session:
+            assert isinstance(session, WavMemmapSession)
+            assert session.duration_seconds == pytest.approx(3.0)
+            chunks = session.chunk_views([(0, 1000), (1000, 3000)])
+
+            assert [c.start_ms for c in chunks] == [0, 1000]
+            assert [c.duration_ms for c in chunks] == [1000, 2000]
+            assert all(np.shares_memory(c.samples, session.samples) for c in chunks)
+
+            # API engines get a lazily built WAV stream of the same range
+            with chunks[1].open() as f, wave.open(f, "rb") as wf:
+                assert wf.getframerate() == 16000
+                assert wf.getnframes() == 32000
+
+    def test_split_at_boundaries_writes_chunk_files(self, tmp_path, converter):
+        wav_path = str(tmp_path / "split.wav")
+        AudioSegment.silent(duration=2000).export(wav_path, format="wav")
+
+        chunk_paths = converter.split_at_boundaries(wav_path, [(0, 500), (500, 2000)])
+
+        assert len(chunk_paths) == 2
+        for path, expected in zip(chunk_paths, [0.5, 1.5]):
+            assert converter.get_duration_seconds(path) == pytest.approx(expected, abs=0.01)
+            os.unlink(path)
+
+    def test_is_normalized_only_for_target_pcm_wav(self, tmp_path, converter):
+        target = str(tmp_path / "target.wav")
+        AudioSegment.silent(duration=500, frame_rate=16000).export(target, format="wav")
+        stereo = str(tmp_path / "stereo.wav")
+        AudioSegment.silent(duration=500, frame_rate=16000).set_channels(2).export(
+            stereo, format="wav"
+        )
+        resampled = str(tmp_path / "44k.wav")
+        AudioSegment.silent(duration=500, frame_rate=44100).export(resampled, format="wav")
+        not_wav = str(tmp_path / "noise.bin")
+        with open(not_wav, "wb") as f:
+            f.write(b"not audio")
+
+        assert converter.is_normalized(target)
+        assert not converter.is_normalized(stereo)
+        assert not converter.is_normalized(resampled)
+        assert not converter.is_normalized(not_wav)
@@ -0,0 +1,263 @@
+import asyncio
+import pickle
+import threading
+import time
+
+import pytest
+
+from app.adapters.outbound.engines.async_api_engine import AsyncAPIEngine
+from app.adapters.outbound.engines.groq_engine import GroqEngine
+from app.adapters.outbound.engines.rate_limiter import RateLimiter
+from app.adapters.outbound.engines.routed_engine import CircuitBreaker, RoutedEngine
+from app.domain.exceptions import TranscriptionError
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.quality_tier import QualityTier
+from app.ports.transcription_engine import TranscriptionEnginePort
+
+
+class FakeEngine(TranscriptionEnginePort):
+    def __init__(self, name, delay=0.0, fail=False, capabilities=None):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.closed = False
+        self._capabilities = capabilities or EngineCapabilities()
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, language):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise TranscriptionError(f"{self.name} failed")
+        return f"{self.name}: {audio}"
+
+    def transcribe_segments(self, audio, language):
+        return []
+
+    def prepare(self, audio):
+        return audio
+
+    def close(self):
+        self.closed = True
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def engine_name(self):
+        return self.name
+
+    @property
+    def capabilities(self):
+        return self._capabilities
+
+
+class TestRoutedEngine:
+    def test_fast_primary_answers_without_hedging(self):
+        primary, hedge = FakeEngine("groq"), FakeEngine("openai")
+        engine = RoutedEngine(primary, hedge=hedge, default_hedge_delay_seconds=1.0)
+
+        assert engine.transcribe("a.wav", "pt-BR") == "groq: a.wav"
+        assert hedge.calls == 0
+        [outcome] = engine.route_outcomes()
+        assert outcome.engine_name == "groq"
+        assert not outcome.hedged
+
+    def test_slow_primary_is_hedged_and_first_answer_wins(self):
+        primary = FakeEngine("groq", delay=1.0)
+        hedge = FakeEngine("openai", delay=0.05)
+        engine = RoutedEngine(primary, hedge=hedge, default_hedge_delay_seconds=0.05)
+
+        started = time.monotonic()
+        text = engine.transcribe("a.wav", "pt-BR")
+
+        assert text == "openai: a.wav"
+        assert time.monotonic() - started < 0.5
+        assert engine.route_outcomes()[-1].hedged
+        assert engine.wins == {"openai": 1}
+
+    def test_hedge_delay_follows_primary_p95(self):
+        primary = FakeEngine("groq", delay=0.01)
+        engine = RoutedEngine(primary, default_hedge_delay_seconds=5.0)
+
+        assert engine.hedge_delay_seconds() == 5.0
+        for _ in range(10):
+            engine.transcribe("a.wav", "pt-BR")
+
+        assert 0.01 <= engine.hedge_delay_seconds() < 1.0
+
+    def test_failed_primary_falls_back_and_opens_circuit(self):
+        primary = FakeEngine("groq", fail=True)
+        fallback = FakeEngine("faster-whisper")
+        engine = RoutedEngine(primary, fallback=fallback, failure_threshold=2)
+
+        for _ in range(4):
+            assert engine.transcribe("a.wav", "pt-BR") == "faster-whisper: a.wav"
+
+        # The circuit opened after two failures; later requests skip the API
+        assert primary.calls == 2
+        assert all(outcome.fell_back for outcome in engine.route_outcomes())
+        assert engine.wins == {"faster-whisper": 4}
+
+    def test_stalled_primary_times_out_to_fallback(self):
+        primary = FakeEngine("groq", delay=1.0)
+        fallback = FakeEngine("faster-whisper")
+        engine = RoutedEngine(
+            primary,
+            fallback=fallback,
+            default_hedge_delay_seconds=0.01,
+            timeout_seconds=0.1,
+        )
+
+        assert engine.transcribe("a.wav", "pt-BR") == "faster-whisper: a.wav"
+
+    def test_raises_when_every_engine_fails(self):
+        engine = RoutedEngine(FakeEngine("groq", fail=True))
+
+        with pytest.raises(TranscriptionError, match="groq failed"):
+            engine.transcribe("a.wav", "pt-BR")
+
+    def test_capabilities_fit_every_engine(self):
+        primary = FakeEngine(
+            "groq", capabilities=EngineCapabilities(max_upload_bytes=25 * 1024**2)
+        )
+        fallback = FakeEngine(
+            "local",
+            capabilities=EngineCapabilities(
+                preferred_chunk_seconds=1200, max_duration_seconds=600, runs_locally=True
+            ),
+        )
+        capabilities = RoutedEngine(primary, fallback=fallback).capabilities
+
+        assert capabilities.max_upload_bytes == 25 * 1024**2
+        assert capabilities.max_duration_seconds == 600
+        assert capabilities.preferred_chunk_seconds == 480
+        assert not capabilities.runs_locally
+
+    def test_capabilities_keep_primary_execution_model(self):
+        primary = FakeEngine(
+            "local", capabilities=EngineCapabilities(runs_locally=True, batch_size=8)
+        )
+        capabilities = RoutedEngine(primary, fallback=FakeEngine("groq")).capabilities
+
+        assert capabilities.runs_locally
+        assert capabilities.batch_size == 8
+
+    def test_pickles_for_chunk_worker_processes(self):
+        engine = RoutedEngine(FakeEngine("local"), fallback=FakeEngine("groq"))
+        engine.transcribe("a.wav", "pt-BR")
+
+        copy = pickle.loads(pickle.dumps(engine))
+
+        assert copy.transcribe("b.wav", "pt-BR") == "local: b.wav"
+        assert copy.wins == {"local": 2}
+
+    def test_pickles_with_a_local_primary_and_api_fallback(self):
+        limiter = RateLimiter(requests_per_minute=60, audio_seconds_per_hour=3600)
+        asyncio.run(limiter.acquire(1.0))
+        api = AsyncAPIEngine(
+            name="groq",
+            base_url="http://127.0.0.1:9/v1",
+            api_key="test-key",
+            model="whisper-large-v3",
+            rate_limiter=limiter,
+        )
+        groq = GroqEngine(api_key="test-key")
+        groq._get_client()
+        api.warm_up()
+        api._get_client()
+        primary = FakeEngine(
+            "local", capabilities=EngineCapabilities(runs_locally=True)
+        )
+        engine = RoutedEngine(primary, hedge=groq, fallback=api)
+        try:
+            copy = pickle.loads(pickle.dumps(engine.for_quality_tier(None)))
+        finally:
+            engine.close()
+
+        assert copy.transcribe("a.wav", "pt-BR") == "local: a.wav"
+        copy.close()
+
+    def test_tier_view_records_its_own_outcomes(self):
+        primary, fallback = FakeEngine("groq", fail=True), FakeEngine("local")
+        engine = RoutedEngine(primary, fallback=fallback, failure_threshold=1)
+        first, second = engine.for_quality_tier(None), engine.for_quality_tier(None)
+
+        first.transcribe("a.wav", "pt-BR")
+        second.transcribe("b.wav", "pt-BR")
+
+        # The breaker opened through the first view and is shared by the second
+        assert primary.calls == 1
+        assert [o.engine_name for o in first.route_outcomes()] == ["local"]
+        assert len(second.route_outcomes()) == 1
+        assert engine.route_outcomes() == []
+        assert engine.wins == {"local": 2}
+
+    def test_tier_views_share_pool_locks_and_circuit_state(self):
+        engine = RoutedEngine(FakeEngine("groq"), fallback=FakeEngine("local"))
+        first, second = engine.for_quality_tier(None), engine.for_quality_tier(None)
+
+        for view in (first, second):
+            assert view._pool is engine._pool
+            assert view._wins_lock is engine._wins_lock
+            assert view.wins is engine.wins
+            assert view._breakers is engine._breakers
+            assert view._latencies is engine._latencies
+        assert first._outcome_lock is not second._outcome_lock
+
+    def test_tier_view_delegates_to_each_engine(self):
+        tiered = FakeEngine("local-large")
+        local = FakeEngine("local")
+        local.for_quality_tier = lambda tier: tiered
+        engine = RoutedEngine(FakeEngine("groq", fail=True), fallback=local)
+
+        view = engine.for_quality_tier(QualityTier.ACCURATE)
+
+        assert view.transcribe("a.wav", "pt-BR") == "local-large: a.wav"
+
+    def test_close_closes_every_engine(self):
+        primary, fallback = FakeEngine("groq"), FakeEngine("local")
+        RoutedEngine(primary, hedge=primary, fallback=fallback).close()
+
+        assert primary.closed and fallback.closed
+
+
+class TestCircuitBreaker:
+    def test_half_opens_after_reset_period(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=lambda: now[0])
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        now[0] = 30.0
+        assert breaker.allow()  # one trial request
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        now[0] = 60.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert not breaker.is_open
+
+    def test_half_open_admits_a_single_probe(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=lambda: now[0])
+        breaker.record_failure()
+
+        now[0] = 30.0
+        assert breaker.allow()
+        assert not breaker.allow()  # concurrent callers wait for the probe
+
+        breaker.record_success()
+        assert breaker.allow() and breaker.allow()
@@ -0,0 +1,117 @@
+"""Equivalence tests: NumPy silence detection vs pydub.silence."""
+
+import random
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+from pydub.generators import Sine, WhiteNoise
+from pydub.silence import detect_nonsilent as pydub_detect_nonsilent
+from pydub.silence import detect_silence as pydub_detect_silence
+
+from app.adapters.outbound.converter.silence import (
+    detect_nonsilent,
+    detect_silence,
+    pcm_to_array,
+)
+
+
+def _speech_like(pattern: list[tuple[str, int]], frame_rate: int = 16000) -> AudioSegment:
+    """Build audio from ("tone" | "noise" | "quiet" | "silence", ms) pieces."""
+    audio = AudioSegment.silent(duration=0, frame_rate=frame_rate)
+    for kind, ms in pattern:
+        if kind == "tone":
+            piece = Sine(220, sample_rate=frame_rate).to_audio_segment(duration=ms, volume=-12)
+        elif kind == "noise":
+            piece = WhiteNoise(sample_rate=frame_rate).to_audio_segment(duration=ms, volume=-30)
+        elif kind == "quiet":
+            piece = Sine(440, sample_rate=frame_rate).to_audio_segment(duration=ms, volume=-45)
+        else:
+            piece = AudioSegment.silent(duration=ms, frame_rate=frame_rate)
+        audio += piece.set_sample_width(2).set_channels(1)
+    return audio
+
+
+def _numpy_args(audio: AudioSegment):
+    return (
+        pcm_to_array(audio.raw_data, audio.sample_width),
+        audio.frame_rate,
+    )
+
+
+PATTERNS = [
+    [("tone", 1200), ("silence", 800), ("tone", 600), ("silence", 300), ("tone", 900)],
+    [("silence", 700), ("noise", 1500), ("quiet", 900), ("tone", 400), ("silence", 650)],
+    [("tone", 2000)],
+    [("silence", 2000)],
+    [("silence", 300)],
+    [("tone", 50), ("silence", 520), ("tone", 50), ("silence", 480), ("tone", 50)],
+]
+
+
+class TestSilenceEquivalence:
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    @pytest.mark.parametrize("min_silence_ms", [100, 500])
+    @pytest.mark.parametrize("silence_thresh_db", [-40.0, -25.0])
+    def test_nonsilent_matches_pydub(self, pattern, min_silence_ms, silence_thresh_db):
+        audio = _speech_like(pattern)
+
+        expected = pydub_detect_nonsilent(
+            audio, min_silence_len=min_silence_ms, silence_thresh=silence_thresh_db
+        )
+        actual = detect_nonsilent(
+            *_numpy_args(audio),
+            min_silence_ms=min_silence_ms,
+            silence_thresh_db=silence_thresh_db,
+        )
+
+        assert actual == [tuple(r) for r in expected]
+
+    @pytest.mark.parametrize("seek_step_ms", [1, 7, 10])
+    def test_silence_matches_pydub_with_seek_step(self, seek_step_ms):
+        audio = _speech_like(PATTERNS[1])
+
+        expected = pydub_detect_silence(
+            audio, min_silence_len=300, silence_thresh=-40, seek_step=seek_step_ms
+        )
+        actual = detect_silence(
+            *_numpy_args(audio),
+            min_silence_ms=300,
+            silence_thresh_db=-40.0,
+            seek_step_ms=seek_step_ms,
+        )
+
+        assert actual == [tuple(r) for r in expected]
+
+    def test_stereo_44k_matches_pydub(self):
+        audio = _speech_like(PATTERNS[0], frame_rate=44100).set_channels(2)
+
+        expected = pydub_detect_nonsilent(audio, min_silence_len=250, silence_thresh=-40)
+        actual = detect_nonsilent(
+            *_numpy_args(audio), channels=2, min_silence_ms=250, silence_thresh_db=-40.0
+        )
+
+        assert actual == [tuple(r) for r in expected]
+
+    def test_random_envelopes_match_pydub(self):
+        rng = random.Random(1234)
+        kinds = ["tone", "noise", "quiet", "silence"]
+        for _ in range(5):
+            pattern = [(rng.choice(kinds), rng.randint(30, 900)) for _ in range(8)]
+            audio = _speech_like(pattern)
+
+            expected = pydub_detect_nonsilent(audio, min_silence_len=200, silence_thresh=-40)
+            actual = detect_nonsilent(*_numpy_args(audio), min_silence_ms=200)
+
+            assert actual == [tuple(r) for r in expected]
+
+    def test_pcm_to_array_rejects_24_bit(self):
+        with pytest.raises(ValueError):
+            pcm_to_array(b"\x00" * 6, 3)
+
+    def test_pcm_to_array_is_zero_copy(self):
+        raw = np.arange(10, dtype=np.int16).tobytes()
+        view = pcm_to_array(raw, 2)
+        assert not view.flags.owndata
+        assert view.tolist() == list(range(10))
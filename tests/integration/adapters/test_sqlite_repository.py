@@ -1,3 +1,5 @@
+import sqlite3
+
 import pytest
 from uuid import uuid4
 from datetime import datetime, timezone
@@ -8,6 +10,8 @@ from app.domain.entities.transcription_job import TranscriptionJob
 from app.domain.entities.transcription_result import TranscriptionResult
 from app.domain.value_objects.audio_format import AudioFormat
 from app.domain.value_objects.job_status import JobStatus
+from app.domain.value_objects.quality_tier import QualityTier
+from app.domain.value_objects.transcript_segment import TimedWord, TranscriptSegment
 
 
 @pytest.fixture
@@ -25,6 +29,7 @@ def _make_audio_file(**overrides) -> AudioFile:
         upload_timestamp=datetime.now(timezone.utc),
         duration_seconds=12.5,
         converted_path=None,
+        content_hash="9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
     )
     defaults.update(overrides)
     return AudioFile(**defaults)
@@ -74,6 +79,7 @@ class TestSQLiteJobRepository:
         assert retrieved.storage_path == audio_file.storage_path
         assert retrieved.duration_seconds == audio_file.duration_seconds
         assert retrieved.converted_path == audio_file.converted_path
+        assert retrieved.content_hash == audio_file.content_hash
 
     def test_save_and_get_job(self, repo):
         audio_file = _make_audio_file()
@@ -91,6 +97,59 @@ class TestSQLiteJobRepository:
         assert retrieved.engine_name == job.engine_name
         assert retrieved.progress_percent == job.progress_percent
         assert retrieved.retry_count == job.retry_count
+        assert retrieved.conversion_skipped is False
+
+    def test_conversion_skipped_round_trip(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+
+        job = _make_job(audio_file_id=audio_file.id, conversion_skipped=True)
+        repo.save_job(job)
+
+        assert repo.get_job(job.id).conversion_skipped is True
+
+    def test_quality_tier_round_trip(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+
+        job = _make_job(audio_file_id=audio_file.id, quality_tier=QualityTier.FAST)
+        repo.save_job(job)
+
+        assert repo.get_job(job.id).quality_tier == QualityTier.FAST
+
+    def test_migrates_jobs_table_without_new_columns(self, tmp_path):
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE transcription_jobs (
+                id TEXT PRIMARY KEY,
+                audio_file_id TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'PENDING',
+                progress_percent INTEGER NOT NULL DEFAULT 0,
+                language TEXT NOT NULL DEFAULT 'pt-BR',
+                engine_name TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                error_message TEXT,
+                retry_count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        job_id = uuid4()
+        now = datetime.now(timezone.utc).isoformat()
+        conn.execute(
+            "INSERT INTO transcription_jobs (id, audio_file_id, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?)",
+            (str(job_id), str(uuid4()), now, now),
+        )
+        conn.commit()
+        conn.close()
+
+        repo = SQLiteJobRepository(db_path=db_path)
+
+        assert repo.get_job(job_id).conversion_skipped is False
+        assert repo.get_job(job_id).quality_tier is None
 
     def test_update_job_status(self, repo):
         audio_file = _make_audio_file()
@@ -126,6 +185,149 @@ class TestSQLiteJobRepository:
         assert retrieved.processing_duration_seconds == pytest.approx(
             result.processing_duration_seconds
         )
+        assert retrieved.engine_latency_seconds is None
+
+    def test_result_keeps_engine_latency(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+        job = _make_job(audio_file_id=audio_file.id)
+        repo.save_job(job)
+
+        repo.save_result(_make_result(job_id=job.id, engine_latency_seconds=1.25))
+
+        assert repo.get_result_for_job(job.id).engine_latency_seconds == 1.25
+
+    def test_raise_progress_only_raises_while_transcribing(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+        job = _make_job(
+            audio_file_id=audio_file.id, status=JobStatus.TRANSCRIBING, progress_percent=50
+        )
+        repo.save_job(job)
+
+        repo.raise_progress(job.id, 80)
+        repo.raise_progress(job.id, 65)
+        assert repo.get_job(job.id).progress_percent == 80
+
+        job.status = JobStatus.COMPLETED
+        job.progress_percent = 100
+        repo.save_job(job)
+        repo.raise_progress(job.id, 95)
+        retrieved = repo.get_job(job.id)
+        assert (retrieved.status, retrieved.progress_percent) == (JobStatus.COMPLETED, 100)
+
+    def test_chunk_results_round_trip(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+        job = _make_job(audio_file_id=audio_file.id)
+        repo.save_job(job)
+        segments = [
+            TranscriptSegment(
+                0, 900, "Olá mundo",
+                words=(TimedWord(0, 400, "Olá"), TimedWord(450, 900, "mundo")),
+            ),
+            TranscriptSegment(1_000, 1_500, "sem palavras"),
+        ]
+
+        repo.save_chunk_result(job.id, 0, "hash0", segments)
+        repo.save_chunk_result(job.id, 1, "hash1", [])
+
+        assert repo.get_chunk_results(job.id) == {
+            (0, "hash0"): segments,
+            (1, "hash1"): [],
+        }
+        assert repo.get_chunk_results(uuid4()) == {}
+
+        repo.delete_chunk_results(job.id)
+        assert repo.get_chunk_results(job.id) == {}
+
+    def test_chunk_plan_round_trip(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+        job = _make_job(audio_file_id=audio_file.id)
+        repo.save_job(job)
+
+        assert repo.get_chunk_plan(job.id) is None
+        repo.save_chunk_plan(job.id, [(0, 600_000), (600_000, 900_000)])
+        assert repo.get_chunk_plan(job.id) == [(0, 600_000), (600_000, 900_000)]
+
+        repo.delete_chunk_results(job.id)
+        assert repo.get_chunk_plan(job.id) is None
+
+    def test_delete_all_jobs_removes_chunk_results(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+        job = _make_job(audio_file_id=audio_file.id)
+        repo.save_job(job)
+        repo.save_chunk_result(job.id, 0, "hash0", [TranscriptSegment(0, 1, "a")])
+
+        assert repo.delete_all_jobs() == 1
+        assert repo.get_chunk_results(job.id) == {}
+
+    def test_partial_segments_appended_in_order(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+        job = _make_job(audio_file_id=audio_file.id)
+        repo.save_job(job)
+
+        repo.save_partial_segments(job.id, [TranscriptSegment(0, 1_000, "Olá")])
+        repo.save_partial_segments(
+            job.id,
+            [TranscriptSegment(1_000, 2_000, "mundo"), TranscriptSegment(2_000, 3_000, "!")],
+        )
+
+        partials = repo.get_partial_segments(job.id)
+        assert [segment.text for _, _, segment in partials] == ["Olá", "mundo", "!"]
+        first_sequence = partials[0][0]
+        assert [
+            segment for _, _, segment in repo.get_partial_segments(job.id, first_sequence)
+        ] == [TranscriptSegment(1_000, 2_000, "mundo"), TranscriptSegment(2_000, 3_000, "!")]
+        assert repo.get_partial_segments(uuid4()) == []
+
+        repo.delete_partial_segments(job.id)
+        assert repo.get_partial_segments(job.id) == []
+
+    def test_partial_segments_record_their_attempt(self, repo):
+        audio_file = _make_audio_file()
+        repo.create_audio_file(audio_file)
+        job = _make_job(audio_file_id=audio_file.id)
+        repo.save_job(job)
+
+        repo.save_partial_segments(job.id, [TranscriptSegment(0, 1_000, "Olá")])
+        repo.save_partial_segments(
+            job.id, [TranscriptSegment(0, 1_000, "Olá!")], attempt=1
+        )
+
+        assert [
+            (attempt, segment.text)
+            for _, attempt, segment in repo.get_partial_segments(job.id)
+        ] == [(0, "Olá"), (1, "Olá!")]
+
+    def test_result_cache_round_trip(self, repo):
+        result = _make_result(full_text="Cached text")
+        repo.save_cached_result("key", result, max_entries=10)
+
+        cached = repo.get_cached_result("key")
+        assert cached.job_id == result.job_id
+        assert cached.full_text == "Cached text"
+        assert cached.engine_name == "whisper"
+        assert repo.get_cached_result("other") is None
+
+    def test_result_cache_evicts_least_recently_used(self, repo):
+        repo.save_cached_result("a", _make_result(), max_entries=2)
+        repo.save_cached_result("b", _make_result(), max_entries=2)
+        repo.get_cached_result("a")
+        repo.save_cached_result("c", _make_result(), max_entries=2)
+
+        assert repo.get_cached_result("a") is not None
+        assert repo.get_cached_result("b") is None
+        assert repo.get_cached_result("c") is not None
+
+    def test_delete_all_jobs_clears_result_cache(self, repo):
+        repo.save_cached_result("key", _make_result(), max_entries=10)
+
+        repo.delete_all_jobs()
+        assert repo.get_cached_result("key") is None
 
     def test_get_jobs_by_status(self, repo):
         audio_file = _make_audio_file()
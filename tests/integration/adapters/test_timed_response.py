@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.adapters.outbound.engines.timed_response import (
+    segments_from_verbose,
+    whole_audio_segment,
+)
+from app.domain.value_objects.transcript_segment import TimedWord
+from app.ports.audio_chunk import AudioChunk
+
+
+class TestSegmentsFromVerbose:
+    def test_words_attached_to_their_segments(self):
+        response = {
+            "text": "Olá mundo. Tudo bem?",
+            "segments": [
+                {"start": 0.0, "end": 1.2, "text": " Olá mundo."},
+                {"start": 1.5, "end": 2.6, "text": " Tudo bem?"},
+            ],
+            "words": [
+                {"word": "Olá", "start": 0.0, "end": 0.5},
+                {"word": "mundo.", "start": 0.6, "end": 1.2},
+                {"word": "Tudo", "start": 1.5, "end": 1.9},
+                {"word": "bem?", "start": 2.0, "end": 2.6},
+            ],
+        }
+
+        segments = segments_from_verbose(response)
+
+        assert [s.text for s in segments] == ["Olá mundo.", "Tudo bem?"]
+        assert segments[0].words == (
+            TimedWord(0, 500, "Olá"),
+            TimedWord(600, 1200, "mundo."),
+        )
+        assert [w.text for w in segments[1].words] == ["Tudo", "bem?"]
+
+    def test_sdk_objects_without_words(self):
+        response = SimpleNamespace(
+            text="Oi",
+            segments=[SimpleNamespace(start=0.25, end=1.0, text="Oi")],
+            words=None,
+        )
+
+        segments = segments_from_verbose(response)
+
+        assert len(segments) == 1
+        assert (segments[0].start_ms, segments[0].end_ms) == (250, 1000)
+        assert segments[0].words == ()
+
+
+class TestWholeAudioSegment:
+    def test_spans_chunk_duration(self):
+        chunk = AudioChunk(np.zeros(32000, dtype=np.int16), 16000)
+
+        [segment] = whole_audio_segment(chunk, "texto")
+
+        assert (segment.start_ms, segment.end_ms, segment.text) == (0, 2000, "texto")
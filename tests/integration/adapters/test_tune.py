@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from app.adapters.inbound import tune as tune_command
+from app.adapters.inbound.tune import (
+    Candidate,
+    candidate_grid,
+    default_thread_counts,
+    tune,
+    write_profile,
+)
+from app.config import Settings
+
+
+class TestTune:
+    def test_default_thread_counts_share_cores_between_processes(self):
+        assert default_thread_counts(32) == [1, 2, 4, 8, 16, 32]
+        assert default_thread_counts(32, processes=3) == [1, 2, 4, 8, 10]
+        assert default_thread_counts(2, processes=4) == [1]
+
+    def test_grid_respects_thread_budget(self):
+        grid = candidate_grid(["int8"], [4, 8, 16], [1, 2], [5], thread_budget=16)
+
+        assert {(c.cpu_threads, c.num_workers) for c in grid} == {
+            (4, 1), (8, 1), (16, 1), (4, 2), (8, 2)
+        }
+
+    def test_picks_lowest_real_time_factor_and_skips_failures(self):
+        candidates = [
+            Candidate("int8", 8, 1, 5),
+            Candidate("float16", 8, 1, 5),
+            Candidate("int8", 16, 1, 5),
+        ]
+        rtfs = {candidates[0]: 0.30, candidates[2]: 0.18}
+
+        def measure(candidate):
+            if candidate.compute_type == "float16":
+                raise ValueError("float16 is not supported on this device")
+            return rtfs[candidate]
+
+        assert tune(candidates, measure) == (candidates[2], 0.18)
+
+    def test_nothing_measurable_raises(self):
+        def measure(candidate):
+            raise ValueError("unsupported")
+
+        with pytest.raises(RuntimeError):
+            tune([Candidate("int8", 8, 1, 5)], measure)
+
+
+class TestProfileSettings:
+    @pytest.fixture
+    def profile_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "profile.json"
+        monkeypatch.setenv("FASTER_WHISPER_PROFILE", str(path))
+        for name in ("DEVICE", "COMPUTE_TYPE", "CPU_THREADS", "NUM_WORKERS", "BEAM_SIZE"):
+            monkeypatch.delenv(f"FASTER_WHISPER_{name}", raising=False)
+        return path
+
+    def test_settings_load_written_profile(self, profile_path):
+        write_profile(
+            str(profile_path), Candidate("int8_float32", 16, 2, 1), 0.2, device="cpu"
+        )
+
+        settings = Settings()
+
+        assert json.loads(profile_path.read_text())["real_time_factor"] == 0.2
+        assert settings.faster_whisper_device == "cpu"
+        assert settings.faster_whisper_compute_type == "int8_float32"
+        assert settings.faster_whisper_cpu_threads == 16
+        assert settings.faster_whisper_num_workers == 2
+        assert settings.faster_whisper_beam_size == 1
+
+    def test_environment_overrides_profile(self, profile_path, monkeypatch):
+        write_profile(str(profile_path), Candidate("int8", 16, 1, 5), 0.2)
+        monkeypatch.setenv("FASTER_WHISPER_CPU_THREADS", "4")
+
+        assert Settings().faster_whisper_cpu_threads == 4
+
+    def test_device_written_only_when_passed(
+        self, profile_path, tmp_path, monkeypatch
+    ):
+        clip = tmp_path / "clip.wav"
+        clip.write_bytes(b"")
+        measured_devices = []
+
+        def measurer(model_size, device, clip, language):
+            measured_devices.append(device)
+            return lambda candidate: 0.2
+
+        monkeypatch.setattr(tune_command, "_load_clip", lambda path: None)
+        monkeypatch.setattr(tune_command, "_measurer", measurer)
+        args = [str(clip), "--num-workers", "1", "--threads", "1"]
+
+        assert tune_command.main([*args, "--output", str(profile_path)]) == 0
+        assert "device" not in json.loads(profile_path.read_text())
+        assert Settings().faster_whisper_device == "auto"
+
+        assert tune_command.main(
+            [*args, "--device", "cuda", "--output", str(profile_path)]
+        ) == 0
+        assert Settings().faster_whisper_device == "cuda"
+        assert measured_devices == ["cpu", "cuda"]
+
+    def test_defaults_without_profile(self, profile_path):
+        settings = Settings()
+
+        assert settings.faster_whisper_device == "auto"
+        assert settings.faster_whisper_compute_type == "int8"
+        assert settings.faster_whisper_cpu_threads == 0
+        assert settings.faster_whisper_beam_size == 5
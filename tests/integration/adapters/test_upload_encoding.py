@@ -0,0 +1,59 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from app.adapters.outbound.engines import audio_input
+from app.adapters.outbound.engines.audio_input import encode_for_upload
+from app.adapters.outbound.engines.groq_engine import GroqEngine
+from app.adapters.outbound.engines.openai_engine import OpenAIEngine
+from app.ports.audio_chunk import AudioChunk, EncodedAudio
+
+needs_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg binary not available"
+)
+
+
+def _speech_like_chunk(seconds=5.0):
+    t = np.arange(int(seconds * 16000)) / 16000
+    tone = 0.3 * np.sin(2 * np.pi * 220 * t) * (1 + np.sin(2 * np.pi * 3 * t)) / 2
+    return AudioChunk((tone * 32767).astype(np.int16), 16000, start_ms=60_000, index=2)
+
+
+class TestUploadEncoding:
+    def test_wav_by_default(self):
+        encoded = encode_for_upload(_speech_like_chunk())
+
+        assert isinstance(encoded, EncodedAudio)
+        assert encoded.name.endswith(".wav")
+        assert encoded.data[:4] == b"RIFF"
+
+    def test_paths_left_as_is(self):
+        assert encode_for_upload("/data/audio.mp3", "flac") == "/data/audio.mp3"
+
+    def test_falls_back_to_wav_without_ffmpeg(self, monkeypatch):
+        monkeypatch.setattr(audio_input, "FFMPEG_PATH", "/nonexistent/ffmpeg")
+
+        encoded = encode_for_upload(_speech_like_chunk(), "opus")
+
+        assert encoded.name.endswith(".wav")
+        assert encoded.data[:4] == b"RIFF"
+
+    @needs_ffmpeg
+    @pytest.mark.parametrize(
+        "encoding, extension, magic",
+        [("flac", "flac", b"fLaC"), ("opus", "ogg", b"OggS"), ("mp3", "mp3", b"")],
+    )
+    def test_compressed_encodings_are_smaller(self, encoding, extension, magic):
+        chunk = _speech_like_chunk()
+
+        encoded = encode_for_upload(chunk, encoding)
+
+        assert encoded.name == f"chunk_002_60000-65000ms.{extension}"
+        assert encoded.data.startswith(magic)
+        assert 0 < encoded.size_bytes < chunk.wav_size_bytes
+        assert (encoded.duration_ms, encoded.start_ms, encoded.index) == (5000, 60_000, 2)
+
+    def test_codec_chosen_per_engine(self):
+        assert OpenAIEngine(api_key="x").capabilities.preferred_encoding == "opus"
+        assert GroqEngine(api_key="x").capabilities.preferred_encoding == "flac"
@@ -0,0 +1,307 @@
+import os
+import signal
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.application.chunk_executor import ChunkExecutor, prefetch
+from app.domain.exceptions import TranscriptionError
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.transcript_segment import TranscriptSegment
+from app.ports.audio_chunk import AudioChunk
+from app.ports.transcription_engine import TranscriptionEnginePort
+
+
+class FakeEngine(TranscriptionEnginePort):
+    """Echoes the chunk index; optionally fails the first attempts per chunk."""
+
+    def __init__(self, local=False, failures=None, delay=0.0, batch_size=1):
+        self.local = local
+        self.batch_size = batch_size
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.calls: list[int] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, language):
+        raise NotImplementedError
+
+    def prepare(self, audio):
+        return audio
+
+    def transcribe_segments(self, audio, language):
+        with self._lock:
+            self.calls.append(audio.index)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            failing = self.failures.get(audio.index, 0) > 0
+            if failing:
+                self.failures[audio.index] -= 1
+        try:
+            # Later chunks finish first, to prove results are reordered
+            time.sleep(self.delay / (audio.index + 1))
+            if failing:
+                raise TranscriptionError(f"chunk {audio.index} failed")
+            return [TranscriptSegment(0, 100, f"chunk {audio.index}")]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    @property
+    def engine_name(self):
+        return "fake"
+
+    @property
+    def capabilities(self):
+        return EngineCapabilities(runs_locally=self.local, batch_size=self.batch_size)
+
+
+class DyingEngine(FakeEngine):
+    """Its worker process is killed, as by the OOM killer, on chunk 1."""
+
+    def transcribe_segments(self, audio, language):
+        if audio.index == 1:
+            os.kill(os.getpid(), signal.SIGKILL)
+        return super().transcribe_segments(audio, language)
+
+
+def _chunks(count):
+    return [
+        AudioChunk(np.zeros(1600, dtype=np.int16), 16000, start_ms=i * 100, index=i)
+        for i in range(count)
+    ]
+
+
+def _texts(results):
+    return [segments[0].text for segments in results]
+
+
+class TestChunkExecutor:
+    def test_api_engine_runs_chunks_concurrently_in_order(self):
+        engine = FakeEngine(delay=0.05)
+        executor = ChunkExecutor(api_workers=4, retry_backoff_seconds=0)
+
+        results = executor.transcribe_all(engine, _chunks(8), "pt-BR")
+
+        assert _texts(results) == [f"chunk {i}" for i in range(8)]
+        assert 1 < engine.peak <= 4
+
+    def test_single_worker_runs_inline(self):
+        engine = FakeEngine()
+        executor = ChunkExecutor(api_workers=1)
+
+        executor.transcribe_all(engine, _chunks(3), "pt-BR")
+
+        assert engine.calls == [0, 1, 2]
+        assert engine.peak == 1
+
+    def test_failed_chunk_retried_in_isolation(self):
+        engine = FakeEngine(failures={2: 2})
+        executor = ChunkExecutor(api_workers=3, max_retries=2, retry_backoff_seconds=0)
+
+        results = executor.transcribe_all(engine, _chunks(4), "pt-BR")
+
+        assert _texts(results) == [f"chunk {i}" for i in range(4)]
+        assert sorted(engine.calls) == [0, 1, 2, 2, 2, 3]
+
+    def test_chunk_failing_every_retry_raises(self):
+        engine = FakeEngine(failures={1: 10})
+        executor = ChunkExecutor(api_workers=2, max_retries=1, retry_backoff_seconds=0)
+
+        with pytest.raises(TranscriptionError, match="chunk 1"):
+            executor.transcribe_all(engine, _chunks(3), "pt-BR")
+
+    def test_results_reported_in_order_up_to_failure(self):
+        engine = FakeEngine(failures={2: 10}, delay=0.02)
+        executor = ChunkExecutor(api_workers=3, max_retries=0, retry_backoff_seconds=0)
+        reported = []
+
+        with pytest.raises(TranscriptionError):
+            executor.transcribe_all(
+                engine,
+                _chunks(4),
+                "pt-BR",
+                on_result=lambda position, segments: reported.append(
+                    (position, segments[0].text)
+                ),
+            )
+
+        assert reported == [(0, "chunk 0"), (1, "chunk 1")]
+
+    def test_local_engine_uses_process_pool(self):
+        engine = FakeEngine(local=True)
+        executor = ChunkExecutor(local_workers=2, retry_backoff_seconds=0)
+        try:
+            results = executor.transcribe_all(engine, _chunks(4), "pt-BR")
+        finally:
+            executor.shutdown()
+
+        assert _texts(results) == [f"chunk {i}" for i in range(4)]
+        # The work happened in other processes, not on this engine instance
+        assert engine.calls == []
+
+    @pytest.mark.parametrize("local, workers", [(False, 1), (False, 3), (True, 2)])
+    def test_segments_streamed_before_chunk_result(self, local, workers):
+        engine = FakeEngine(local=local)
+        executor = ChunkExecutor(
+            api_workers=workers, local_workers=workers, retry_backoff_seconds=0
+        )
+        streamed = []
+        lock = threading.Lock()
+
+        def on_segment(position, segment):
+            with lock:
+                streamed.append((position, segment.text))
+
+        def on_result(position, segments):
+            # Every segment of the chunk was handed over first
+            assert (position, segments[0].text) in streamed
+
+        try:
+            executor.transcribe_all(
+                engine, _chunks(4), "pt-BR", on_result=on_result, on_segment=on_segment
+            )
+        finally:
+            executor.shutdown()
+
+        assert sorted(streamed) == [(i, f"chunk {i}") for i in range(4)]
+
+    def test_retry_does_not_repeat_streamed_segments(self):
+        class FlakyStream(FakeEngine):
+            def transcribe_stream(self, audio, language):
+                yield TranscriptSegment(0, 100, "first")
+                with self._lock:
+                    self.calls.append(audio.index)
+                    failing = len(self.calls) == 1
+                if failing:
+                    raise TranscriptionError("dropped")
+                yield TranscriptSegment(100, 200, "second")
+
+        streamed = []
+        ChunkExecutor(api_workers=1, retry_backoff_seconds=0).transcribe_all(
+            FlakyStream(),
+            _chunks(1),
+            "pt-BR",
+            on_segment=lambda position, segment: streamed.append(segment.text),
+        )
+
+        assert streamed == ["first", "second"]
+
+    def test_killed_worker_fails_job_and_pool_is_rebuilt(self):
+        executor = ChunkExecutor(local_workers=2, retry_backoff_seconds=0)
+        try:
+            with pytest.raises(TranscriptionError, match="worker process died"):
+                executor.transcribe_all(DyingEngine(local=True), _chunks(3), "pt-BR")
+
+            results = executor.transcribe_all(
+                FakeEngine(local=True), _chunks(3), "pt-BR"
+            )
+        finally:
+            executor.shutdown()
+
+        assert _texts(results) == [f"chunk {i}" for i in range(3)]
+
+    def test_process_pool_kept_for_another_instance_of_the_same_model(self):
+        executor = ChunkExecutor(local_workers=2, retry_backoff_seconds=0)
+        try:
+            executor.transcribe_all(FakeEngine(local=True), _chunks(2), "pt-BR")
+            pool = executor._process_pool
+            executor.transcribe_all(FakeEngine(local=True), _chunks(2), "pt-BR")
+
+            assert executor._process_pool is pool
+        finally:
+            executor.shutdown()
+
+    def test_batching_engine_shared_across_threads(self):
+        engine = FakeEngine(local=True, batch_size=3, delay=0.05)
+        executor = ChunkExecutor(local_workers=1, retry_backoff_seconds=0)
+
+        results = executor.transcribe_all(engine, _chunks(6), "pt-BR")
+
+        assert _texts(results) == [f"chunk {i}" for i in range(6)]
+        # Chunks reach the one in-process engine together, up to batch_size
+        assert sorted(engine.calls) == list(range(6))
+        assert 1 < engine.peak <= 3
+
+
+class PreparingEngine(FakeEngine):
+    """Records which thread prepares each chunk and how many are alive."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prepare_threads: set[str] = set()
+        self.alive = 0
+        self.peak_alive = 0
+
+    def prepare(self, audio):
+        with self._lock:
+            self.prepare_threads.add(threading.current_thread().name)
+            self.alive += 1
+            self.peak_alive = max(self.peak_alive, self.alive)
+        return audio.encode_wav()
+
+    def transcribe_segments(self, audio, language):
+        try:
+            time.sleep(0.01)
+            return [TranscriptSegment(0, 100, f"chunk {audio.index}")]
+        finally:
+            with self._lock:
+                self.alive -= 1
+
+
+class TestChunkPipeline:
+    def test_prepare_runs_ahead_on_producer_thread(self):
+        engine = PreparingEngine()
+        executor = ChunkExecutor(api_workers=1, prefetch=2)
+
+        results = executor.transcribe_all(engine, iter(_chunks(10)), "pt-BR")
+
+        assert _texts(results) == [f"chunk {i}" for i in range(10)]
+        assert engine.prepare_threads == {"chunk-prefetch"}
+        # queued + being prepared + being transcribed
+        assert engine.peak_alive <= 4
+
+    def test_prepared_chunks_bounded_with_workers(self):
+        engine = PreparingEngine()
+        executor = ChunkExecutor(api_workers=3, prefetch=2)
+
+        executor.transcribe_all(engine, iter(_chunks(20)), "pt-BR")
+
+        # in flight + queued + being prepared
+        assert engine.peak_alive <= 3 + 2 + 1
+
+    def test_prefetch_stays_bounded_ahead_of_consumer(self):
+        produced = []
+
+        def items():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        iterator = prefetch(items(), depth=2)
+        assert next(iterator) == 0
+        time.sleep(0.05)
+        # One consumed, two queued, one blocked in put
+        assert len(produced) <= 4
+        iterator.close()
+
+    def test_prefetch_reraises_producer_errors(self):
+        def items():
+            yield 1
+            raise ValueError("cut failed")
+
+        with pytest.raises(ValueError, match="cut failed"):
+            list(prefetch(items(), depth=2))
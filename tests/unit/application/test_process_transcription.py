@@ -5,9 +5,19 @@ from uuid import uuid4
 from app.application.process_transcription import ProcessTranscriptionUseCase
 from app.domain.entities.audio_file import AudioFile
 from app.domain.entities.transcription_job import TranscriptionJob
+from app.domain.services.result_cache import result_cache_key
 from app.domain.value_objects.audio_format import AudioFormat
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
 from app.domain.value_objects.job_status import JobStatus
+from app.domain.value_objects.quality_tier import QualityTier
+from app.domain.value_objects.route_outcome import RouteOutcome
+from app.domain.value_objects.transcript_segment import (
+    TimedWord,
+    TranscriptSegment,
+)
 from app.domain.exceptions import TranscriptionError
+from app.ports.audio_chunk import EncodedAudio
+from app.ports.transcription_engine import TranscriptionEnginePort
 
 
 @pytest.fixture
@@ -47,6 +57,8 @@ def mock_repository(transcription_job, audio_file):
     repo = MagicMock()
     repo.get_job.return_value = transcription_job
     repo.get_audio_file.return_value = audio_file
+    repo.get_chunk_results.return_value = {}
+    repo.get_chunk_plan.return_value = None
     return repo
 
 
@@ -61,14 +73,27 @@ def mock_storage():
 def mock_converter():
     converter = MagicMock()
     converter.convert_to_wav.return_value = True
+    converter.is_normalized.return_value = False
     converter.get_duration_seconds.return_value = 120.5
+    session = converter.open_session.return_value.__enter__.return_value
+    session.duration_seconds = 120.5
     return converter
 
 
 @pytest.fixture
 def mock_engine():
     engine = MagicMock()
-    engine.transcribe.return_value = "Transcribed text content"
+    engine.transcribe_segments.return_value = [
+        TranscriptSegment(start_ms=0, end_ms=1_000, text="Transcribed text content")
+    ]
+    # Like the port's default: stream whatever transcribe_segments returns
+    engine.transcribe_stream.side_effect = lambda audio, language: iter(
+        engine.transcribe_segments(audio, language)
+    )
+    engine.prepare.side_effect = lambda audio: audio
+    engine.capabilities = EngineCapabilities()
+    engine.for_quality_tier.return_value = engine
+    engine.route_outcomes.return_value = None
     return engine
 
 
@@ -101,8 +126,11 @@ class TestProcessHappyPath:
         # converter.convert_to_wav was called
         mock_converter.convert_to_wav.assert_called_once()
 
-        # engine.transcribe was called
-        mock_engine.transcribe.assert_called_once()
+        # engine.transcribe_stream was called with the session's samples, not a path
+        session = mock_converter.open_session.return_value.__enter__.return_value
+        mock_engine.transcribe_stream.assert_called_once_with(
+            session.full_view.return_value, "pt-BR"
+        )
 
         # repository.save_result was called
         mock_repository.save_result.assert_called_once()
@@ -144,7 +172,9 @@ class TestProcessEngineFailureRetries:
         mock_repository.get_audio_file.return_value = audio
 
         engine = MagicMock()
-        engine.transcribe.side_effect = TranscriptionError("Engine crashed")
+        engine.transcribe_stream.side_effect = TranscriptionError("Engine crashed")
+        engine.capabilities = EngineCapabilities()
+        engine.for_quality_tier.return_value = engine
 
         # Capture job status snapshots at each save_job call, because the same
         # mutable job object is passed every time and its state keeps changing.
@@ -165,7 +195,7 @@ class TestProcessEngineFailureRetries:
         use_case.execute(job_id)
 
         # The engine was called and raised TranscriptionError
-        engine.transcribe.assert_called_once()
+        engine.transcribe_stream.assert_called_once()
 
         # save_result should NOT have been called since transcription failed
         mock_repository.save_result.assert_not_called()
@@ -188,3 +218,682 @@ class TestProcessEngineFailureRetries:
         assert last_status == JobStatus.PENDING
         assert last_retry == 1
         assert last_error is None
+        # The retry resumes from the checkpoints
+        mock_repository.delete_chunk_results.assert_not_called()
+
+    def test_exhausted_retries_clear_checkpoints(
+        self, use_case, mock_repository, mock_engine, transcription_job, job_id
+    ):
+        transcription_job.retry_count = 3
+        mock_engine.transcribe_stream.side_effect = TranscriptionError("Engine crashed")
+
+        use_case.execute(job_id)
+
+        assert transcription_job.status == JobStatus.FAILED
+        mock_repository.delete_chunk_results.assert_called_once_with(job_id)
+        assert mock_repository.delete_partial_segments.call_args_list[-1] == call(job_id)
+
+
+class TestProcessDecodesOnce:
+    def test_long_file_reuses_single_session(
+        self,
+        use_case,
+        mock_converter,
+        mock_engine,
+        job_id,
+    ):
+        session = mock_converter.open_session.return_value.__enter__.return_value
+        session.duration_seconds = 25 * 60.0
+        session.detect_silence_boundaries.return_value = [
+            (0, 600_000),
+            (601_000, 1_200_000),
+            (1_201_000, 1_500_000),
+        ]
+        session.chunk_views.return_value = [MagicMock(), MagicMock()]
+
+        use_case.execute(job_id)
+
+        # The converted WAV is decoded exactly once for the whole job
+        mock_converter.open_session.assert_called_once()
+        mock_converter.get_duration_seconds.assert_not_called()
+        mock_converter.detect_silence_boundaries.assert_not_called()
+        mock_converter.split_at_boundaries.assert_not_called()
+        session.detect_silence_boundaries.assert_called_once()
+        session.chunk_views.assert_called_once()
+        assert mock_engine.transcribe_segments.call_count == 2
+        transcribed = [
+            c.args[0] for c in mock_engine.transcribe_segments.call_args_list
+        ]
+        assert transcribed == session.chunk_views.return_value
+
+        # The session is released at the end of the job
+        mock_converter.open_session.return_value.__exit__.assert_called_once()
+
+
+class TestProcessEncodesUploads:
+    def test_short_job_uploads_engine_encoding(
+        self, mock_repository, mock_storage, mock_converter, job_id
+    ):
+        class FlacAPIEngine(TranscriptionEnginePort):
+            uploaded = None
+
+            def transcribe(self, audio, language):
+                raise NotImplementedError
+
+            def prepare(self, audio):
+                return EncodedAudio(b"fLaC", "audio.flac", 1_000)
+
+            def transcribe_segments(self, audio, language):
+                self.uploaded = audio
+                return [TranscriptSegment(0, 1_000, "olá")]
+
+            @property
+            def engine_name(self):
+                return "groq"
+
+            @property
+            def capabilities(self):
+                return EngineCapabilities(
+                    max_upload_bytes=25 * 1024**2, preferred_encoding="flac"
+                )
+
+        engine = FlacAPIEngine()
+        use_case = ProcessTranscriptionUseCase(
+            repository=mock_repository,
+            storage=mock_storage,
+            converter=mock_converter,
+            engine=engine,
+        )
+
+        use_case.execute(job_id)
+
+        # A file too short to chunk is still sent compressed
+        assert engine.uploaded.name == "audio.flac"
+        assert mock_repository.save_result.call_args[0][0].full_text == "olá"
+
+
+class TestProcessSkipsConversion:
+    def test_normalized_input_is_used_as_is(
+        self, use_case, mock_repository, mock_converter, audio_file, job_id
+    ):
+        mock_converter.is_normalized.return_value = True
+
+        use_case.execute(job_id)
+
+        mock_converter.convert_to_wav.assert_not_called()
+        mock_converter.open_session.assert_called_once_with(
+            f"/data/{audio_file.storage_path}"
+        )
+        assert audio_file.converted_path == audio_file.storage_path
+        saved_job = mock_repository.save_job.call_args_list[-1][0][0]
+        assert saved_job.conversion_skipped is True
+        assert saved_job.status == JobStatus.COMPLETED
+
+    def test_other_input_is_converted(
+        self, use_case, mock_repository, mock_converter, job_id
+    ):
+        use_case.execute(job_id)
+
+        mock_converter.convert_to_wav.assert_called_once()
+        saved_job = mock_repository.save_job.call_args_list[-1][0][0]
+        assert saved_job.conversion_skipped is False
+
+
+class TestProcessConversionCache:
+    @pytest.fixture
+    def mock_cache(self):
+        cache = MagicMock()
+        cache.fetch.return_value = False
+        return cache
+
+    @pytest.fixture
+    def cached_use_case(
+        self, mock_repository, mock_storage, mock_converter, mock_engine, mock_cache
+    ):
+        return ProcessTranscriptionUseCase(
+            repository=mock_repository,
+            storage=mock_storage,
+            converter=mock_converter,
+            engine=mock_engine,
+            conversion_cache=mock_cache,
+        )
+
+    def test_hit_skips_conversion(
+        self, cached_use_case, mock_cache, mock_converter, audio_file, job_id
+    ):
+        audio_file.content_hash = "abc123"
+        mock_cache.fetch.return_value = True
+
+        cached_use_case.execute(job_id)
+
+        mock_cache.fetch.assert_called_once()
+        assert mock_cache.fetch.call_args[0][:3] == ("abc123", 16000, 1)
+        mock_converter.convert_to_wav.assert_not_called()
+        mock_cache.store.assert_not_called()
+
+    def test_miss_converts_and_stores(
+        self, cached_use_case, mock_cache, mock_converter, audio_file, job_id
+    ):
+        audio_file.content_hash = "abc123"
+
+        cached_use_case.execute(job_id)
+
+        mock_converter.convert_to_wav.assert_called_once()
+        output_path = mock_converter.convert_to_wav.call_args[0][1]
+        mock_cache.store.assert_called_once_with("abc123", 16000, 1, output_path)
+
+    def test_unhashed_audio_bypasses_cache(
+        self, cached_use_case, mock_cache, mock_converter, job_id
+    ):
+        cached_use_case.execute(job_id)
+
+        mock_cache.fetch.assert_not_called()
+        mock_cache.store.assert_not_called()
+        mock_converter.convert_to_wav.assert_called_once()
+
+
+class TestProcessPlansChunksPerEngine:
+    @pytest.fixture
+    def session(self, mock_converter):
+        session = mock_converter.open_session.return_value.__enter__.return_value
+        session.duration_seconds = 15 * 60.0
+        # One pause per minute
+        session.detect_silence_boundaries.return_value = [
+            (i * 60_000, (i + 1) * 60_000 - 1_000) for i in range(15)
+        ]
+        return session
+
+    def test_local_engine_takes_long_file_whole(
+        self, use_case, mock_engine, session, job_id
+    ):
+        mock_engine.capabilities = EngineCapabilities(preferred_chunk_seconds=20 * 60)
+
+        use_case.execute(job_id)
+
+        session.chunk_views.assert_not_called()
+        mock_engine.transcribe_stream.assert_called_once()
+
+    def test_upload_limit_shrinks_chunks(self, use_case, mock_engine, session, job_id):
+        # 4 MB of 16 kHz PCM16 is a little over 2 minutes per request
+        mock_engine.capabilities = EngineCapabilities(max_upload_bytes=4 * 1024 * 1024)
+
+        use_case.execute(job_id)
+
+        boundaries = session.chunk_views.call_args[0][0]
+        assert len(boundaries) >= 8
+        for start, end in boundaries:
+            assert 44 + (end - start) * 32 <= 4 * 1024 * 1024
+
+
+class TestProcessResolvesQualityTier:
+    def test_job_runs_on_engine_for_its_tier(
+        self, use_case, mock_engine, transcription_job, mock_converter, job_id
+    ):
+        transcription_job.quality_tier = QualityTier.FAST
+        tier_engine = MagicMock()
+        tier_engine.transcribe_stream.return_value = iter(
+            [TranscriptSegment(start_ms=0, end_ms=1_000, text="Fast model text")]
+        )
+        tier_engine.prepare.side_effect = lambda audio: audio
+        tier_engine.capabilities = EngineCapabilities()
+        mock_engine.for_quality_tier.return_value = tier_engine
+
+        use_case.execute(job_id)
+
+        mock_engine.for_quality_tier.assert_called_once_with(QualityTier.FAST)
+        session = mock_converter.open_session.return_value.__enter__.return_value
+        tier_engine.transcribe_stream.assert_called_once_with(
+            session.full_view.return_value, "pt-BR"
+        )
+        mock_engine.transcribe_stream.assert_not_called()
+        assert transcription_job.status == JobStatus.COMPLETED
+
+
+class TestProcessStitchesByTime:
+    def test_overlap_words_kept_once(
+        self, use_case, mock_converter, mock_engine, mock_repository, job_id
+    ):
+        session = mock_converter.open_session.return_value.__enter__.return_value
+        session.duration_seconds = 12 * 60.0
+        session.detect_silence_boundaries.return_value = [
+            (0, 359_800),
+            (360_000, 720_000),
+        ]
+        session.chunk_views.return_value = [MagicMock(), MagicMock()]
+        # The chunks share 359.5s-360.3s of audio, so both hear "fim de";
+        # chunk 2 starts at 359.5s and reports times relative to that.
+        mock_engine.transcribe_segments.side_effect = [
+            [
+                TranscriptSegment(
+                    0, 360_300, "Olá. Fim de",
+                    words=(
+                        TimedWord(0, 500, "Olá."),
+                        TimedWord(359_600, 359_750, "Fim"),
+                        TimedWord(360_000, 360_200, "de"),
+                    ),
+                )
+            ],
+            [
+                TranscriptSegment(
+                    0, 2_000, "fim, de começo",
+                    words=(
+                        TimedWord(100, 250, "fim,"),
+                        TimedWord(500, 700, "de"),
+                        TimedWord(1_000, 1_400, "começo"),
+                    ),
+                )
+            ],
+        ]
+
+        use_case.execute(job_id)
+
+        result = mock_repository.save_result.call_args[0][0]
+        assert result.full_text == "Olá. Fim de começo"
+
+
+class TestProcessResumesFromCheckpoints:
+    @pytest.fixture
+    def session(self, mock_converter):
+        session = mock_converter.open_session.return_value.__enter__.return_value
+        session.duration_seconds = 25 * 60.0
+        session.detect_silence_boundaries.return_value = [
+            (0, 600_000),
+            (601_000, 1_200_000),
+            (1_201_000, 1_500_000),
+        ]
+        chunks = [MagicMock(), MagicMock(), MagicMock()]
+        for index, chunk in enumerate(chunks):
+            chunk.content_hash.return_value = f"hash{index}"
+        session.chunk_views.return_value = chunks
+        return session
+
+    def test_each_chunk_checkpointed(
+        self, use_case, mock_repository, session, job_id
+    ):
+        use_case.execute(job_id)
+
+        saved = [c.args[:3] for c in mock_repository.save_chunk_result.call_args_list]
+        assert saved == [(job_id, 0, "hash0"), (job_id, 1, "hash1"), (job_id, 2, "hash2")]
+        mock_repository.delete_chunk_results.assert_called_once_with(job_id)
+
+    def test_only_missing_chunks_transcribed(
+        self, use_case, mock_repository, mock_engine, session, job_id
+    ):
+        mock_repository.get_chunk_results.return_value = {
+            (0, "hash0"): [TranscriptSegment(0, 1_000, "primeiro")],
+            # Same index but different audio: the plan changed, so redo it
+            (1, "stale"): [TranscriptSegment(0, 1_000, "velho")],
+        }
+        mock_engine.transcribe_segments.side_effect = [
+            [TranscriptSegment(0, 1_000, "segundo")],
+            [TranscriptSegment(0, 1_000, "terceiro")],
+        ]
+
+        use_case.execute(job_id)
+
+        chunks = session.chunk_views.return_value
+        transcribed = [
+            c.args[0] for c in mock_engine.transcribe_segments.call_args_list
+        ]
+        assert transcribed == chunks[1:]
+        result = mock_repository.save_result.call_args[0][0]
+        assert result.full_text == "primeiro segundo terceiro"
+
+    def test_resume_republishes_checkpointed_chunks_first(
+        self, use_case, mock_repository, mock_engine, session, job_id
+    ):
+        mock_repository.get_chunk_results.return_value = {
+            (0, "hash0"): [TranscriptSegment(0, 1_000, "primeiro")],
+        }
+        mock_engine.transcribe_segments.side_effect = [
+            [TranscriptSegment(5_000, 6_000, "segundo")],
+            [TranscriptSegment(5_000, 6_000, "terceiro")],
+        ]
+
+        use_case.execute(job_id)
+
+        published = [
+            [segment.text for segment in c.args[1]]
+            for c in mock_repository.save_partial_segments.call_args_list
+        ]
+        assert published == [["primeiro"], ["segundo"], ["terceiro"]]
+
+    def test_failed_chunk_keeps_earlier_checkpoints(
+        self, use_case, mock_repository, mock_engine, session, job_id
+    ):
+        mock_engine.transcribe_segments.side_effect = [
+            [TranscriptSegment(0, 1_000, "primeiro")],
+            TranscriptionError("API down"),
+        ]
+
+        use_case.execute(job_id)
+
+        saved = [c.args[1] for c in mock_repository.save_chunk_result.call_args_list]
+        assert saved == [0]
+        mock_repository.delete_chunk_results.assert_not_called()
+
+
+class TestProcessDistributesChunks:
+    @pytest.fixture
+    def session(self, mock_converter, audio_file):
+        audio_file.converted_path = "uploads/test_converted.wav"
+        session = mock_converter.open_session.return_value.__enter__.return_value
+        session.duration_seconds = 25 * 60.0
+        session.detect_silence_boundaries.return_value = [
+            (0, 600_000),
+            (601_000, 1_200_000),
+            (1_201_000, 1_500_000),
+        ]
+        chunks = [MagicMock(), MagicMock(), MagicMock()]
+        for index, chunk in enumerate(chunks):
+            chunk.content_hash.return_value = f"hash{index}"
+        session.chunk_views.return_value = chunks
+        return session
+
+    @pytest.fixture
+    def mock_queue(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def distributed_use_case(
+        self, mock_repository, mock_storage, mock_converter, mock_engine, mock_queue
+    ):
+        return ProcessTranscriptionUseCase(
+            repository=mock_repository,
+            storage=mock_storage,
+            converter=mock_converter,
+            engine=mock_engine,
+            chunk_queue=mock_queue,
+        )
+
+    def test_long_file_fanned_out_to_sub_jobs(
+        self,
+        distributed_use_case,
+        mock_queue,
+        mock_engine,
+        mock_repository,
+        session,
+        job_id,
+    ):
+        distributed_use_case.execute(job_id)
+
+        mock_queue.enqueue_chunks.assert_called_once_with(job_id, 3)
+        [(_, cores)] = [c.args for c in mock_repository.save_chunk_plan.call_args_list]
+        assert len(cores) == 3
+        mock_engine.transcribe_segments.assert_not_called()
+        mock_repository.save_result.assert_not_called()
+        saved_job = mock_repository.save_job.call_args_list[-1][0][0]
+        assert saved_job.status == JobStatus.TRANSCRIBING
+
+    def test_sub_jobs_and_reducer_read_the_stored_plan(
+        self, distributed_use_case, mock_repository, mock_engine, session, job_id
+    ):
+        mock_repository.get_chunk_plan.return_value = [
+            (0, 600_000),
+            (600_000, 1_200_000),
+            (1_200_000, 1_500_000),
+        ]
+
+        distributed_use_case.transcribe_chunk(job_id, 2)
+        distributed_use_case.reduce(job_id)
+
+        # Neither re-scans the file for silences nor replans it
+        session.detect_silence_boundaries.assert_not_called()
+        boundaries = session.chunk_views.call_args[0][0]
+        assert boundaries[0][0] == 0 and boundaries[-1][1] == 1_500_000
+
+    def test_short_file_not_distributed(
+        self, distributed_use_case, mock_queue, mock_engine, job_id
+    ):
+        distributed_use_case.execute(job_id)
+
+        mock_queue.enqueue_chunks.assert_not_called()
+        mock_engine.transcribe_stream.assert_called_once()
+
+    def test_sub_job_checkpoints_its_chunk_and_reports_progress(
+        self,
+        distributed_use_case,
+        mock_repository,
+        mock_engine,
+        transcription_job,
+        session,
+        job_id,
+    ):
+        transcription_job.status = JobStatus.TRANSCRIBING
+        segments = [TranscriptSegment(0, 1_000, "segundo")]
+        mock_engine.transcribe_segments.return_value = segments
+        mock_repository.get_chunk_results.side_effect = [
+            {(0, "hash0"): []},
+            {(0, "hash0"): [], (1, "hash1"): segments},
+        ]
+
+        distributed_use_case.transcribe_chunk(job_id, 1)
+
+        chunks = session.chunk_views.return_value
+        mock_engine.transcribe_segments.assert_called_once_with(chunks[1], "pt-BR")
+        mock_repository.save_chunk_result.assert_called_once_with(
+            job_id, 1, "hash1", segments
+        )
+        # Two of three chunks done: 50% + 45% * 2/3
+        mock_repository.raise_progress.assert_called_once_with(job_id, 80)
+        mock_repository.save_job.assert_not_called()
+
+    def test_sub_job_skips_checkpointed_chunk(
+        self, distributed_use_case, mock_repository, mock_engine, session, job_id
+    ):
+        mock_repository.get_chunk_results.return_value = {(1, "hash1"): []}
+
+        distributed_use_case.transcribe_chunk(job_id, 1)
+
+        mock_engine.transcribe_segments.assert_not_called()
+        mock_repository.save_chunk_result.assert_not_called()
+
+    def test_reducer_fills_gaps_stitches_and_completes(
+        self,
+        distributed_use_case,
+        mock_repository,
+        mock_engine,
+        transcription_job,
+        session,
+        job_id,
+    ):
+        transcription_job.status = JobStatus.TRANSCRIBING
+        mock_repository.get_chunk_results.return_value = {
+            (0, "hash0"): [TranscriptSegment(0, 1_000, "primeiro")],
+            (2, "hash2"): [TranscriptSegment(0, 1_000, "terceiro")],
+        }
+        # Chunk 1's sub-job failed; the reducer transcribes it
+        mock_engine.transcribe_segments.return_value = [
+            TranscriptSegment(0, 1_000, "segundo")
+        ]
+
+        distributed_use_case.reduce(job_id)
+
+        chunks = session.chunk_views.return_value
+        mock_engine.transcribe_segments.assert_called_once_with(chunks[1], "pt-BR")
+        result = mock_repository.save_result.call_args[0][0]
+        assert result.full_text == "primeiro segundo terceiro"
+        assert transcription_job.status == JobStatus.COMPLETED
+        mock_repository.delete_chunk_results.assert_called_once_with(job_id)
+        # The sub-jobs published their own chunks already
+        published = [
+            segment.text
+            for c in mock_repository.save_partial_segments.call_args_list
+            for segment in c.args[1]
+        ]
+        assert published == ["segundo"]
+
+
+class TestProcessRouteOutcomes:
+    def test_result_names_the_engine_that_answered(
+        self, use_case, mock_repository, mock_engine, transcription_job, job_id
+    ):
+        mock_engine.route_outcomes.return_value = [
+            RouteOutcome("faster-whisper", 2.5, fell_back=True)
+        ]
+
+        use_case.execute(job_id)
+
+        result = mock_repository.save_result.call_args[0][0]
+        assert result.engine_name == "faster-whisper"
+        assert result.engine_latency_seconds == 2.5
+        assert transcription_job.engine_name == "faster-whisper"
+
+    def test_unknown_outcomes_keep_submitted_engine(
+        self, use_case, mock_repository, mock_engine, transcription_job, job_id
+    ):
+        # A routed engine that recorded fewer answers than requests made
+        mock_engine.route_outcomes.return_value = []
+
+        use_case.execute(job_id)
+
+        result = mock_repository.save_result.call_args[0][0]
+        assert result.engine_name == "whisper"
+        assert result.engine_latency_seconds is None
+
+
+class TestProcessResultCache:
+    def test_completed_result_is_cached(
+        self,
+        mock_repository,
+        mock_storage,
+        mock_converter,
+        mock_engine,
+        audio_file,
+        job_id,
+    ):
+        audio_file.content_hash = "abc123"
+        mock_engine.engine_name = "whisper"
+        mock_engine.decoding_parameters = {"model": "small"}
+        use_case = ProcessTranscriptionUseCase(
+            repository=mock_repository,
+            storage=mock_storage,
+            converter=mock_converter,
+            engine=mock_engine,
+            result_cache_max_entries=5,
+        )
+
+        use_case.execute(job_id)
+
+        cache_key, result, max_entries = (
+            mock_repository.save_cached_result.call_args[0]
+        )
+        assert cache_key == result_cache_key("abc123", "pt-BR", "whisper", {"model": "small"})
+        assert result == mock_repository.save_result.call_args[0][0]
+        assert max_entries == 5
+
+    def test_fallback_result_cached_under_fallback_engine(
+        self,
+        mock_repository,
+        mock_storage,
+        mock_converter,
+        mock_engine,
+        audio_file,
+        job_id,
+    ):
+        audio_file.content_hash = "abc123"
+        mock_engine.engine_name = "groq"
+        mock_engine.decoding_parameters = {"model": "whisper-large-v3"}
+        mock_engine.route_outcomes.return_value = [
+            RouteOutcome(
+                "faster-whisper",
+                4.0,
+                fell_back=True,
+                decoding_parameters={"model": "small"},
+            )
+        ]
+        use_case = ProcessTranscriptionUseCase(
+            repository=mock_repository,
+            storage=mock_storage,
+            converter=mock_converter,
+            engine=mock_engine,
+            result_cache_max_entries=5,
+        )
+
+        use_case.execute(job_id)
+
+        cache_key = mock_repository.save_cached_result.call_args[0][0]
+        assert cache_key == result_cache_key(
+            "abc123", "pt-BR", "faster-whisper", {"model": "small"}
+        )
+
+    def test_unknown_answering_engine_not_cached(
+        self,
+        mock_repository,
+        mock_storage,
+        mock_converter,
+        mock_engine,
+        audio_file,
+        job_id,
+    ):
+        audio_file.content_hash = "abc123"
+        mock_engine.route_outcomes.return_value = []
+        use_case = ProcessTranscriptionUseCase(
+            repository=mock_repository,
+            storage=mock_storage,
+            converter=mock_converter,
+            engine=mock_engine,
+            result_cache_max_entries=5,
+        )
+
+        use_case.execute(job_id)
+
+        mock_repository.save_result.assert_called_once()
+        mock_repository.save_cached_result.assert_not_called()
+
+    def test_disabled_by_default(self, use_case, mock_repository, job_id):
+        use_case.execute(job_id)
+
+        mock_repository.save_cached_result.assert_not_called()
+
+
+class TestProcessPublishesPartials:
+    def test_segments_published_as_engine_yields_them(
+        self, use_case, mock_repository, mock_engine, job_id
+    ):
+        first = TranscriptSegment(start_ms=0, end_ms=1_000, text="Olá")
+        second = TranscriptSegment(start_ms=1_000, end_ms=2_000, text="mundo")
+
+        def stream(audio, language):
+            yield first
+            # The first segment is visible before the second is decoded
+            assert mock_repository.save_partial_segments.call_args_list == [
+                call(job_id, [first], attempt=0)
+            ]
+            yield second
+
+        mock_engine.transcribe_stream.side_effect = stream
+
+        use_case.execute(job_id)
+
+        assert mock_repository.save_partial_segments.call_args_list == [
+            call(job_id, [first], attempt=0),
+            call(job_id, [second], attempt=0),
+        ]
+        result = mock_repository.save_result.call_args[0][0]
+        assert result.full_text == "Olá mundo"
+        # A fresh attempt clears old partials; completion drops them
+        assert mock_repository.delete_partial_segments.call_args_list == [
+            call(job_id),
+            call(job_id),
+        ]
+
+    def test_retried_job_tags_partials_with_its_attempt(
+        self, use_case, mock_repository, transcription_job, job_id
+    ):
+        transcription_job.retry_count = 2
+
+        use_case.execute(job_id)
+
+        assert mock_repository.save_partial_segments.call_args.kwargs == {
+            "attempt": 2
+        }
+
+    def test_publish_failure_does_not_fail_job(
+        self, use_case, mock_repository, transcription_job, job_id
+    ):
+        mock_repository.save_partial_segments.side_effect = RuntimeError("locked")
+
+        use_case.execute(job_id)
+
+        assert transcription_job.status == JobStatus.COMPLETED
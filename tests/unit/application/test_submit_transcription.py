@@ -1,9 +1,16 @@
+import hashlib
+
 import pytest
 from unittest.mock import MagicMock
+from uuid import uuid4
 
 from app.application.submit_transcription import SubmitTranscriptionUseCase
 from app.application.dto import SubmitTranscriptionRequest
-from app.domain.exceptions import InvalidAudioFormatError, FileTooLargeError
+from app.domain.entities.transcription_result import TranscriptionResult
+from app.domain.exceptions import AudioProbeError, InvalidAudioFormatError, FileTooLargeError
+from app.domain.value_objects.audio_metadata import AudioMetadata
+from app.domain.value_objects.job_status import JobStatus
+from app.domain.value_objects.quality_tier import QualityTier
 
 
 @pytest.fixture
@@ -46,8 +53,10 @@ class TestSubmitValidFile:
         # Assert storage.store was called with the filename and data
         mock_storage.store.assert_called_once_with("test.mp3", b"fake_audio")
 
-        # Assert repository.create_audio_file was called
+        # Assert repository.create_audio_file was called with the content hash
         mock_repository.create_audio_file.assert_called_once()
+        audio_file = mock_repository.create_audio_file.call_args[0][0]
+        assert audio_file.content_hash == hashlib.sha256(b"fake_audio").hexdigest()
 
         # Assert repository.save_job was called
         mock_repository.save_job.assert_called_once()
@@ -60,6 +69,18 @@ class TestSubmitValidFile:
         assert response.status == "PENDING"
         assert response.redirect_url.startswith("/jobs/")
 
+    def test_quality_tier_recorded_on_job(self, use_case, mock_repository):
+        request = SubmitTranscriptionRequest(
+            filename="test.mp3",
+            file_data=b"fake_audio",
+            quality_tier=QualityTier.ACCURATE,
+        )
+
+        use_case.execute(request)
+
+        job = mock_repository.save_job.call_args[0][0]
+        assert job.quality_tier == QualityTier.ACCURATE
+
 
 class TestSubmitInvalidFormat:
     def test_submit_invalid_format(self, use_case):
@@ -83,3 +104,134 @@ class TestSubmitFileTooLarge:
 
         with pytest.raises(FileTooLargeError):
             use_case.execute(request)
+
+
+class TestSubmitProbesUpload:
+    def test_probe_records_duration(self, mock_storage, mock_repository, mock_queue):
+        converter = MagicMock()
+        converter.probe.return_value = AudioMetadata(
+            duration_seconds=42.0, sample_rate=44100, channels=2, codec="mp3"
+        )
+        use_case = SubmitTranscriptionUseCase(
+            storage=mock_storage,
+            repository=mock_repository,
+            queue=mock_queue,
+            engine_name="whisper",
+            converter=converter,
+        )
+
+        use_case.execute(
+            SubmitTranscriptionRequest(filename="test.mp3", file_data=b"fake_audio")
+        )
+
+        converter.probe.assert_called_once()
+        audio_file = mock_repository.create_audio_file.call_args[0][0]
+        assert audio_file.duration_seconds == 42.0
+
+    def test_unreadable_audio_rejected_and_deleted(
+        self, mock_storage, mock_repository, mock_queue
+    ):
+        converter = MagicMock()
+        converter.probe.side_effect = AudioProbeError("no audio stream")
+        use_case = SubmitTranscriptionUseCase(
+            storage=mock_storage,
+            repository=mock_repository,
+            queue=mock_queue,
+            engine_name="whisper",
+            converter=converter,
+        )
+
+        with pytest.raises(InvalidAudioFormatError):
+            use_case.execute(
+                SubmitTranscriptionRequest(filename="test.mp3", file_data=b"fake_audio")
+            )
+
+        mock_storage.delete.assert_called_once_with("uploads/test.mp3")
+        mock_queue.enqueue.assert_not_called()
+
+
+class TestSubmitResultCache:
+    @pytest.fixture
+    def mock_engine(self):
+        engine = MagicMock()
+        engine.engine_name = "whisper"
+        engine.decoding_parameters = {"model": "small"}
+        engine.for_quality_tier.return_value = engine
+        return engine
+
+    @pytest.fixture
+    def use_case(self, mock_storage, mock_repository, mock_queue, mock_engine):
+        return SubmitTranscriptionUseCase(
+            storage=mock_storage,
+            repository=mock_repository,
+            queue=mock_queue,
+            engine_name="whisper",
+            engine=mock_engine,
+        )
+
+    def test_hit_completes_job_without_queueing(
+        self, use_case, mock_repository, mock_queue
+    ):
+        cached = TranscriptionResult(
+            job_id=uuid4(),
+            full_text="Cached text",
+            language="pt-BR",
+            engine_name="whisper",
+            processing_duration_seconds=42.0,
+        )
+        mock_repository.get_cached_result.return_value = cached
+
+        response = use_case.execute(
+            SubmitTranscriptionRequest(filename="test.mp3", file_data=b"fake_audio")
+        )
+
+        assert response.status == "COMPLETED"
+        mock_queue.enqueue.assert_not_called()
+        result = mock_repository.save_result.call_args[0][0]
+        assert result.job_id == response.job_id
+        assert result.full_text == "Cached text"
+        assert result.id != cached.id
+        job = mock_repository.save_job.call_args[0][0]
+        assert job.status == JobStatus.COMPLETED
+        assert job.progress_percent == 100
+
+    def test_hit_names_the_engine_that_made_the_transcript(
+        self, use_case, mock_repository
+    ):
+        mock_repository.get_cached_result.return_value = TranscriptionResult(
+            job_id=uuid4(),
+            full_text="Cached text",
+            language="pt-BR",
+            engine_name="faster-whisper",
+            processing_duration_seconds=42.0,
+        )
+
+        use_case.execute(
+            SubmitTranscriptionRequest(filename="test.mp3", file_data=b"fake_audio")
+        )
+
+        job = mock_repository.save_job.call_args[0][0]
+        result = mock_repository.save_result.call_args[0][0]
+        assert job.engine_name == result.engine_name == "faster-whisper"
+
+    def test_miss_is_queued(self, use_case, mock_repository, mock_queue):
+        mock_repository.get_cached_result.return_value = None
+
+        response = use_case.execute(
+            SubmitTranscriptionRequest(filename="test.mp3", file_data=b"fake_audio")
+        )
+
+        assert response.status == "PENDING"
+        mock_queue.enqueue.assert_called_once_with(response.job_id)
+        mock_repository.save_result.assert_not_called()
+
+    def test_key_depends_on_model(self, use_case, mock_repository, mock_engine):
+        mock_repository.get_cached_result.return_value = None
+        request = SubmitTranscriptionRequest(filename="test.mp3", file_data=b"fake_audio")
+
+        use_case.execute(request)
+        mock_engine.decoding_parameters = {"model": "large-v3"}
+        use_case.execute(request)
+
+        first, second = mock_repository.get_cached_result.call_args_list
+        assert first != second
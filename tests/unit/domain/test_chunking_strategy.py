@@ -1,15 +1,33 @@
 """Unit tests for chunking strategy service."""
 
+import random
+
+import pytest
+
 from app.domain.services.chunking_strategy import (
     CHUNK_DURATION_MAX_MS,
     CHUNK_DURATION_MIN_MS,
+    CHUNK_DURATION_TARGET_MS,
     LONG_FILE_THRESHOLD_MS,
     OVERLAP_MS,
+    ChunkBudget,
     add_overlap,
+    chunk_budget,
     compute_chunk_boundaries,
     needs_chunking,
+    owned_segments,
+    plan_chunk_boundaries,
+    split_oversized,
+    stitch_segments,
     stitch_transcriptions,
 )
+from app.domain.exceptions import EngineLimitsError
+from app.domain.value_objects.engine_capabilities import EngineCapabilities
+from app.domain.value_objects.transcript_segment import (
+    ChunkTranscript,
+    TimedWord,
+    TranscriptSegment,
+)
 
 
 class TestNeedsChunking:
@@ -66,6 +84,129 @@ class TestComputeChunkBoundaries:
         assert result[0][0] == 0
 
 
+def _speech(seed: int, total_ms: int) -> list[tuple[int, int]]:
+    """Random sentence-like segments separated by short and long pauses."""
+    rng = random.Random(seed)
+    segments = []
+    pos = rng.randint(0, 2000)
+    while pos < total_ms:
+        length = rng.randint(2_000, 45_000)
+        segments.append((pos, pos + length))
+        pos += length + rng.choice([300, 400, 600, 1500, 3000])
+    return segments
+
+
+def _short_chunks(chunks: list[tuple[int, int]]) -> int:
+    return sum(1 for start, end in chunks if end - start < CHUNK_DURATION_MIN_MS)
+
+
+class TestPlanChunkBoundaries:
+    def test_empty_boundaries_returns_full_range(self):
+        assert plan_chunk_boundaries([], 600_000) == [(0, 600_000)]
+
+    def test_single_segment_returns_as_chunk(self):
+        assert plan_chunk_boundaries([(0, 300_000)], 300_000) == [(0, 300_000)]
+
+    def test_oversized_segment_becomes_own_chunk(self):
+        segments = [(0, 60_000), (61_000, 800_000), (801_000, 900_000)]
+        result = plan_chunk_boundaries(segments, 900_000)
+        assert result == segments
+
+    def test_avoids_tiny_final_chunk(self):
+        # Greedy packs 10 + 10 min and leaves a 1-minute tail
+        segments = [(i * 60_000, (i + 1) * 60_000 - 500) for i in range(21)]
+        greedy = compute_chunk_boundaries(segments, 1_260_000)
+        planned = plan_chunk_boundaries(segments, 1_260_000)
+
+        assert _short_chunks(greedy) == 1
+        assert _short_chunks(planned) == 0
+        assert len(planned) == len(greedy) == 3
+
+    def test_evens_chunks_out_around_target(self):
+        # 25 one-minute segments: three chunks near 8 min, not 10 + 10 + 5
+        segments = [(i * 60_300, i * 60_300 + 60_000) for i in range(25)]
+        result = plan_chunk_boundaries(segments, segments[-1][1])
+
+        assert len(result) == 3
+        assert all(7 * 60_000 <= end - start <= 9.5 * 60_000 for start, end in result)
+
+    def test_prefers_deep_pauses(self):
+        # 18 one-minute segments; only the gap after minute 9 is a long pause
+        segments = []
+        pos = 0
+        for i in range(18):
+            segments.append((pos, pos + 60_000))
+            pos += 60_000 + (3_000 if i == 8 else 300)
+        result = plan_chunk_boundaries(segments, pos)
+
+        assert len(result) == 2
+        assert result[0][1] == segments[8][1]
+
+    def test_respects_max_and_covers_all_speech(self):
+        segments = _speech(seed=7, total_ms=3_600_000)
+        result = plan_chunk_boundaries(segments, segments[-1][1])
+
+        assert result[0][0] == segments[0][0]
+        assert result[-1][1] == segments[-1][1]
+        assert all(end - start <= CHUNK_DURATION_MAX_MS for start, end in result)
+        for (_, prev_end), (next_start, _) in zip(result, result[1:]):
+            assert prev_end < next_start
+
+    def test_fewer_wasted_chunks_than_greedy_on_long_inputs(self):
+        greedy_chunks = planned_chunks = greedy_short = planned_short = 0
+        for seed in range(40):
+            segments = _speech(seed, total_ms=random.Random(seed).randint(15, 120) * 60_000)
+            greedy = compute_chunk_boundaries(segments, segments[-1][1])
+            planned = plan_chunk_boundaries(segments, segments[-1][1])
+
+            assert len(planned) <= len(greedy)
+            greedy_chunks += len(greedy)
+            planned_chunks += len(planned)
+            greedy_short += _short_chunks(greedy)
+            planned_short += _short_chunks(planned)
+
+        assert planned_chunks <= greedy_chunks
+        assert planned_short < greedy_short
+
+
+class TestChunkBudget:
+    def test_default_preference_matches_fixed_bounds(self):
+        assert chunk_budget(EngineCapabilities(), 32_000) == ChunkBudget(
+            target_ms=CHUNK_DURATION_TARGET_MS,
+            min_ms=CHUNK_DURATION_MIN_MS,
+            max_ms=CHUNK_DURATION_MAX_MS,
+        )
+
+    def test_upload_limit_caps_max_including_overlap(self):
+        capabilities = EngineCapabilities(max_upload_bytes=3_200_044)
+        budget = chunk_budget(capabilities, 32_000)
+        assert budget.max_ms == 100_000 - 2 * OVERLAP_MS
+        assert budget.target_ms == budget.max_ms
+        assert budget.min_ms < budget.max_ms
+
+    def test_limits_too_small_for_a_chunk_raise(self):
+        with pytest.raises(EngineLimitsError, match="of audio per chunk"):
+            chunk_budget(EngineCapabilities(max_duration_seconds=1), 32_000)
+        with pytest.raises(EngineLimitsError):
+            chunk_budget(EngineCapabilities(max_upload_bytes=1_000), 32_000)
+
+    def test_duration_limit_caps_max(self):
+        budget = chunk_budget(EngineCapabilities(max_duration_seconds=120), 32_000)
+        assert budget.max_ms == 120_000 - 2 * OVERLAP_MS
+
+    def test_local_preference_allows_longer_chunks(self):
+        budget = chunk_budget(EngineCapabilities(preferred_chunk_seconds=1200), 32_000)
+        assert budget.max_ms > CHUNK_DURATION_MAX_MS
+
+
+class TestSplitOversized:
+    def test_short_chunks_unchanged(self):
+        assert split_oversized([(0, 500), (700, 900)], 1000) == [(0, 500), (700, 900)]
+
+    def test_long_chunk_split_evenly(self):
+        assert split_oversized([(0, 2500)], 1000) == [(0, 833), (833, 1667), (1667, 2500)]
+
+
 class TestAddOverlap:
     def test_single_chunk_unchanged(self):
         boundaries = [(1000, 5000)]
@@ -134,3 +275,99 @@ class TestStitchTranscriptions:
         assert "Part one" in result
         assert "part two" in result
         assert "continues further" in result
+
+    def test_overlap_ignores_punctuation_and_case(self):
+        result = stitch_transcriptions([
+            "Ele disse que voltaria amanhã.",
+            "voltaria, Amanhã e não voltou",
+        ])
+        assert result == "Ele disse que voltaria amanhã. e não voltou"
+
+    def test_long_job_stitches_every_chunk(self):
+        texts = [f"chunk {i} says word{i} and more" for i in range(2_000)]
+        result = stitch_transcriptions(texts)
+        assert result.count("says") == 2_000
+
+
+def _words(*items: tuple[int, int, str]) -> tuple[TimedWord, ...]:
+    return tuple(TimedWord(start, end, text) for start, end, text in items)
+
+
+class TestStitchSegments:
+    def test_empty(self):
+        assert stitch_segments([]) == ""
+
+    def test_single_chunk_keeps_everything(self):
+        chunk = ChunkTranscript(
+            offset_ms=0,
+            core_start_ms=0,
+            core_end_ms=5_000,
+            segments=(
+                TranscriptSegment(
+                    0, 2_000, "Hello there.",
+                    _words((0, 800, " Hello"), (900, 2_000, " there.")),
+                ),
+                TranscriptSegment(2_500, 5_000, "Bye.", _words((2_500, 5_000, " Bye."))),
+            ),
+        )
+        assert stitch_segments([chunk]) == "Hello there. Bye."
+
+    def test_overlap_resolved_by_time(self):
+        # Cores meet at 10s; each chunk also hears 1s of its neighbour
+        first = ChunkTranscript(
+            offset_ms=0,
+            core_start_ms=0,
+            core_end_ms=10_000,
+            segments=(
+                TranscriptSegment(
+                    8_000, 11_000, "we went home",
+                    _words((8_000, 9_000, "we"), (9_200, 9_800, "went"), (10_100, 10_900, "home")),
+                ),
+            ),
+        )
+        second = ChunkTranscript(
+            offset_ms=9_000,
+            core_start_ms=10_000,
+            core_end_ms=20_000,
+            segments=(
+                TranscriptSegment(
+                    0, 3_000, "Went home, finally",
+                    _words((200, 800, "Went"), (1_100, 1_900, "home,"), (2_000, 3_000, "finally")),
+                ),
+            ),
+        )
+        assert stitch_segments([first, second]) == "we went home, finally"
+
+    def test_untimed_chunks_fall_back_to_text_dedup(self):
+        first = ChunkTranscript(0, 0, 10_000, (TranscriptSegment(0, 10_500, "one two three"),))
+        second = ChunkTranscript(9_500, 10_000, 20_000, (TranscriptSegment(0, 10_500, "Three four"),))
+        assert stitch_segments([first, second]) == "one two three four"
+
+
+class TestOwnedSegments:
+    def test_moves_segments_to_file_time_and_drops_overlap(self):
+        cores = [(0, 10_000), (10_000, 20_000), (20_000, 30_000)]
+        # Chunk 1 starts 1 s early and ends 1 s late because of the overlap
+        segments = [
+            TranscriptSegment(0, 800, "overlap before"),
+            TranscriptSegment(1_000, 5_000, "inside"),
+            TranscriptSegment(10_500, 11_500, "overlap after"),
+        ]
+
+        owned = owned_segments(cores, 1, 9_000, segments)
+
+        assert owned == [TranscriptSegment(10_000, 14_000, "inside")]
+
+    def test_first_and_last_chunks_own_the_file_edges(self):
+        segments = [TranscriptSegment(0, 500, "start")]
+
+        assert owned_segments([(0, 10_000)], 0, 0, segments) == segments
+        assert owned_segments([(0, 10_000), (10_000, 20_000)], 0, 0, segments) == segments
+
+    def test_drops_word_timings(self):
+        words = (TimedWord(0, 500, "oi"),)
+        segment = TranscriptSegment(0, 500, "oi", words)
+
+        [owned] = owned_segments([(0, 10_000)], 0, 2_000, [segment])
+        assert owned.words == ()
+        assert owned.start_ms == 2_000